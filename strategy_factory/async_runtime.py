@@ -0,0 +1,57 @@
+"""
+Shared asyncio runtime for calling async clients from synchronous code.
+
+The CLI and the Flask webapp are synchronous. Rather than spinning up a
+new event loop per call (which would also throw away pooled connections),
+coroutines are submitted to one long-lived loop running in a daemon
+thread. Every pipeline in the process shares that loop, so concurrent
+webapp jobs multiplex their API calls over the same connection pool.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide background event loop, starting it if needed.
+
+    Returns:
+        Running event loop owned by a daemon thread.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="strategy-factory-async",
+                daemon=True,
+            )
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run_coroutine(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the background loop and wait for its result.
+
+    Safe to call from any thread except the background loop itself.
+
+    Args:
+        coro: Coroutine to run.
+        timeout: Optional timeout in seconds.
+
+    Returns:
+        The coroutine's result.
+    """
+    loop = get_background_loop()
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    return future.result(timeout=timeout)
@@ -11,10 +11,58 @@ PROJECT_ROOT = Path(__file__).parent.parent
 OUTPUT_DIR = PROJECT_ROOT / "output"
 TLDR_GUIDES_DIR = PROJECT_ROOT / "Consulting Guides TLDR"
 PROGRESS_DIR = PROJECT_ROOT / "progress"
+CACHE_DIR = PROJECT_ROOT / "cache"  # caches shared across companies and runs
 
 # API Configuration
 GEMINI_MODEL = "gemini-2.5-flash"
-GEMINI_REQUEST_DELAY = 5  # seconds between requests
+# Gemini quota (requests and input tokens per minute), enforced by token buckets
+GEMINI_REQUESTS_PER_MINUTE = 15
+GEMINI_TOKENS_PER_MINUTE = 1_000_000
+GEMINI_MODEL_CACHE_SIZE = 16  # GenerativeModel instances kept, one per system instruction
+GEMINI_PREFLIGHT_TOKEN_COUNT = False  # count_tokens before each request (exact quota reservation)
+SYNTHESIS_MAX_CONCURRENCY = 3  # deliverables generated in parallel
+# Register the research prefix shared by every deliverable prompt as Gemini cached content
+GEMINI_CONTEXT_CACHE = True
+GEMINI_CONTEXT_CACHE_TTL_SECONDS = 3600
+GEMINI_CONTEXT_CACHE_MIN_TOKENS = 1024  # smaller prefixes are sent inline
+# Estimated tokens of ranked guide/dependency/research context per prompt;
+# override per deliverable with DELIVERABLES[...]["context_budget"]
+SYNTHESIS_CONTEXT_TOKEN_BUDGET = 6000
+
+# Document generation: PPTX/DOCX stages run in worker processes (capped at the CPU count)
+GENERATION_MAX_WORKERS = 4
+GENERATION_USE_PROCESSES = True
+# Keep one mermaid-cli browser alive across diagrams (and runs) instead of one mmdc per diagram
+MERMAID_PERSISTENT_WORKER = True
+MERMAID_RENDER_TIMEOUT_SECONDS = 120
+MERMAID_MAX_WORKERS = 0  # diagrams rendered at once; 0 = one per core, limited by free memory
+MERMAID_MEMORY_PER_RENDER_MB = 300
+# Rendered diagrams keyed on sanitized code + config + size + background
+MERMAID_CACHE_DIR = CACHE_DIR / "mermaid"
+MERMAID_CACHE_MAX_BYTES = 100 * 1024 * 1024  # 100 MB
+
+# Perplexity rate limiting (shared token bucket across concurrent queries)
+PERPLEXITY_REQUESTS_PER_SECOND = 1.0
+PERPLEXITY_BURST = 5  # requests that may be sent back-to-back
+PERPLEXITY_MAX_CONCURRENCY = 5  # parallel queries per research phase
+PERPLEXITY_MAX_CONNECTIONS = 20  # pooled HTTP connections for the async client
+RESEARCH_CACHE_BACKEND = "sqlite"  # "sqlite" (on-disk index) or "memory"
+
+# Industry-scoped research shared across companies
+SHARED_RESEARCH_CACHE_PATH = CACHE_DIR / "research_cache.sqlite3"
+SHARED_RESEARCH_CACHE_MAX_ENTRIES = 5000
+SHARED_RESEARCH_CACHE_MAX_BYTES = 100 * 1024 * 1024  # 100 MB
+INDUSTRY_CACHE_TTL_HOURS = 24 * 7  # industry research changes slowly
+
+# Gemini responses keyed on model + instruction + prompt + generation config
+SYNTHESIS_CACHE_DIR = CACHE_DIR / "synthesis"
+SYNTHESIS_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200 MB
+
+# Heading-level index of the TLDR guides (rebuilt when a guide changes)
+KNOWLEDGE_INDEX_PATH = CACHE_DIR / "knowledge_index.json"
+KNOWLEDGE_SECTION_MAX_TOKENS = 800  # longer sections are split at paragraph breaks
+KNOWLEDGE_TOP_N_SECTIONS = 8  # sections returned by load_for_deliverable / load_for_topic
+KNOWLEDGE_RETRIEVAL_TOP_N = 8  # BM25 passages offered to each synthesis prompt
 
 # Perplexity models and their use cases
 class PerplexityModel(str, Enum):
@@ -0,0 +1,225 @@
+"""
+Content-addressed on-disk cache with LRU eviction.
+
+Entries are opaque bytes stored one file per key, sharded by the first
+two hex digits of the key. Reads bump the file's modification time, so
+eviction (oldest mtime first) approximates least-recently-used. Writes go
+to a temporary file and are renamed into place, so concurrent readers,
+threads or processes never see partial entries.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Hash arbitrary JSON-serializable parts into a cache key.
+
+    Args:
+        *parts: Values that together determine the cached content.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    Bounded file-per-entry cache.
+
+    Usage:
+        cache = DiskCache(CACHE_DIR / "synthesis", max_bytes=200 * 1024 * 1024)
+        key = make_cache_key(model, prompt)
+        data = cache.get(key)
+        if data is None:
+            data = expensive()
+            cache.put(key, data)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        suffix: str = ".bin",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the entries (created if missing).
+            max_bytes: Evict oldest entries beyond this total size.
+            max_entries: Evict oldest entries beyond this count.
+            suffix: File extension for entries.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.suffix = suffix
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        # Running totals so puts only scan the directory when over a limit
+        self._total_bytes: Optional[int] = None
+        self._total_entries = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get an entry's bytes.
+
+        Args:
+            key: Cache key (see make_cache_key).
+
+        Returns:
+            Stored bytes, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store an entry, then evict old entries if over the limits.
+
+        Args:
+            key: Cache key.
+            data: Bytes to store.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # An overwrite replaces the old entry rather than adding one
+            try:
+                old_size = path.stat().st_size
+                added = 0
+            except OSError:
+                old_size = 0
+                added = 1
+            os.replace(tmp_name, path)
+        except OSError as e:
+            print(f"Warning: Could not write cache entry {key}: {e}")
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            return
+
+        if self.max_bytes or self.max_entries:
+            with self._lock:
+                if self._total_bytes is None:
+                    entries = self._entries()
+                    self._total_bytes = sum(size for _, size, _ in entries)
+                    self._total_entries = len(entries)
+                else:
+                    self._total_bytes += len(data) - old_size
+                    self._total_entries += added
+                over = (
+                    (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+                    or (self.max_entries is not None and self._total_entries > self.max_entries)
+                )
+            if over:
+                self.evict()
+
+    def get_text(self, key: str) -> Optional[str]:
+        """Get an entry as UTF-8 text."""
+        data = self.get(key)
+        return data.decode("utf-8") if data is not None else None
+
+    def put_text(self, key: str, text: str) -> None:
+        """Store UTF-8 text."""
+        self.put(key, text.encode("utf-8"))
+
+    def _entries(self):
+        """(mtime, size, path) for every entry."""
+        entries = []
+        for path in self.directory.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until within the limits.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            count = len(entries)
+
+            removed = 0
+            for _, size, path in entries:
+                over_bytes = self.max_bytes is not None and total > self.max_bytes
+                over_count = self.max_entries is not None and count > self.max_entries
+                if not (over_bytes or over_count):
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                count -= 1
+                removed += 1
+
+            self.evictions += removed
+            self._total_bytes = total
+            self._total_entries = count
+            return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._total_bytes = 0
+            self._total_entries = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics and current size."""
+        entries = self._entries()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+            }
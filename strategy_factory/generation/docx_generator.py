@@ -10,10 +10,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
-from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.text.paragraph import Paragraph
 
 from ..config import (
     OUTPUT_DIR,
@@ -27,6 +24,34 @@ from ..models import (
     ResearchOutput,
     CompanyInput,
 )
+from ..markdown_document import (
+    BULLET,
+    CODE,
+    HEADING,
+    NUMBERED,
+    TABLE,
+    MarkdownDocument,
+    is_horizontal_rule,
+)
+
+from .docx_template import (
+    CODE_STYLE,
+    COMPANY_STYLE,
+    INLINE_CODE_STYLE,
+    SUBTITLE_STYLE,
+    TABLE_STYLE,
+    TITLE_STYLE,
+    new_document,
+    style_id,
+)
+
+# Inline markdown, compiled once for every paragraph and table cell
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_INLINE_RE = re.compile(r'(\*\*[^*]+\*\*|\*[^*]+\*|`[^`]+`)')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_CODE_RE = re.compile(r'`([^`]+)`')
+_TABLE_SEPARATOR_RE = re.compile(r'^[\|\s:\-]+$')
 
 
 class DocxGenerator:
@@ -71,10 +96,7 @@ class DocxGenerator:
         Returns:
             Path to generated DOCX file.
         """
-        doc = Document()
-
-        # Set up custom styles
-        self._setup_styles(doc)
+        doc = new_document()
 
         # Title page
         self._add_title_page(
@@ -160,8 +182,7 @@ class DocxGenerator:
         Returns:
             Path to generated DOCX file.
         """
-        doc = Document()
-        self._setup_styles(doc)
+        doc = new_document()
 
         # Determine company size for pricing
         company_size = self._determine_company_size(company_input, research)
@@ -214,34 +235,6 @@ class DocxGenerator:
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir / filename
 
-    def _setup_styles(self, doc: Document) -> None:
-        """Set up custom styles for the document."""
-        # Get existing styles
-        styles = doc.styles
-
-        # Customize Heading 1
-        if 'Heading 1' in styles:
-            h1 = styles['Heading 1']
-            h1.font.name = 'Arial'
-            h1.font.size = Pt(18)
-            h1.font.bold = True
-            h1.font.color.rgb = RGBColor(31, 78, 121)
-
-        # Customize Heading 2
-        if 'Heading 2' in styles:
-            h2 = styles['Heading 2']
-            h2.font.name = 'Arial'
-            h2.font.size = Pt(14)
-            h2.font.bold = True
-            h2.font.color.rgb = RGBColor(68, 114, 196)
-
-        # Customize Normal
-        if 'Normal' in styles:
-            normal = styles['Normal']
-            normal.font.name = 'Arial'
-            normal.font.size = Pt(11)
-            normal.font.color.rgb = RGBColor(64, 64, 64)
-
     def _add_title_page(
         self,
         doc: Document,
@@ -255,37 +248,24 @@ class DocxGenerator:
             doc.add_paragraph()
 
         # Company name
-        company_para = doc.add_paragraph()
-        company_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = company_para.add_run(company_name)
-        run.font.size = Pt(28)
-        run.font.bold = True
-        run.font.color.rgb = RGBColor(31, 78, 121)
+        self._add_styled_paragraph(doc, company_name, COMPANY_STYLE)
 
         doc.add_paragraph()
 
         # Main title
-        title_para = doc.add_paragraph()
-        title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = title_para.add_run(title)
-        run.font.size = Pt(24)
-        run.font.color.rgb = RGBColor(64, 64, 64)
+        self._add_styled_paragraph(doc, title, TITLE_STYLE)
 
         doc.add_paragraph()
 
         # Subtitle
-        subtitle_para = doc.add_paragraph()
-        subtitle_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = subtitle_para.add_run(subtitle)
-        run.font.size = Pt(14)
-        run.font.color.rgb = RGBColor(128, 128, 128)
+        self._add_styled_paragraph(doc, subtitle, SUBTITLE_STYLE)
 
         # Add page break
         doc.add_page_break()
 
     def _add_table_of_contents(self, doc: Document) -> None:
         """Add table of contents placeholder."""
-        doc.add_heading("Table of Contents", level=1)
+        self._add_heading(doc, "Table of Contents", 1)
         doc.add_paragraph(
             "[Table of contents - Update field to generate in Word]"
         )
@@ -293,7 +273,32 @@ class DocxGenerator:
 
     def _add_section(self, doc: Document, title: str, level: int) -> None:
         """Add a section heading."""
-        doc.add_heading(title, level=level)
+        self._add_heading(doc, title, level)
+
+    def _add_heading(self, doc: Document, text: str, level: int) -> None:
+        """Add a heading paragraph (Heading 1-4)."""
+        self._add_styled_paragraph(doc, text, f"Heading {level}")
+
+    def _add_styled_paragraph(self, doc: Document, text: str, style: str) -> Paragraph:
+        """
+        Add a paragraph in one of the base document's styles.
+
+        The style id is set directly: assigning a style by name makes
+        python-docx scan every style in the document on each paragraph.
+
+        Args:
+            doc: Document to add to.
+            text: Paragraph text (may be empty).
+            style: Style name.
+
+        Returns:
+            The new paragraph.
+        """
+        para = doc.add_paragraph()
+        para._p.style = style_id(style)
+        if text:
+            para.add_run(text)
+        return para
 
     def _add_paragraph(
         self,
@@ -311,7 +316,7 @@ class DocxGenerator:
     def _add_bullet_list(self, doc: Document, items: List[str]) -> None:
         """Add a bullet list."""
         for item in items:
-            doc.add_paragraph(item, style='List Bullet')
+            self._add_styled_paragraph(doc, item, 'List Bullet')
 
     def _add_table(
         self,
@@ -321,17 +326,13 @@ class DocxGenerator:
     ) -> None:
         """Add a table to the document."""
         table = doc.add_table(rows=len(rows) + 1, cols=len(headers))
-        table.style = 'Table Grid'
+        # Grid borders with a bold header row
+        table._tbl.tblStyle_val = style_id(TABLE_STYLE)
 
         # Add headers
         header_row = table.rows[0]
         for i, header in enumerate(headers):
-            cell = header_row.cells[i]
-            cell.text = header
-            # Style header
-            for para in cell.paragraphs:
-                for run in para.runs:
-                    run.bold = True
+            header_row.cells[i].text = header
 
         # Add data rows
         for row_idx, row_data in enumerate(rows):
@@ -351,185 +352,105 @@ class DocxGenerator:
         level: int,
     ) -> None:
         """Add subsection from a deliverable's content."""
-        doc.add_heading(title, level=level)
+        self._add_heading(doc, title, level)
 
         if deliverable_id not in synthesis.deliverables:
             doc.add_paragraph("[Content not available]")
             return
 
-        content = synthesis.deliverables[deliverable_id].content
-        if not content:
+        deliverable = synthesis.deliverables[deliverable_id]
+        if not deliverable.content:
             doc.add_paragraph("[Content not available]")
             return
 
-        # Parse markdown content and convert to Word
-        self._convert_markdown_to_docx(doc, content)
-
-    def _convert_markdown_to_docx(self, doc: Document, markdown_content: str) -> None:
-        """Convert markdown content to Word format."""
-        lines = markdown_content.split('\n')
-        in_code_block = False
-        in_table = False
-        in_yaml_front_matter = False
-        table_lines = []
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            stripped = line.strip()
-
-            # Handle YAML front matter (at the very start)
-            if i == 0 and stripped == '---':
-                in_yaml_front_matter = True
-                i += 1
-                continue
+        # Convert the parsed markdown to Word
+        self._convert_markdown_to_docx(doc, deliverable.document)
 
-            if in_yaml_front_matter:
-                if stripped == '---':
-                    in_yaml_front_matter = False
-                i += 1
-                continue
-
-            # Skip horizontal rules (---, ***, ___) - these cause the dashed lines issue
-            if re.match(r'^[-*_]{3,}\s*$', stripped):
-                i += 1
-                continue
-
-            # Handle code blocks
-            if stripped.startswith('```'):
-                # If we're starting a code block, check if it's mermaid (skip entirely)
-                if not in_code_block and 'mermaid' in stripped.lower():
-                    # Skip the entire mermaid block
-                    i += 1
-                    while i < len(lines) and not lines[i].strip().startswith('```'):
-                        i += 1
-                    i += 1  # Skip closing ```
-                    continue
-                in_code_block = not in_code_block
-                i += 1
-                continue
-
-            if in_code_block:
-                # Add as monospace (but limit line length)
-                para = doc.add_paragraph()
-                code_line = line[:200] if len(line) > 200 else line  # Truncate very long lines
-                run = para.add_run(code_line)
-                run.font.name = 'Courier New'
-                run.font.size = Pt(10)
-                i += 1
-                continue
-
-            # Handle tables
-            if stripped.startswith('|') and stripped.endswith('|'):
-                # Skip lines that are too long (corrupted tables)
-                if len(stripped) > 1000:
-                    # If we were in a table, end it and skip this corrupted line
-                    if in_table and table_lines:
-                        self._process_markdown_table(doc, table_lines)
-                        table_lines = []
-                    in_table = False
-                    i += 1
+    def _convert_markdown_to_docx(self, doc: Document, document: MarkdownDocument) -> None:
+        """Convert a parsed markdown deliverable to Word format."""
+        for block in document.blocks:
+            if block.kind == HEADING:
+                if block.level == 1:
+                    # Top-level headings are kept as text; we add our own sections
+                    self._add_formatted_paragraph(doc, document.lines[block.line].strip())
                     continue
-                in_table = True
-                table_lines.append(stripped)
-                i += 1
-                continue
-            elif in_table:
-                # End of table, process it
-                if table_lines:
-                    self._process_markdown_table(doc, table_lines)
-                    table_lines = []
-                in_table = False
-                # Don't increment i - process this line normally
-
-            # Skip empty lines
-            if not stripped:
-                i += 1
-                continue
-
-            # Handle headings (but skip top-level as we add our own sections)
-            heading_match = re.match(r'^(#{2,6})\s+(.+)$', stripped)
-            if heading_match:
-                level = len(heading_match.group(1))
-                text = heading_match.group(2)
                 # Remove any remaining markdown formatting from heading
-                text = self._clean_markdown_text(text)
+                text = self._clean_markdown_text(block.text)
                 # Map markdown levels to Word levels (offset by 1)
-                word_level = min(level, 4)
-                doc.add_heading(text, level=word_level)
-                i += 1
-                continue
+                self._add_heading(doc, text, min(block.level, 4))
 
-            # Handle bullet points
-            bullet_match = re.match(r'^[-*+]\s+(.+)$', stripped)
-            if bullet_match:
-                text = self._clean_markdown_text(bullet_match.group(1))
+            elif block.kind == BULLET:
+                text = self._clean_markdown_text(block.text)
                 self._add_formatted_paragraph(doc, text, style='List Bullet')
-                i += 1
-                continue
 
-            # Handle numbered lists
-            numbered_match = re.match(r'^\d+\.\s+(.+)$', stripped)
-            if numbered_match:
-                text = self._clean_markdown_text(numbered_match.group(1))
+            elif block.kind == NUMBERED:
+                text = self._clean_markdown_text(block.text)
                 self._add_formatted_paragraph(doc, text, style='List Number')
-                i += 1
-                continue
 
-            # Regular paragraph - add with inline formatting
-            if stripped:
+            elif block.kind == TABLE:
+                self._process_markdown_table(doc, block.lines)
+
+            elif block.kind == CODE:
+                # Diagrams are rendered separately
+                if 'mermaid' in block.language:
+                    continue
+                for line in block.lines:
+                    # Skip horizontal rules - these cause the dashed lines issue
+                    if is_horizontal_rule(line):
+                        continue
+                    # Add as monospace (but limit line length)
+                    code_line = line[:200] if len(line) > 200 else line  # Truncate very long lines
+                    self._add_styled_paragraph(doc, code_line, CODE_STYLE)
+
+            else:
+                text = block.text
                 # Skip excessively long lines (corrupted data)
-                if len(stripped) > 2000:
-                    i += 1
+                if len(text) > 2000:
                     continue
                 # Skip lines that are mostly dashes (table separators that weren't caught)
-                if stripped.count('-') > 50 and stripped.count('-') / len(stripped) > 0.5:
-                    i += 1
+                if text.count('-') > 50 and text.count('-') / len(text) > 0.5:
                     continue
-                self._add_formatted_paragraph(doc, stripped)
-
-            i += 1
-
-        # Process any remaining table
-        if table_lines:
-            self._process_markdown_table(doc, table_lines)
+                self._add_formatted_paragraph(doc, text)
 
     def _clean_markdown_text(self, text: str) -> str:
         """Remove markdown formatting markers from text."""
         # Remove markdown links but keep the text
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+        if "](" in text:
+            text = _LINK_RE.sub(r'\1', text)
         # Don't remove bold/italic markers here - we'll handle them in _add_formatted_paragraph
         return text.strip()
 
     def _add_formatted_paragraph(self, doc: Document, text: str, style: Optional[str] = None) -> None:
         """Add a paragraph with inline formatting (bold, italic, code)."""
         if style:
-            para = doc.add_paragraph(style=style)
+            para = self._add_styled_paragraph(doc, "", style)
         else:
             para = doc.add_paragraph()
 
-        # Parse inline formatting
-        # Pattern to match **bold**, *italic*, and `code`
-        pattern = r'(\*\*[^*]+\*\*|\*[^*]+\*|`[^`]+`)'
-        parts = re.split(pattern, text)
+        # Plain text needs no tokenizing
+        if "*" not in text and "`" not in text:
+            if text:
+                para.add_run(text)
+            return
 
-        for part in parts:
+        # Split into plain text and **bold**, *italic*, `code` tokens
+        for part in _INLINE_RE.split(text):
             if not part:
                 continue
 
-            if part.startswith('**') and part.endswith('**'):
+            marker = part[0]
+            if marker == "*" and part.startswith('**') and part.endswith('**'):
                 # Bold
                 run = para.add_run(part[2:-2])
                 run.bold = True
-            elif part.startswith('*') and part.endswith('*'):
+            elif marker == "*" and part.endswith('*'):
                 # Italic
                 run = para.add_run(part[1:-1])
                 run.italic = True
-            elif part.startswith('`') and part.endswith('`'):
+            elif marker == "`" and part.endswith('`'):
                 # Code
                 run = para.add_run(part[1:-1])
-                run.font.name = 'Courier New'
-                run.font.size = Pt(10)
+                run._r.style = style_id(INLINE_CODE_STYLE)
             else:
                 # Regular text
                 para.add_run(part)
@@ -562,7 +483,7 @@ class DocxGenerator:
         rows = []
         for line in table_lines[2:]:
             # Skip separator lines (contain only dashes and colons)
-            if re.match(r'^[\|\s:\-]+$', line):
+            if _TABLE_SEPARATOR_RE.match(line):
                 continue
 
             # Skip lines that are mostly dashes (corrupted data)
@@ -590,10 +511,13 @@ class DocxGenerator:
     def _clean_table_cell(self, text: str, max_length: int = 500) -> str:
         """Clean and truncate table cell content."""
         # Remove markdown formatting
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # **bold**
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)  # *italic*
-        text = re.sub(r'`([^`]+)`', r'\1', text)  # `code`
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)  # [link](url)
+        if "*" in text:
+            text = _BOLD_RE.sub(r'\1', text)  # **bold**
+            text = _ITALIC_RE.sub(r'\1', text)  # *italic*
+        if "`" in text:
+            text = _CODE_RE.sub(r'\1', text)  # `code`
+        if "](" in text:
+            text = _LINK_RE.sub(r'\1', text)  # [link](url)
 
         # Truncate if too long
         if len(text) > max_length:
@@ -625,7 +549,7 @@ class DocxGenerator:
             "Comprehensive 360-day roadmap for transformation",
         ]
 
-        doc.add_heading("Key Findings", level=2)
+        self._add_heading(doc, "Key Findings", 2)
         self._add_bullet_list(doc, key_findings)
 
     def _add_company_overview_content(
@@ -639,7 +563,7 @@ class DocxGenerator:
         if profile.description:
             doc.add_paragraph(profile.description)
 
-        doc.add_heading("Company Profile", level=2)
+        self._add_heading(doc, "Company Profile", 2)
 
         profile_items = []
         if profile.business_model:
@@ -657,11 +581,11 @@ class DocxGenerator:
         # Industry context
         industry = research.industry
         if industry.primary_industry:
-            doc.add_heading("Industry Context", level=2)
+            self._add_heading(doc, "Industry Context", 2)
             doc.add_paragraph(f"Primary Industry: {industry.primary_industry}")
 
             if industry.key_trends:
-                doc.add_paragraph("Key Industry Trends:", style='Normal')
+                doc.add_paragraph("Key Industry Trends:")
                 self._add_bullet_list(doc, industry.key_trends[:5])
 
     # =========================================================================
@@ -718,7 +642,7 @@ class DocxGenerator:
 
         doc.add_paragraph()
 
-        doc.add_heading("Objectives", level=2)
+        self._add_heading(doc, "Objectives", 2)
         objectives = [
             "Assess current AI readiness and maturity",
             "Identify high-impact AI use cases aligned with business goals",
@@ -758,7 +682,7 @@ class DocxGenerator:
         ]
 
         for phase_name, activities in phases:
-            doc.add_heading(phase_name, level=2)
+            self._add_heading(doc, phase_name, 2)
             self._add_bullet_list(doc, activities)
 
     def _add_sow_deliverables(self, doc: Document) -> None:
@@ -800,7 +724,7 @@ class DocxGenerator:
         ]
 
         for category, items in deliverables:
-            doc.add_heading(category, level=2)
+            self._add_heading(doc, category, 2)
             self._add_bullet_list(doc, items)
 
     def _add_sow_timeline(self, doc: Document, synthesis: SynthesisOutput) -> None:
@@ -850,7 +774,7 @@ class DocxGenerator:
         self._add_table(doc, headers, rows)
 
         doc.add_paragraph()
-        doc.add_heading("Payment Terms", level=2)
+        self._add_heading(doc, "Payment Terms", 2)
         payment_terms = [
             "50% due upon SOW signature",
             "25% due at mid-project milestone (Week 5)",
@@ -886,7 +810,7 @@ class DocxGenerator:
         doc.add_paragraph()
 
         # Client signature block
-        doc.add_heading("Client", level=2)
+        self._add_heading(doc, "Client", 2)
         doc.add_paragraph(f"Company: {company_input.name}")
         doc.add_paragraph("Name: _______________________________")
         doc.add_paragraph("Title: _______________________________")
@@ -896,7 +820,7 @@ class DocxGenerator:
         doc.add_paragraph()
 
         # Consultant signature block
-        doc.add_heading("Consultant", level=2)
+        self._add_heading(doc, "Consultant", 2)
         doc.add_paragraph("Company: AI Strategy Factory")
         doc.add_paragraph("Name: _______________________________")
         doc.add_paragraph("Title: _______________________________")
@@ -0,0 +1,203 @@
+"""
+Pre-styled base document for the Word reports.
+
+The base is python-docx's default document with the report styles set
+up once: fonts and colours for Normal and the headings, title page
+styles, code styles and a table style with a bold header row. Styles the
+reports never use are pruned, along with the Word 2010 style copy
+(stylesWithEffects) and the template's thumbnail. The result is kept
+as .docx bytes (built on first use, or by preload() as a generation
+worker starts), and each report opens a copy.
+"""
+
+import threading
+from io import BytesIO
+from typing import Dict, Optional
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Pt, RGBColor
+
+DARK_BLUE = RGBColor(31, 78, 121)
+LIGHT_BLUE = RGBColor(68, 114, 196)
+DARK_GRAY = RGBColor(64, 64, 64)
+GRAY = RGBColor(128, 128, 128)
+
+# Word 2010 copy of styles.xml; python-docx has no constant for it
+STYLES_WITH_EFFECTS = "http://schemas.microsoft.com/office/2007/relationships/stylesWithEffects"
+
+# Styles added to the base document
+COMPANY_STYLE = "Report Company"
+TITLE_STYLE = "Report Title"
+SUBTITLE_STYLE = "Report Subtitle"
+CODE_STYLE = "Code Block"
+INLINE_CODE_STYLE = "Inline Code"
+TABLE_STYLE = "Report Table"
+
+# Styles the reports use; everything else is pruned from the base
+USED_STYLES = (
+    COMPANY_STYLE,
+    TITLE_STYLE,
+    SUBTITLE_STYLE,
+    CODE_STYLE,
+    INLINE_CODE_STYLE,
+    TABLE_STYLE,
+    "Normal",
+    "Heading 1",
+    "Heading 2",
+    "Heading 3",
+    "Heading 4",
+    "List Bullet",
+    "List Number",
+    "Table Grid",
+)
+
+
+def _setup_styles(doc: Document) -> None:
+    """Configure built-in styles and add the report styles."""
+    styles = doc.styles
+
+    normal = styles['Normal']
+    normal.font.name = 'Arial'
+    normal.font.size = Pt(11)
+    normal.font.color.rgb = DARK_GRAY
+
+    for name, size, color in (('Heading 1', 18, DARK_BLUE), ('Heading 2', 14, LIGHT_BLUE)):
+        heading = styles[name]
+        heading.font.name = 'Arial'
+        heading.font.size = Pt(size)
+        heading.font.bold = True
+        heading.font.color.rgb = color
+
+    # Title page
+    for name, size, color, bold in (
+        (COMPANY_STYLE, 28, DARK_BLUE, True),
+        (TITLE_STYLE, 24, DARK_GRAY, False),
+        (SUBTITLE_STYLE, 14, GRAY, False),
+    ):
+        style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = normal
+        style.font.size = Pt(size)
+        style.font.bold = bold
+        style.font.color.rgb = color
+        style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    code = styles.add_style(CODE_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    code.base_style = normal
+    code.font.name = 'Courier New'
+    code.font.size = Pt(10)
+
+    inline_code = styles.add_style(INLINE_CODE_STYLE, WD_STYLE_TYPE.CHARACTER)
+    inline_code.font.name = 'Courier New'
+    inline_code.font.size = Pt(10)
+
+    table = styles.add_style(TABLE_STYLE, WD_STYLE_TYPE.TABLE)
+    table.base_style = styles['Table Grid']
+    table.element.append(parse_xml(
+        f'<w:tblStylePr {nsdecls("w")} w:type="firstRow"><w:rPr><w:b/></w:rPr></w:tblStylePr>'
+    ))
+
+
+def _prune_styles(doc: Document) -> None:
+    """Drop style definitions nothing in the reports refers to."""
+    styles_element = doc.styles.element
+    by_id = {style.style_id: style.element for style in doc.styles}
+
+    keep = set()
+    pending = [
+        style.style_id for style in doc.styles
+        if style.name in USED_STYLES or style.element.get(qn('w:default')) in ('1', 'true')
+    ]
+    while pending:
+        current = pending.pop()
+        if current in keep or current not in by_id:
+            continue
+        keep.add(current)
+        for ref in ('w:basedOn', 'w:next', 'w:link'):
+            linked = by_id[current].find(qn(ref))
+            if linked is not None:
+                pending.append(linked.get(qn('w:val')))
+
+    for current, element in by_id.items():
+        if current not in keep:
+            styles_element.remove(element)
+
+
+def _drop_unused_parts(doc: Document) -> None:
+    """Remove the Word 2010 style duplicate and the template thumbnail."""
+    for rels, reltype in (
+        (doc.part.rels, STYLES_WITH_EFFECTS),
+        (doc.part.package.rels, RT.THUMBNAIL),
+    ):
+        for r_id, rel in list(rels.items()):
+            if rel.reltype == reltype:
+                rels.pop(r_id)
+
+
+def build_base_document() -> bytes:
+    """
+    Build the base document.
+
+    Returns:
+        .docx file contents with an empty body.
+    """
+    doc = Document()
+    _setup_styles(doc)
+    _prune_styles(doc)
+    _drop_unused_parts(doc)
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+_base: Optional[bytes] = None
+_style_ids: Dict[str, str] = {}
+_base_lock = threading.Lock()
+
+
+def _load() -> bytes:
+    global _base
+
+    with _base_lock:
+        if _base is None:
+            _base = build_base_document()
+            doc = Document(BytesIO(_base))
+            _style_ids.update({style.name: style.style_id for style in doc.styles})
+    return _base
+
+
+def preload() -> None:
+    """Build the base document now, e.g. when a worker process starts."""
+    _load()
+
+
+def new_document() -> Document:
+    """
+    Open a fresh document from the shared base.
+
+    Returns:
+        Document with the report styles and an empty body.
+    """
+    return Document(BytesIO(_load()))
+
+
+def style_id(name: str) -> str:
+    """
+    Style id of a base document style.
+
+    python-docx resolves style names by scanning every style on each
+    assignment; setting the id directly skips that.
+
+    Args:
+        name: Style name, e.g. "List Bullet".
+
+    Returns:
+        Style id, e.g. "ListBullet".
+    """
+    _load()
+    return _style_ids[name]
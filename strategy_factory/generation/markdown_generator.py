@@ -8,10 +8,11 @@ and directory structure.
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 
 from ..config import OUTPUT_DIR, DELIVERABLES
 from ..models import DeliverableContent, SynthesisOutput
+from ..markdown_document import MarkdownDocument
 
 
 class MarkdownGenerator:
@@ -131,133 +132,66 @@ generator: "AI Strategy Factory"
 
         return content
 
-    def extract_sections(self, content: str) -> Dict[str, str]:
+    def extract_sections(self, content: Union[str, MarkdownDocument]) -> Dict[str, str]:
         """
         Extract sections from markdown content.
 
         Useful for building presentations and reports.
 
         Args:
-            content: Markdown content.
+            content: Markdown content or an already parsed document
+                     (e.g. DeliverableContent.document).
 
         Returns:
             Dict mapping section heading to section content.
         """
-        sections = {}
-        current_heading = "introduction"
-        current_content = []
-
-        for line in content.split("\n"):
-            # Check for heading
-            heading_match = re.match(r'^(#{1,3})\s+(.+)$', line)
-            if heading_match:
-                # Save previous section
-                if current_content:
-                    sections[current_heading] = "\n".join(current_content).strip()
-
-                # Start new section
-                current_heading = heading_match.group(2).strip()
-                current_content = []
-            else:
-                current_content.append(line)
-
-        # Save final section
-        if current_content:
-            sections[current_heading] = "\n".join(current_content).strip()
-
-        return sections
-
-    def extract_tables(self, content: str) -> List[Dict[str, Any]]:
+        return self._document(content).flat_sections(max_level=3)
+
+    def extract_tables(self, content: Union[str, MarkdownDocument]) -> List[Dict[str, Any]]:
         """
         Extract tables from markdown content.
 
         Args:
-            content: Markdown content.
+            content: Markdown content or parsed document.
 
         Returns:
             List of tables as dicts with headers and rows.
         """
         tables = []
-        lines = content.split("\n")
-        i = 0
-
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Check for table header (starts with |)
-            if line.startswith("|") and line.endswith("|"):
-                table_lines = [line]
-                i += 1
-
-                # Collect all table lines
-                while i < len(lines) and lines[i].strip().startswith("|"):
-                    table_lines.append(lines[i].strip())
-                    i += 1
-
-                # Parse table if we have at least header + separator + 1 row
-                if len(table_lines) >= 3:
-                    table = self._parse_table(table_lines)
-                    if table:
-                        tables.append(table)
-            else:
-                i += 1
-
+        for block in self._document(content).tables():
+            headers = block.headers
+            rows = [dict(zip(headers, row)) for row in block.rows if len(row) == len(headers)]
+            tables.append({
+                "headers": headers,
+                "rows": rows,
+            })
         return tables
 
-    def _parse_table(self, table_lines: List[str]) -> Optional[Dict[str, Any]]:
-        """Parse markdown table lines into structured data."""
-        if len(table_lines) < 3:
-            return None
-
-        # Parse header
-        header_line = table_lines[0]
-        headers = [cell.strip() for cell in header_line.strip("|").split("|")]
-
-        # Skip separator line (line 1)
-        # Parse data rows
-        rows = []
-        for line in table_lines[2:]:
-            cells = [cell.strip() for cell in line.strip("|").split("|")]
-            if len(cells) == len(headers):
-                rows.append(dict(zip(headers, cells)))
-
-        return {
-            "headers": headers,
-            "rows": rows,
-        }
-
-    def extract_bullet_points(self, content: str) -> List[str]:
+    def extract_bullet_points(self, content: Union[str, MarkdownDocument]) -> List[str]:
         """
         Extract bullet points from markdown content.
 
         Args:
-            content: Markdown content.
+            content: Markdown content or parsed document.
 
         Returns:
             List of bullet point texts.
         """
-        bullet_pattern = re.compile(r'^\s*[-*+]\s+(.+)$', re.MULTILINE)
-        matches = bullet_pattern.findall(content)
-        return [m.strip() for m in matches]
+        return self._document(content).bullets()
 
-    def extract_mermaid_blocks(self, content: str) -> List[Dict[str, str]]:
+    def extract_mermaid_blocks(self, content: Union[str, MarkdownDocument]) -> List[Dict[str, str]]:
         """
         Extract mermaid diagram code blocks.
 
         Args:
-            content: Markdown content.
+            content: Markdown content or parsed document.
 
         Returns:
             List of dicts with 'type' and 'code' keys.
         """
-        mermaid_pattern = re.compile(
-            r'```mermaid\s*\n(.*?)```',
-            re.DOTALL
-        )
-
         blocks = []
-        for match in mermaid_pattern.finditer(content):
-            code = match.group(1).strip()
+        for block in self._document(content).code_blocks("mermaid"):
+            code = block.text
 
             # Detect diagram type from first line
             first_line = code.split('\n')[0].strip().lower()
@@ -287,6 +221,12 @@ generator: "AI Strategy Factory"
 
         return blocks
 
+    def _document(self, content: Union[str, MarkdownDocument]) -> MarkdownDocument:
+        """Parse content unless it is already a parsed document."""
+        if isinstance(content, MarkdownDocument):
+            return content
+        return MarkdownDocument(content)
+
 
 def save_markdown_deliverables(
     company_slug: str,
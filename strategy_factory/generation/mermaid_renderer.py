@@ -2,27 +2,71 @@
 Mermaid diagram renderer.
 
 Converts mermaid code blocks from markdown into PNG images
-using mermaid-cli (mmdc).
+using mermaid-cli (mmdc), through a persistent browser worker when
+Node can load mermaid-cli directly.
 """
 
 import json
 import os
 import re
+import signal
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import shutil
 
-from ..config import OUTPUT_DIR
+from ..config import (
+    OUTPUT_DIR,
+    MERMAID_CACHE_DIR,
+    MERMAID_CACHE_MAX_BYTES,
+    MERMAID_MAX_WORKERS,
+    MERMAID_MEMORY_PER_RENDER_MB,
+    MERMAID_PERSISTENT_WORKER,
+    MERMAID_RENDER_TIMEOUT_SECONDS,
+)
+from ..disk_cache import DiskCache, make_cache_key
+from .mermaid_worker import MermaidWorker, MermaidWorkerError, get_shared_worker
+
+
+class RenderAborted(Exception):
+    """Raised inside a render when the run's abort event is set."""
+    pass
+
+
+def default_render_workers() -> int:
+    """
+    Concurrent renders the machine can sustain.
+
+    One per CPU core, reduced if free memory cannot hold that many
+    renders at MERMAID_MEMORY_PER_RENDER_MB each.
+
+    Returns:
+        Worker count (at least 1).
+    """
+    cpus = os.cpu_count() or 1
+    try:
+        free_bytes = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        by_memory = free_bytes // (MERMAID_MEMORY_PER_RENDER_MB * 1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        # sysconf names are platform-specific (e.g. missing on macOS)
+        by_memory = cpus
+    return max(1, min(cpus, by_memory))
 
 
 class MermaidRenderer:
     """
     Renders mermaid diagrams to PNG images.
 
-    Uses mermaid-cli (mmdc) for rendering. Falls back to placeholder
-    images if mmdc is not available.
+    Uses mermaid-cli (mmdc) for rendering. By default diagrams go to a
+    shared MermaidWorker that keeps one browser open across diagrams and
+    runs; if it cannot start, each diagram runs its own mmdc process.
+    Rendered PNGs are cached by sanitized code and render settings, so
+    unchanged diagrams are copied instead of re-rendered on later runs.
+    Falls back to placeholder images if mmdc is not available.
 
     Responsibilities:
     - Extract mermaid code blocks from markdown
@@ -53,6 +97,13 @@ class MermaidRenderer:
         self,
         output_dir: Optional[Path] = None,
         config: Optional[Dict] = None,
+        worker: Optional[MermaidWorker] = None,
+        use_worker: bool = MERMAID_PERSISTENT_WORKER,
+        timeout: float = MERMAID_RENDER_TIMEOUT_SECONDS,
+        enable_cache: bool = True,
+        render_cache: Optional[DiskCache] = None,
+        max_workers: int = MERMAID_MAX_WORKERS,
+        abort_event: Optional[threading.Event] = None,
     ):
         """
         Initialize the mermaid renderer.
@@ -60,9 +111,33 @@ class MermaidRenderer:
         Args:
             output_dir: Base output directory.
             config: Optional mermaid config override.
+            worker: Worker to render with (default: the shared worker).
+            use_worker: Render through a persistent worker instead of
+                        one mmdc process per diagram.
+            timeout: Seconds allowed per diagram.
+            enable_cache: Reuse PNGs of previously rendered diagrams.
+            render_cache: Cache to use (default: MERMAID_CACHE_DIR).
+            max_workers: Diagrams rendered at once by render_from_markdown
+                         (0 = default_render_workers()).
+            abort_event: When set, queued diagrams are skipped and
+                         in-flight renders are abandoned.
         """
         self.output_dir = output_dir or OUTPUT_DIR
         self.config = config or self.DEFAULT_CONFIG
+        self.worker = worker
+        self.use_worker = use_worker
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.abort_event = abort_event
+
+        # Rendered PNGs keyed on sanitized code + config + size + background
+        self.render_cache: Optional[DiskCache] = None
+        if enable_cache:
+            self.render_cache = render_cache or DiskCache(
+                MERMAID_CACHE_DIR,
+                max_bytes=MERMAID_CACHE_MAX_BYTES,
+                suffix=".png",
+            )
         self._mmdc_available = self._check_mmdc()
 
     def _check_mmdc(self) -> bool:
@@ -84,6 +159,9 @@ class MermaidRenderer:
             diagram_names: Optional list of names for diagrams
                           (in order of appearance).
 
+        Diagrams render concurrently; file names depend only on each
+        diagram's position, so the result is the same as a serial run.
+
         Returns:
             Dict mapping diagram name to file path.
         """
@@ -106,7 +184,7 @@ class MermaidRenderer:
             "process_flow",
         ]
 
-        rendered_paths = {}
+        jobs = []
 
         for i, block in enumerate(blocks):
             # Determine diagram name
@@ -121,13 +199,28 @@ class MermaidRenderer:
             safe_name = re.sub(r'[^a-zA-Z0-9_]', '_', name.lower())
             output_path = images_dir / f"{safe_name}.png"
 
-            # Render diagram
-            success = self.render_diagram(
-                mermaid_code=block["code"],
-                output_path=output_path,
-            )
+            jobs.append((name, block["code"], output_path))
+
+        # Diagrams sharing a file name: only the last one (which a serial
+        # run would leave on disk) is rendered
+        final_job = {output_path: i for i, (_, _, output_path) in enumerate(jobs)}
+        unique_jobs = [jobs[i] for i in sorted(final_job.values())]
+
+        def render(job) -> bool:
+            _, code, output_path = job
+            return self.render_diagram(mermaid_code=code, output_path=output_path)
 
-            if success:
+        workers = min(self.max_workers or default_render_workers(), len(unique_jobs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(render, unique_jobs))
+        else:
+            results = [render(job) for job in unique_jobs]
+        succeeded = {job[2]: success for job, success in zip(unique_jobs, results)}
+
+        rendered_paths = {}
+        for name, _, output_path in jobs:
+            if succeeded[output_path]:
                 rendered_paths[name] = str(output_path)
 
         return rendered_paths
@@ -197,14 +290,27 @@ class MermaidRenderer:
             background: Background color.
 
         Returns:
-            True if rendering succeeded.
+            True if rendering succeeded (or a placeholder was written),
+            False if the run was aborted first.
         """
+        if self._aborted():
+            return False
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Sanitize mermaid code to fix common syntax issues
         mermaid_code = self._sanitize_mermaid_code(mermaid_code)
 
+        # Serve unchanged diagrams from the render cache
+        cache_key = make_cache_key("mermaid", mermaid_code, self.config, width, height, background)
+        if self.render_cache is not None:
+            cached = self.render_cache.get(cache_key)
+            if cached is not None:
+                output_path.write_bytes(cached)
+                print(f"Using cached render: {output_path}")
+                return True
+
         # Re-check mmdc availability (in case it was installed after init)
         if not self._mmdc_available:
             self._mmdc_available = self._check_mmdc()
@@ -215,6 +321,16 @@ class MermaidRenderer:
             self._create_placeholder(output_path, mermaid_code)
             return True
 
+        if self.use_worker:
+            try:
+                if self._render_with_worker(
+                    mermaid_code, output_path, width, height, background, cache_key
+                ):
+                    return True
+            except RenderAborted:
+                print(f"Rendering aborted: {output_path}")
+                return False
+
         try:
             # Create temp files for input and config
             with tempfile.NamedTemporaryFile(
@@ -247,15 +363,12 @@ class MermaidRenderer:
 
                 print(f"Running: {' '.join(cmd)}")
 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120,  # Increased timeout for complex diagrams
-                )
+                result = self._run_mmdc(cmd)
+                styled = True
 
                 if result.returncode != 0:
                     print(f"mmdc error (code {result.returncode}): {result.stderr}")
+                    styled = False
                     # Try without config file as fallback
                     cmd_simple = [
                         "mmdc",
@@ -263,12 +376,7 @@ class MermaidRenderer:
                         "-o", str(output_path),
                         "-b", background,
                     ]
-                    result = subprocess.run(
-                        cmd_simple,
-                        capture_output=True,
-                        text=True,
-                        timeout=120,
-                    )
+                    result = self._run_mmdc(cmd_simple)
                     if result.returncode != 0:
                         print(f"mmdc simple error: {result.stderr}")
                         self._create_placeholder(output_path, mermaid_code)
@@ -276,6 +384,10 @@ class MermaidRenderer:
 
                 if output_path.exists():
                     print(f"Successfully rendered: {output_path}")
+                    # The cache key includes self.config; unstyled
+                    # fallbacks are not stored under it
+                    if styled:
+                        self._cache_render(cache_key, output_path)
                     return True
                 else:
                     print(f"Output file not created: {output_path}")
@@ -289,6 +401,10 @@ class MermaidRenderer:
                 if os.path.exists(config_path):
                     os.unlink(config_path)
 
+        except RenderAborted:
+            print(f"Rendering aborted: {output_path}")
+            return False
+
         except subprocess.TimeoutExpired:
             print("mmdc timed out")
             self._create_placeholder(output_path, mermaid_code)
@@ -301,6 +417,109 @@ class MermaidRenderer:
             self._create_placeholder(output_path, mermaid_code)
             return True
 
+    def _render_with_worker(
+        self,
+        mermaid_code: str,
+        output_path: Path,
+        width: int,
+        height: int,
+        background: str,
+        cache_key: str,
+    ) -> bool:
+        """
+        Render through the persistent worker.
+
+        Mirrors the mmdc path: a failed render is retried without the
+        custom config, then replaced by a placeholder. Only renders that
+        used the config are cached.
+
+        Returns:
+            True if handled (rendered or placeholder), False if no worker
+            is available and mmdc should be run directly.
+
+        Raises:
+            RenderAborted: If the abort event was set mid-render.
+        """
+        worker = self.worker or get_shared_worker()
+        if worker is None or not worker.start():
+            return False
+
+        for config in (self.config, None):
+            try:
+                worker.render(
+                    mermaid_code,
+                    output_path,
+                    width=width,
+                    height=height,
+                    background=background,
+                    config=config,
+                    timeout=self.timeout,
+                    cancel=self.abort_event,
+                )
+                print(f"Successfully rendered: {output_path}")
+                if config is self.config:
+                    self._cache_render(cache_key, output_path)
+                return True
+            except MermaidWorkerError as e:
+                if self._aborted():
+                    raise RenderAborted()
+                if not worker.alive:
+                    print(f"Mermaid worker stopped ({e}), falling back to mmdc")
+                    return False
+                print(f"Mermaid worker error: {e}")
+
+        self._create_placeholder(output_path, mermaid_code)
+        return True
+
+    def _aborted(self) -> bool:
+        return self.abort_event is not None and self.abort_event.is_set()
+
+    def _run_mmdc(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Run mmdc, killing it on timeout or abort.
+
+        Raises:
+            subprocess.TimeoutExpired: After self.timeout seconds.
+            RenderAborted: If the abort event was set.
+        """
+        # Own process group, so the browser mmdc launches dies with it
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=(os.name == "posix"),
+        )
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=0.5)
+                return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+            except subprocess.TimeoutExpired:
+                aborted = self._aborted()
+                if aborted or time.monotonic() >= deadline:
+                    try:
+                        if os.name == "posix":
+                            os.killpg(process.pid, signal.SIGKILL)
+                        else:
+                            process.kill()
+                    except OSError:
+                        pass
+                    process.communicate()
+                    if aborted:
+                        raise RenderAborted()
+                    raise subprocess.TimeoutExpired(cmd, self.timeout)
+
+    def _cache_render(self, cache_key: str, output_path: Path) -> None:
+        """Store a rendered PNG (placeholders are never cached)."""
+        if self.render_cache is None:
+            return
+        try:
+            self.render_cache.put(cache_key, output_path.read_bytes())
+        except OSError as e:
+            print(f"Warning: Could not cache render {output_path}: {e}")
+
     def _create_placeholder(self, output_path: Path, mermaid_code: str) -> None:
         """
         Create a placeholder text file when rendering fails.
@@ -0,0 +1,100 @@
+#!/usr/bin/env node
+/**
+ * Long-lived mermaid renderer.
+ *
+ * Launches one headless browser through mermaid-cli's own Puppeteer and
+ * renders diagrams sent as JSON lines on stdin, so a run pays for a
+ * single browser startup instead of one per diagram.
+ *
+ * Usage: node mermaid_worker.mjs <mermaid-cli package dir>
+ *
+ * Protocol (one JSON object per line):
+ *   startup  -> {"ready": true} or {"ready": false, "error": "..."}
+ *   request  <- {"id": 1, "definition": "graph TD...", "output": "/abs/out.png",
+ *                "width": 1200, "height": 800, "background": "white",
+ *                "config": {...}}
+ *   response -> {"id": 1, "ok": true} or {"id": 1, "ok": false, "error": "..."}
+ *
+ * Requests are handled concurrently (one page each). The worker exits
+ * when stdin closes.
+ */
+
+import { readFileSync } from 'node:fs';
+import { mkdir, writeFile } from 'node:fs/promises';
+import { createRequire } from 'node:module';
+import { dirname, join } from 'node:path';
+import { createInterface } from 'node:readline';
+import { pathToFileURL } from 'node:url';
+
+function send(message) {
+  process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+function entryPoint(cliDir) {
+  const pkg = JSON.parse(readFileSync(join(cliDir, 'package.json'), 'utf8'));
+  let entry = pkg.exports;
+  if (entry && typeof entry === 'object') entry = entry['.'];
+  if (entry && typeof entry === 'object') entry = entry.import || entry.default;
+  return join(cliDir, typeof entry === 'string' ? entry : pkg.main || 'src/index.js');
+}
+
+async function loadRenderer(cliDir) {
+  const { renderMermaid } = await import(pathToFileURL(entryPoint(cliDir)).href);
+  const require = createRequire(join(cliDir, 'package.json'));
+  const puppeteerModule = await import(pathToFileURL(require.resolve('puppeteer')).href);
+  const puppeteer = puppeteerModule.default ?? puppeteerModule;
+  return { renderMermaid, puppeteer };
+}
+
+async function render(browser, renderMermaid, request) {
+  const { data } = await renderMermaid(browser, request.definition, 'png', {
+    viewport: { width: request.width, height: request.height, deviceScaleFactor: 1 },
+    backgroundColor: request.background,
+    mermaidConfig: request.config || {},
+  });
+  await mkdir(dirname(request.output), { recursive: true });
+  await writeFile(request.output, data);
+}
+
+async function main() {
+  const cliDir = process.argv[2];
+  let browser;
+  let renderMermaid;
+  try {
+    const loaded = await loadRenderer(cliDir);
+    renderMermaid = loaded.renderMermaid;
+    browser = await loaded.puppeteer.launch({ headless: true });
+  } catch (error) {
+    send({ ready: false, error: String(error && error.stack || error) });
+    process.exit(1);
+  }
+
+  const pending = new Set();
+  const lines = createInterface({ input: process.stdin });
+
+  lines.on('line', (line) => {
+    if (!line.trim()) return;
+    let request;
+    try {
+      request = JSON.parse(line);
+    } catch (error) {
+      send({ id: null, ok: false, error: `Invalid request: ${error}` });
+      return;
+    }
+    const task = render(browser, renderMermaid, request)
+      .then(() => send({ id: request.id, ok: true }))
+      .catch((error) => send({ id: request.id, ok: false, error: String(error && error.message || error) }))
+      .finally(() => pending.delete(task));
+    pending.add(task);
+  });
+
+  lines.on('close', async () => {
+    await Promise.allSettled(pending);
+    await browser.close();
+    process.exit(0);
+  });
+
+  send({ ready: true });
+}
+
+main();
@@ -0,0 +1,337 @@
+"""
+Persistent mermaid rendering process.
+
+Wraps mermaid_worker.mjs, a Node process that keeps one headless browser
+open and renders diagrams sent over stdin. Starting mmdc per diagram
+boots a fresh Chromium every time; the worker pays that cost once per
+process (shared by every run in the webapp).
+"""
+
+import atexit
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional
+
+WORKER_SCRIPT = Path(__file__).parent / "mermaid_worker.mjs"
+
+# Seconds to wait for the browser to launch
+STARTUP_TIMEOUT = 60
+
+
+class MermaidWorkerError(Exception):
+    """Raised when the worker cannot start or a render fails."""
+    pass
+
+
+def find_mermaid_cli() -> Optional[Path]:
+    """
+    Locate the installed @mermaid-js/mermaid-cli package.
+
+    Follows the mmdc executable on PATH back to its package directory.
+
+    Returns:
+        Package directory, or None if mmdc is not installed.
+    """
+    mmdc = shutil.which("mmdc")
+    if not mmdc:
+        return None
+
+    path = Path(os.path.realpath(mmdc))
+    for directory in path.parents:
+        package_json = directory / "package.json"
+        if not package_json.exists():
+            continue
+        try:
+            if json.loads(package_json.read_text(encoding="utf-8")).get("name") == "@mermaid-js/mermaid-cli":
+                return directory
+        except (OSError, ValueError):
+            pass
+        if directory.name == "node_modules":
+            break
+
+    # npm installs link node_modules/.bin/mmdc -> ../@mermaid-js/mermaid-cli/...
+    candidate = path.parent.parent / "@mermaid-js" / "mermaid-cli"
+    return candidate if (candidate / "package.json").exists() else None
+
+
+class MermaidWorker:
+    """
+    Client for one mermaid_worker.mjs process.
+
+    Requests carry an id, so several threads can render through the same
+    worker at once; the browser opens one page per request.
+
+    Usage:
+        worker = MermaidWorker()
+        if worker.start():
+            worker.render("graph TD; A-->B", Path("out.png"))
+        worker.close()
+    """
+
+    def __init__(
+        self,
+        cli_dir: Optional[Path] = None,
+        node: Optional[str] = None,
+    ):
+        """
+        Initialize the worker (started by start()).
+
+        Args:
+            cli_dir: mermaid-cli package directory (default: found via mmdc).
+            node: Node executable (default: node on PATH).
+        """
+        self.cli_dir = cli_dir
+        self.node = node or shutil.which("node")
+
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Future] = {}
+        self._exited = threading.Event()
+        self._stderr: Deque[str] = deque(maxlen=20)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running."""
+        return (
+            self._process is not None
+            and not self._exited.is_set()
+            and self._process.poll() is None
+        )
+
+    def start(self) -> bool:
+        """
+        Start the worker and wait for its browser to launch.
+
+        Returns:
+            True if the worker is ready to render.
+        """
+        with self._lock:
+            if self.alive:
+                return True
+
+            cli_dir = self.cli_dir or find_mermaid_cli()
+            if not self.node or not cli_dir:
+                return False
+
+            try:
+                self._process = subprocess.Popen(
+                    [self.node, str(WORKER_SCRIPT), str(cli_dir)],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding="utf-8",
+                    bufsize=1,
+                )
+            except OSError as e:
+                print(f"Warning: could not start mermaid worker: {e}")
+                return False
+
+            # Fresh per process, so a dead predecessor's reader cannot
+            # fail requests meant for this one
+            ready: Future = Future()
+            self._pending = {}
+            self._exited = threading.Event()
+            threading.Thread(
+                target=self._read_stdout,
+                args=(self._process, ready, self._pending, self._exited),
+                daemon=True,
+            ).start()
+            threading.Thread(target=self._read_stderr, args=(self._process,), daemon=True).start()
+
+            try:
+                ready.result(timeout=STARTUP_TIMEOUT)
+                return True
+            except Exception as e:
+                print(f"Warning: mermaid worker failed to start: {e}")
+                self._terminate()
+                return False
+
+    def render(
+        self,
+        mermaid_code: str,
+        output_path: Path,
+        width: int = 1200,
+        height: int = 800,
+        background: str = "white",
+        config: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Render one diagram to PNG.
+
+        Args:
+            mermaid_code: Mermaid diagram code.
+            output_path: Path to save PNG.
+            width: Viewport width in pixels.
+            height: Viewport height in pixels.
+            background: Background color.
+            config: Mermaid config.
+            timeout: Seconds to wait for the result.
+            cancel: Stop waiting once this event is set (the page is
+                    left to finish in the worker).
+
+        Raises:
+            MermaidWorkerError: If the worker is not running, the render
+                failed, timed out or was cancelled.
+        """
+        if not self.alive:
+            raise MermaidWorkerError("Mermaid worker is not running")
+
+        request_id = next(self._ids)
+        future: Future = Future()
+        pending, exited = self._pending, self._exited
+        pending[request_id] = future
+
+        request = {
+            "id": request_id,
+            "definition": mermaid_code,
+            "output": str(Path(output_path).resolve()),
+            "width": width,
+            "height": height,
+            "background": background,
+            "config": config or {},
+        }
+
+        try:
+            # Checked after registering: the reader sets exited before
+            # failing pending requests, so the future cannot be missed
+            if exited.is_set():
+                raise MermaidWorkerError("Mermaid worker exited")
+            with self._write_lock:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+            self._wait(future, timeout, cancel)
+        except MermaidWorkerError:
+            raise
+        except Exception as e:
+            raise MermaidWorkerError(str(e)) from e
+        finally:
+            pending.pop(request_id, None)
+
+    def _wait(
+        self,
+        future: Future,
+        timeout: Optional[float],
+        cancel: Optional[threading.Event],
+    ) -> None:
+        """Wait for a response, polling the cancel event."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = 0.5 if cancel is not None else None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise MermaidWorkerError(f"Render timed out after {timeout}s")
+                wait = remaining if wait is None else min(wait, remaining)
+            try:
+                future.result(timeout=wait)
+                return
+            except FutureTimeoutError:
+                if cancel is not None and cancel.is_set():
+                    raise MermaidWorkerError("Render cancelled")
+
+    def close(self) -> None:
+        """Stop the worker; the browser closes once stdin is closed."""
+        with self._lock:
+            process = self._process
+            if process is None:
+                return
+            try:
+                process.stdin.close()
+                process.wait(timeout=10)
+            except Exception:
+                self._terminate()
+            self._process = None
+
+    def _terminate(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        self._process = None
+
+    def _read_stdout(
+        self,
+        process: subprocess.Popen,
+        ready: Future,
+        pending: Dict[int, Future],
+        exited: threading.Event,
+    ) -> None:
+        """Resolve one process's startup and requests from its responses."""
+        for line in process.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+
+            if "ready" in message:
+                if message["ready"]:
+                    ready.set_result(True)
+                else:
+                    ready.set_exception(MermaidWorkerError(message.get("error", "unknown error")))
+                continue
+
+            future = pending.get(message.get("id"))
+            if future is None or future.done():
+                continue
+            if message.get("ok"):
+                future.set_result(True)
+            else:
+                future.set_exception(MermaidWorkerError(message.get("error", "render failed")))
+
+        # Process exited: fail whatever is still waiting
+        exited.set()
+        error = MermaidWorkerError("Mermaid worker exited: " + " | ".join(self._stderr))
+        if not ready.done():
+            ready.set_exception(error)
+        for future in list(pending.values()):
+            if not future.done():
+                future.set_exception(error)
+
+    def _read_stderr(self, process: subprocess.Popen) -> None:
+        for line in process.stderr:
+            if line.strip():
+                self._stderr.append(line.strip())
+
+
+_shared_worker: Optional[MermaidWorker] = None
+_shared_failed = False
+_shared_lock = threading.Lock()
+
+
+def get_shared_worker() -> Optional[MermaidWorker]:
+    """
+    Get the process-wide worker, starting it on first use.
+
+    A worker that crashed is restarted; one that never started (no node,
+    no mermaid-cli, browser launch failure) is not retried.
+
+    Returns:
+        Running worker, or None if rendering must fall back to mmdc.
+    """
+    global _shared_worker, _shared_failed
+
+    with _shared_lock:
+        if _shared_failed:
+            return None
+        if _shared_worker is not None and _shared_worker.alive:
+            return _shared_worker
+
+        if _shared_worker is None:
+            _shared_worker = MermaidWorker()
+            atexit.register(_shared_worker.close)
+        if not _shared_worker.start():
+            _shared_failed = True
+            return None
+        return _shared_worker
@@ -5,12 +5,18 @@ Manages the generation of all output formats (markdown, PPTX, DOCX)
 and mermaid diagram rendering.
 """
 
-import re
+import atexit
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 
-from ..config import OUTPUT_DIR, DELIVERABLES
+from ..config import OUTPUT_DIR, DELIVERABLES, GENERATION_MAX_WORKERS, GENERATION_USE_PROCESSES
 from ..models import (
     CompanyInput,
     ResearchOutput,
@@ -18,11 +24,81 @@ from ..models import (
     DeliverableContent,
     GenerationResult,
 )
+from ..scheduler import DependencyScheduler, ScheduleReport
 
 from .markdown_generator import MarkdownGenerator
 from .mermaid_renderer import MermaidRenderer
 from .pptx_generator import PowerPointGenerator
 from .docx_generator import DocxGenerator
+from .stages import (
+    PROCESS_STAGES,
+    STAGE_COMPONENTS,
+    STAGE_DEPENDENCIES,
+    STAGE_LABELS,
+    init_stage_worker,
+    run_stage,
+)
+
+
+# Worker processes for document stages, shared by every run in this process
+_stage_pool: Optional[ProcessPoolExecutor] = None
+_stage_pool_workers = 0
+_stage_pool_lock = threading.Lock()
+
+
+def _shutdown_stage_pool() -> None:
+    global _stage_pool
+    with _stage_pool_lock:
+        pool, _stage_pool = _stage_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+atexit.register(_shutdown_stage_pool)
+
+
+def get_stage_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the process-wide pool for document stages, starting it on first use.
+
+    Spawned workers import python-pptx, python-docx and this package and
+    build the document templates (init_stage_worker) once, and are then
+    reused by every later run, so only the first run pays for start-up.
+    Asking for a different size replaces the pool.
+
+    Args:
+        workers: Number of worker processes.
+
+    Returns:
+        Running ProcessPoolExecutor.
+    """
+    global _stage_pool, _stage_pool_workers
+
+    with _stage_pool_lock:
+        if _stage_pool is not None and _stage_pool_workers == workers:
+            return _stage_pool
+        old = _stage_pool
+        # spawn: forking a parent that already runs threads is unsafe
+        _stage_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_stage_worker,
+        )
+        _stage_pool_workers = workers
+        pool = _stage_pool
+    if old is not None:
+        old.shutdown(wait=False)
+    return pool
+
+
+def _discard_stage_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next run starts a fresh one."""
+    global _stage_pool
+
+    with _stage_pool_lock:
+        if _stage_pool is pool:
+            _stage_pool = None
+    pool.shutdown(wait=False)
 
 
 class GenerationOrchestrator:
@@ -35,12 +111,18 @@ class GenerationOrchestrator:
     - Generate PowerPoint presentations
     - Generate Word documents
     - Track progress and handle errors
+
+    Independent artifacts are generated concurrently (see stages.py for
+    the stage graph); only the decks wait for mermaid rendering.
     """
 
     def __init__(
         self,
         output_dir: Optional[Path] = None,
         progress_callback: Optional[Callable[[str, float], None]] = None,
+        max_workers: int = GENERATION_MAX_WORKERS,
+        use_processes: bool = GENERATION_USE_PROCESSES,
+        abort_event: Optional[threading.Event] = None,
     ):
         """
         Initialize the generation orchestrator.
@@ -48,19 +130,24 @@ class GenerationOrchestrator:
         Args:
             output_dir: Base output directory.
             progress_callback: Callback for progress updates.
+            max_workers: Worker processes for PPTX/DOCX stages (capped at
+                         the CPU count).
+            use_processes: Build documents in worker processes; if False,
+                           every stage runs on a thread in this process.
+            abort_event: Set (or call abort()) to stop the run: stages
+                         not yet started are skipped and mermaid renders
+                         are abandoned.
         """
         self.output_dir = output_dir or OUTPUT_DIR
         self.progress_callback = progress_callback
-
-        # Initialize generators
-        self.markdown_gen = MarkdownGenerator(output_dir=self.output_dir)
-        self.mermaid_renderer = MermaidRenderer(output_dir=self.output_dir)
-        self.pptx_gen = PowerPointGenerator(output_dir=self.output_dir)
-        self.docx_gen = DocxGenerator(output_dir=self.output_dir)
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.abort_event = abort_event or threading.Event()
 
         # Track results
         self.generated_files: Dict[str, str] = {}
         self.errors: List[Dict[str, Any]] = []
+        self.artifact_errors: Dict[str, str] = {}
 
     def generate_all(
         self,
@@ -82,40 +169,19 @@ class GenerationOrchestrator:
             GenerationResult with all generated files.
         """
         start_time = datetime.now()
-        total_steps = 5  # markdown, mermaid, exec pptx, full pptx, docx (x2)
-        current_step = 0
 
         self._report_progress("Starting generation", 0)
 
-        # Step 1: Save markdown files
-        current_step += 1
-        self._report_progress("Saving markdown files", current_step / total_steps)
-        markdown_paths = self._save_markdown(company_slug, synthesis)
-        self.generated_files.update(markdown_paths)
-
-        # Step 2: Render mermaid diagrams
-        current_step += 1
-        self._report_progress("Rendering mermaid diagrams", current_step / total_steps)
-        mermaid_images = self._render_mermaid(company_slug, synthesis)
-        self.generated_files.update({
-            f"mermaid_{k}": v for k, v in mermaid_images.items()
-        })
-
-        # Step 3: Generate PowerPoint presentations
-        current_step += 1
-        self._report_progress("Generating PowerPoint presentations", current_step / total_steps)
-        pptx_paths = self._generate_presentations(
-            company_slug, company_input, research, synthesis, mermaid_images
-        )
-        self.generated_files.update(pptx_paths)
-
-        # Step 4: Generate Word documents
-        current_step += 1
-        self._report_progress("Generating Word documents", current_step / total_steps)
-        docx_paths = self._generate_documents(
+        stage_outputs, report = self._run_stages(
             company_slug, company_input, research, synthesis
         )
-        self.generated_files.update(docx_paths)
+
+        if self.abort_event.is_set():
+            self._record_error("generation", "Generation aborted")
+
+        # Merge in stage order so the listing does not depend on timing
+        for stage in STAGE_DEPENDENCIES:
+            self.generated_files.update(stage_outputs.get(stage, {}))
 
         # Complete
         self._report_progress("Generation complete", 1.0)
@@ -141,135 +207,101 @@ class GenerationOrchestrator:
             total_cost=synthesis.total_cost if synthesis else 0.0,
             generation_time=duration,
             errors=[e["error"] for e in self.errors],
+            artifact_timings={
+                stage: round(timing.duration, 3)
+                for stage, timing in sorted(report.timings.items(), key=lambda kv: kv[1].started)
+            },
+            artifact_errors=dict(self.artifact_errors),
         )
 
-    def _save_markdown(
-        self,
-        company_slug: str,
-        synthesis: SynthesisOutput,
-    ) -> Dict[str, str]:
-        """Save all markdown deliverables."""
-        try:
-            return self.markdown_gen.save_all(company_slug, synthesis)
-        except Exception as e:
-            self._record_error("markdown_generation", str(e))
-            return {}
-
-    def _render_mermaid(
-        self,
-        company_slug: str,
-        synthesis: SynthesisOutput,
-    ) -> Dict[str, str]:
-        """Render mermaid diagrams from markdown content."""
-        # Get mermaid diagrams deliverable content
-        if "03_mermaid_diagrams" not in synthesis.deliverables:
-            return {}
-
-        mermaid_content = synthesis.deliverables["03_mermaid_diagrams"].content
-        if not mermaid_content:
-            return {}
-
-        try:
-            # Extract diagram names from headings
-            diagram_names = self._extract_diagram_names(mermaid_content)
-
-            return self.mermaid_renderer.render_from_markdown(
-                company_slug=company_slug,
-                markdown_content=mermaid_content,
-                diagram_names=diagram_names,
-            )
-        except Exception as e:
-            self._record_error("mermaid_rendering", str(e))
-            return {}
-
-    def _extract_diagram_names(self, content: str) -> List[str]:
-        """Extract diagram names from markdown headings."""
-        names = []
-        heading_pattern = re.compile(r'^##\s+(.+)$', re.MULTILINE)
-
-        for match in heading_pattern.finditer(content):
-            heading = match.group(1).strip()
-            # Convert heading to snake_case for filename
-            name = re.sub(r'[^a-zA-Z0-9\s]', '', heading)
-            name = re.sub(r'\s+', '_', name).lower()
-            names.append(name)
-
-        return names if names else ["current_state", "future_state", "data_flow"]
-
-    def _generate_presentations(
+    def _run_stages(
         self,
         company_slug: str,
         company_input: CompanyInput,
         research: ResearchOutput,
         synthesis: SynthesisOutput,
-        mermaid_images: Dict[str, str],
-    ) -> Dict[str, str]:
-        """Generate PowerPoint presentations."""
-        paths = {}
+    ) -> Tuple[Dict[str, Dict[str, str]], ScheduleReport]:
+        """
+        Run every generation stage as soon as its dependencies are done.
 
-        # Executive summary deck
-        try:
-            exec_path = self.pptx_gen.generate_executive_summary(
-                company_slug=company_slug,
-                company_input=company_input,
-                research=research,
-                synthesis=synthesis,
-                mermaid_images=mermaid_images,
-            )
-            paths["executive_summary_deck"] = exec_path
-        except Exception as e:
-            self._record_error("executive_summary_pptx", str(e))
+        Document stages (PROCESS_STAGES) go to the shared process pool
+        (get_stage_pool) when use_processes is set and more than one
+        worker is available; the rest run on the scheduler's threads. A
+        failed stage is recorded but never blocks its dependents: decks
+        are still built without images if mermaid rendering fails.
 
-        # Full findings presentation
-        try:
-            full_path = self.pptx_gen.generate_full_findings(
-                company_slug=company_slug,
-                company_input=company_input,
-                research=research,
-                synthesis=synthesis,
-                mermaid_images=mermaid_images,
+        Returns:
+            (stage -> {artifact key: path}, ScheduleReport)
+        """
+        scheduler = DependencyScheduler(STAGE_DEPENDENCIES)
+        outputs: Dict[str, Dict[str, str]] = {}
+        lock = threading.Lock()
+        finished = [0]
+        total = len(scheduler.tasks)
+
+        workers = min(self.max_workers, os.cpu_count() or 1)
+        pool = None
+        if self.use_processes and workers > 1:
+            pool = get_stage_pool(workers)
+
+        def run(stage: str) -> bool:
+            if self.abort_event.is_set():
+                return False
+
+            mermaid_images = None
+            if "mermaid" in STAGE_DEPENDENCIES[stage]:
+                mermaid_images = {
+                    key[len("mermaid_"):]: path
+                    for key, path in outputs.get("mermaid", {}).items()
+                }
+            args = (
+                stage, self.output_dir, company_slug,
+                company_input, research, synthesis, mermaid_images,
             )
-            paths["full_findings_presentation"] = full_path
-        except Exception as e:
-            self._record_error("full_findings_pptx", str(e))
 
-        return paths
-
-    def _generate_documents(
+            try:
+                paths = self._run_stage(pool, args)
+            except Exception as e:
+                self._record_error(STAGE_COMPONENTS[stage], str(e))
+                with lock:
+                    self.artifact_errors[stage] = str(e)
+                paths = {}
+
+            with lock:
+                outputs[stage] = paths
+                finished[0] += 1
+                done = finished[0]
+            self._report_progress(f"Finished {STAGE_LABELS[stage]}", done / total)
+            return True
+
+        def on_start(stage: str) -> None:
+            self._report_progress(f"Generating {STAGE_LABELS[stage]}", finished[0] / total)
+
+        # Stages wait on their pool futures, so nothing is left running here
+        report = scheduler.run(run, max_workers=total, on_start=on_start)
+        return outputs, report
+
+    def _run_stage(
         self,
-        company_slug: str,
-        company_input: CompanyInput,
-        research: ResearchOutput,
-        synthesis: SynthesisOutput,
+        pool: Optional[ProcessPoolExecutor],
+        args: Tuple[Any, ...],
     ) -> Dict[str, str]:
-        """Generate Word documents."""
-        paths = {}
-
-        # Final strategy report
-        try:
-            report_path = self.docx_gen.generate_strategy_report(
-                company_slug=company_slug,
-                company_input=company_input,
-                research=research,
-                synthesis=synthesis,
-            )
-            paths["final_strategy_report"] = report_path
-        except Exception as e:
-            self._record_error("strategy_report_docx", str(e))
+        """Run one stage in the pool if it is a document stage, else inline."""
+        stage = args[0]
+        if pool is None or stage not in PROCESS_STAGES:
+            return run_stage(*args, abort_event=self.abort_event)
 
-        # Statement of work
         try:
-            sow_path = self.docx_gen.generate_statement_of_work(
-                company_slug=company_slug,
-                company_input=company_input,
-                research=research,
-                synthesis=synthesis,
-            )
-            paths["statement_of_work"] = sow_path
-        except Exception as e:
-            self._record_error("sow_docx", str(e))
-
-        return paths
+            return pool.submit(run_stage, *args).result()
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            if isinstance(e, BrokenProcessPool):
+                _discard_stage_pool(pool)
+            print(f"Warning: {stage} could not run in a worker process ({e}); running in-process")
+            return run_stage(*args)
+
+    def abort(self) -> None:
+        """Stop a running generate_all() (safe to call from another thread)."""
+        self.abort_event.set()
 
     def _get_deliverable_name(self, key: str) -> str:
         """Get human-readable name for a deliverable."""
@@ -4,31 +4,30 @@ PowerPoint generator for executive summary and full findings decks.
 Creates professional presentations from synthesized deliverables.
 """
 
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 from pptx import Presentation
 from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
 
 from ..config import OUTPUT_DIR, DELIVERABLES
 from ..models import SynthesisOutput, ResearchOutput, CompanyInput
-
-
-# Color scheme
-COLORS = {
-    "dark_blue": RGBColor(31, 78, 121),      # Primary headers
-    "light_blue": RGBColor(68, 114, 196),    # Secondary elements
-    "gray": RGBColor(89, 89, 89),            # Subtitles
-    "dark_gray": RGBColor(64, 64, 64),       # Body text
-    "white": RGBColor(255, 255, 255),        # Light text
-    "light_bg": RGBColor(242, 242, 242),     # Light backgrounds
-    "accent": RGBColor(0, 176, 80),          # Success/highlights
-    "warning": RGBColor(255, 192, 0),        # Warnings
-}
+from ..markdown_document import Block, bullet_texts, first_table
+from .pptx_template import (
+    BODY_IDX,
+    CAPTION_IDX,
+    COLORS,
+    CONTENT_LAYOUT,
+    SECTION_LAYOUT,
+    SUBTITLE_IDX,
+    TABLE_STYLE_ID,
+    TITLE_IDX,
+    TITLE_LAYOUT,
+    new_presentation,
+)
 
 
 class PowerPointGenerator:
@@ -40,6 +39,9 @@ class PowerPointGenerator:
     - Create full findings presentation (30-40 slides)
     - Apply consistent styling and branding
     - Include mermaid diagram images
+
+    Slides are created from the layouts of a shared themed template
+    (pptx_template.py) and inherit their fonts and colours from it.
     """
 
     def __init__(self, output_dir: Optional[Path] = None):
@@ -84,11 +86,7 @@ class PowerPointGenerator:
         Returns:
             Path to generated PPTX file.
         """
-        prs = Presentation()
-
-        # Set slide dimensions (widescreen 16:9)
-        prs.slide_width = Inches(13.333)
-        prs.slide_height = Inches(7.5)
+        prs = new_presentation()  # Widescreen 16:9
 
         # Build slides
         self._add_title_slide(
@@ -137,11 +135,7 @@ class PowerPointGenerator:
         Returns:
             Path to generated PPTX file.
         """
-        prs = Presentation()
-
-        # Set slide dimensions
-        prs.slide_width = Inches(13.333)
-        prs.slide_height = Inches(7.5)
+        prs = new_presentation()
 
         # Title slide
         self._add_title_slide(
@@ -223,68 +217,15 @@ class PowerPointGenerator:
         subtitle: str,
     ) -> None:
         """Add title slide."""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
-
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(2.5), Inches(12.333), Inches(1.5)
-        )
-        tf = title_box.text_frame
-        tf.word_wrap = True
-        p = tf.paragraphs[0]
-        p.text = f"{company_name}"
-        p.font.size = Pt(44)
-        p.font.bold = True
-        p.font.color.rgb = COLORS["dark_blue"]
-        p.alignment = PP_ALIGN.CENTER
-
-        # Add main title
-        subtitle_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(4), Inches(12.333), Inches(1)
-        )
-        tf = subtitle_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(32)
-        p.font.color.rgb = COLORS["dark_gray"]
-        p.alignment = PP_ALIGN.CENTER
-
-        # Add date/subtitle
-        date_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(5), Inches(12.333), Inches(0.5)
-        )
-        tf = date_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = subtitle
-        p.font.size = Pt(18)
-        p.font.color.rgb = COLORS["gray"]
-        p.alignment = PP_ALIGN.CENTER
+        slide = prs.slides.add_slide(prs.slide_layouts.get_by_name(TITLE_LAYOUT))
+        slide.placeholders[TITLE_IDX].text = company_name
+        slide.placeholders[SUBTITLE_IDX].text = title
+        slide.placeholders[CAPTION_IDX].text = subtitle
 
     def _add_section_divider(self, prs: Presentation, title: str) -> None:
         """Add a section divider slide."""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-        # Add colored background shape
-        shape = slide.shapes.add_shape(
-            1,  # Rectangle
-            Inches(0), Inches(0),
-            Inches(13.333), Inches(7.5)
-        )
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = COLORS["dark_blue"]
-        shape.line.fill.background()
-
-        # Add section title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(3), Inches(12.333), Inches(1.5)
-        )
-        tf = title_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(40)
-        p.font.bold = True
-        p.font.color.rgb = COLORS["white"]
-        p.alignment = PP_ALIGN.CENTER
+        slide = prs.slides.add_slide(prs.slide_layouts.get_by_name(SECTION_LAYOUT))
+        slide.placeholders[TITLE_IDX].text = title
 
     def _add_slide_with_title(
         self,
@@ -293,54 +234,33 @@ class PowerPointGenerator:
         subtitle: Optional[str] = None,
     ):
         """Add a content slide with title and return the slide."""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide = prs.slides.add_slide(prs.slide_layouts.get_by_name(CONTENT_LAYOUT))
+        slide.placeholders[TITLE_IDX].text = title
 
-        # Title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.3), Inches(12.333), Inches(0.8)
-        )
-        tf = title_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = title
-        p.font.size = Pt(28)
-        p.font.bold = True
-        p.font.color.rgb = COLORS["dark_blue"]
-
-        # Subtitle if provided
         if subtitle:
-            p = tf.add_paragraph()
-            p.text = subtitle
-            p.font.size = Pt(16)
-            p.font.color.rgb = COLORS["gray"]
+            slide.placeholders[CAPTION_IDX].text = subtitle
+        else:
+            self._remove_placeholder(slide, CAPTION_IDX)
 
         return slide
 
-    def _add_bullets_to_slide(
-        self,
-        slide,
-        bullets: List[str],
-        left: float = 0.5,
-        top: float = 1.5,
-        width: float = 12.333,
-        height: float = 5.5,
-        font_size: int = 18,
-    ) -> None:
-        """Add bullet points to a slide."""
-        textbox = slide.shapes.add_textbox(
-            Inches(left), Inches(top), Inches(width), Inches(height)
-        )
-        tf = textbox.text_frame
-        tf.word_wrap = True
-
-        for i, text in enumerate(bullets):
-            if i == 0:
-                p = tf.paragraphs[0]
-            else:
-                p = tf.add_paragraph()
-            p.text = f"• {text}"
-            p.font.size = Pt(font_size)
-            p.font.color.rgb = COLORS["dark_gray"]
-            p.space_after = Pt(12)
+    def _remove_placeholder(self, slide, idx: int) -> None:
+        """Remove an unused placeholder so it does not show its prompt text."""
+        for placeholder in slide.placeholders:
+            if placeholder.placeholder_format.idx == idx:
+                placeholder._element.getparent().remove(placeholder._element)
+                return
+
+    def _add_bullets_to_slide(self, slide, bullets: List[str]) -> None:
+        """Fill the slide's body placeholder with bullet points."""
+        if not bullets:
+            self._remove_placeholder(slide, BODY_IDX)
+            return
+
+        tf = slide.placeholders[BODY_IDX].text_frame
+        tf.text = bullets[0]
+        for text in bullets[1:]:
+            tf.add_paragraph().text = text
 
     def _add_table_to_slide(
         self,
@@ -352,7 +272,9 @@ class PowerPointGenerator:
         width: float = 12.333,
         height: float = 4,
     ) -> None:
-        """Add a table to a slide."""
+        """Add a table to a slide in place of its body placeholder."""
+        self._remove_placeholder(slide, BODY_IDX)
+
         num_rows = len(rows) + 1  # +1 for header
         num_cols = len(headers)
 
@@ -361,103 +283,91 @@ class PowerPointGenerator:
             Inches(left), Inches(top),
             Inches(width), Inches(height)
         ).table
+        # Header and row banding come from the template's table style
+        table._tbl.tblPr.find(qn("a:tableStyleId")).text = TABLE_STYLE_ID
 
         # Set column widths
         col_width = width / num_cols
         for i in range(num_cols):
             table.columns[i].width = Inches(col_width)
 
-        # Style header row
+        # Header row
         for i, header in enumerate(headers):
             cell = table.cell(0, i)
             cell.text = header
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = COLORS["dark_blue"]
-
-            # Style text
-            for paragraph in cell.text_frame.paragraphs:
-                paragraph.font.bold = True
-                paragraph.font.size = Pt(14)
-                paragraph.font.color.rgb = COLORS["white"]
-                paragraph.alignment = PP_ALIGN.CENTER
+            paragraph = cell.text_frame.paragraphs[0]
+            paragraph.font.size = Pt(14)
+            paragraph.alignment = PP_ALIGN.CENTER
 
         # Add data rows
         for row_idx, row_data in enumerate(rows):
             for col_idx, value in enumerate(row_data):
-                cell = table.cell(row_idx + 1, col_idx)
-                cell.text = str(value)
-
-                # Alternate row colors
-                if row_idx % 2 == 0:
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = COLORS["light_bg"]
+                table.cell(row_idx + 1, col_idx).text = str(value)
+
+    def _add_picture_to_slide(self, slide, image_path: Path) -> None:
+        """Add a diagram image in place of the body placeholder."""
+        self._remove_placeholder(slide, BODY_IDX)
+        slide.shapes.add_picture(
+            str(image_path),
+            Inches(1), Inches(1.5),
+            width=Inches(11),
+        )
 
-                for paragraph in cell.text_frame.paragraphs:
-                    paragraph.font.size = Pt(12)
-                    paragraph.font.color.rgb = COLORS["dark_gray"]
+    def _add_message_to_slide(self, slide, text: str) -> None:
+        """Add a centered note in place of the body placeholder."""
+        self._remove_placeholder(slide, BODY_IDX)
+        textbox = slide.shapes.add_textbox(
+            Inches(2), Inches(3), Inches(9), Inches(2)
+        )
+        p = textbox.text_frame.paragraphs[0]
+        p.text = text
+        p.font.size = Pt(20)
+        p.font.color.rgb = COLORS["gray"]
+        p.alignment = PP_ALIGN.CENTER
 
     def _extract_content_section(
         self,
         synthesis: SynthesisOutput,
         deliverable_id: str,
         section_name: Optional[str] = None,
-    ) -> str:
-        """Extract content from a deliverable."""
+    ) -> List[Block]:
+        """
+        Parsed blocks of a deliverable, or of one of its sections.
+
+        Sections are looked up in the deliverable's heading index, which
+        tolerates numbering and wording differences in generated headings.
+        If the section is missing, the whole deliverable is used.
+        """
         if deliverable_id not in synthesis.deliverables:
-            return ""
+            return []
 
-        content = synthesis.deliverables[deliverable_id].content
-        if not content:
-            return ""
+        deliverable = synthesis.deliverables[deliverable_id]
+        if not deliverable.content:
+            return []
 
+        document = deliverable.document
         if section_name:
-            # Extract specific section
-            pattern = rf'##\s*{re.escape(section_name)}.*?\n(.*?)(?=\n##|\Z)'
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+            section = document.find_section(section_name)
+            if section:
+                return document.section_blocks(section)
+            print(f"Warning: no '{section_name}' section in {deliverable_id}, using the whole deliverable")
 
-        return content
+        return document.blocks
 
     def _extract_bullets_from_content(
         self,
-        content: str,
+        content: List[Block],
         max_bullets: int = 6,
     ) -> List[str]:
-        """Extract bullet points from markdown content."""
-        bullet_pattern = re.compile(r'^\s*[-*+]\s+(.+)$', re.MULTILINE)
-        matches = bullet_pattern.findall(content)
-        return [m.strip() for m in matches[:max_bullets]]
+        """Extract bullet points from parsed content."""
+        return bullet_texts(content, max_bullets)
 
     def _extract_table_from_content(
         self,
-        content: str,
+        content: List[Block],
     ) -> Optional[Dict[str, Any]]:
-        """Extract first table from markdown content."""
-        lines = content.split("\n")
-        table_lines = []
-        in_table = False
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith("|") and line.endswith("|"):
-                in_table = True
-                table_lines.append(line)
-            elif in_table and not line.startswith("|"):
-                break
-
-        if len(table_lines) >= 3:
-            # Parse headers
-            headers = [c.strip() for c in table_lines[0].strip("|").split("|")]
-            # Parse rows (skip separator)
-            rows = []
-            for line in table_lines[2:]:
-                cells = [c.strip() for c in line.strip("|").split("|")]
-                if len(cells) == len(headers):
-                    rows.append(cells)
-            return {"headers": headers, "rows": rows}
-
-        return None
+        """Extract first table from parsed content."""
+        return first_table(content)
 
     # =========================================================================
     # Executive Summary specific slides
@@ -497,11 +407,7 @@ class PowerPointGenerator:
         if mermaid_images and "current_state" in mermaid_images:
             image_path = Path(mermaid_images["current_state"])
             if image_path.exists() and image_path.suffix == ".png":
-                slide.shapes.add_picture(
-                    str(image_path),
-                    Inches(1), Inches(1.5),
-                    width=Inches(11),
-                )
+                self._add_picture_to_slide(slide, image_path)
                 return
 
         # Fallback to text bullets
@@ -634,30 +540,10 @@ class PowerPointGenerator:
 
     def _add_contact_slide(self, prs: Presentation) -> None:
         """Add contact/closing slide."""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-        # Title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(2.5), Inches(12.333), Inches(1)
-        )
-        tf = title_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = "Thank You"
-        p.font.size = Pt(44)
-        p.font.bold = True
-        p.font.color.rgb = COLORS["dark_blue"]
-        p.alignment = PP_ALIGN.CENTER
-
-        # Generated by line
-        subtitle_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(5.5), Inches(12.333), Inches(0.5)
-        )
-        tf = subtitle_box.text_frame
-        p = tf.paragraphs[0]
-        p.text = "Generated by AI Strategy Factory"
-        p.font.size = Pt(14)
-        p.font.color.rgb = COLORS["gray"]
-        p.alignment = PP_ALIGN.CENTER
+        slide = prs.slides.add_slide(prs.slide_layouts.get_by_name(TITLE_LAYOUT))
+        slide.placeholders[TITLE_IDX].text = "Thank You"
+        self._remove_placeholder(slide, SUBTITLE_IDX)
+        slide.placeholders[CAPTION_IDX].text = "Generated by AI Strategy Factory"
 
     def _add_agenda_slide(self, prs: Presentation) -> None:
         """Add agenda slide for full presentation."""
@@ -754,7 +640,7 @@ class PowerPointGenerator:
             "Department-specific challenges"
         )
 
-        content = self._extract_content_section(synthesis, "02_pain_points")
+        content = self._extract_content_section(synthesis, "02_pain_points", "Pain Point Matrix by Department")
         table = self._extract_table_from_content(content)
 
         if table:
@@ -778,23 +664,11 @@ class PowerPointGenerator:
         if mermaid_images and "current_state" in mermaid_images:
             image_path = Path(mermaid_images["current_state"])
             if image_path.exists() and image_path.suffix == ".png":
-                slide.shapes.add_picture(
-                    str(image_path),
-                    Inches(1), Inches(1.5),
-                    width=Inches(11),
-                )
+                self._add_picture_to_slide(slide, image_path)
                 return
 
         # Fallback message
-        textbox = slide.shapes.add_textbox(
-            Inches(2), Inches(3), Inches(9), Inches(2)
-        )
-        tf = textbox.text_frame
-        p = tf.paragraphs[0]
-        p.text = "See mermaid_diagrams.md for architecture diagram"
-        p.font.size = Pt(20)
-        p.font.color.rgb = COLORS["gray"]
-        p.alignment = PP_ALIGN.CENTER
+        self._add_message_to_slide(slide, "See mermaid_diagrams.md for architecture diagram")
 
     def _add_maturity_detailed_slides(self, prs: Presentation, synthesis: SynthesisOutput) -> None:
         """Add detailed maturity assessment slides."""
@@ -821,7 +695,7 @@ class PowerPointGenerator:
             "Department-specific opportunities"
         )
 
-        content = self._extract_content_section(synthesis, "14_use_case_library")
+        content = self._extract_content_section(synthesis, "14_use_case_library", "Use Case Summary Matrix")
         table = self._extract_table_from_content(content)
 
         if table:
@@ -838,7 +712,7 @@ class PowerPointGenerator:
             "Implementation priorities"
         )
 
-        content = self._extract_content_section(synthesis, "06_quick_wins")
+        content = self._extract_content_section(synthesis, "06_quick_wins", "Quick Win Comparison Matrix")
         table = self._extract_table_from_content(content)
 
         if table:
@@ -875,22 +749,10 @@ class PowerPointGenerator:
         if mermaid_images and "future_state" in mermaid_images:
             image_path = Path(mermaid_images["future_state"])
             if image_path.exists() and image_path.suffix == ".png":
-                slide.shapes.add_picture(
-                    str(image_path),
-                    Inches(1), Inches(1.5),
-                    width=Inches(11),
-                )
+                self._add_picture_to_slide(slide, image_path)
                 return
 
-        textbox = slide.shapes.add_textbox(
-            Inches(2), Inches(3), Inches(9), Inches(2)
-        )
-        tf = textbox.text_frame
-        p = tf.paragraphs[0]
-        p.text = "See mermaid_diagrams.md for future state diagram"
-        p.font.size = Pt(20)
-        p.font.color.rgb = COLORS["gray"]
-        p.alignment = PP_ALIGN.CENTER
+        self._add_message_to_slide(slide, "See mermaid_diagrams.md for future state diagram")
 
     def _add_roi_detailed_slides(self, prs: Presentation, synthesis: SynthesisOutput) -> None:
         """Add detailed ROI slides."""
@@ -900,7 +762,7 @@ class PowerPointGenerator:
             "Cost-benefit breakdown"
         )
 
-        content = self._extract_content_section(synthesis, "09_roi_calculator")
+        content = self._extract_content_section(synthesis, "09_roi_calculator", "ROI Calculations")
         table = self._extract_table_from_content(content)
 
         if table:
@@ -917,7 +779,7 @@ class PowerPointGenerator:
             "Build vs Buy analysis"
         )
 
-        content = self._extract_content_section(synthesis, "07_vendor_comparison")
+        content = self._extract_content_section(synthesis, "07_vendor_comparison", "AI Platform Comparison")
         table = self._extract_table_from_content(content)
 
         if table:
@@ -0,0 +1,253 @@
+"""
+Themed slide template for the PowerPoint decks.
+
+The template is python-pptx's default presentation restyled once: 16:9
+slide size, theme colours, three named layouts whose placeholders carry
+the deck's fonts, colours and positions, and a table style. Slides are
+created from these layouts, so their text inherits its styling instead
+of having it set run by run. The .pptx bytes are built on first use (or
+by preload() as a generation worker starts) and shared by every deck the
+process generates.
+"""
+
+import threading
+from io import BytesIO
+from typing import List, Optional
+
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Inches, Pt
+
+# Color scheme
+COLORS = {
+    "dark_blue": RGBColor(31, 78, 121),      # Primary headers
+    "light_blue": RGBColor(68, 114, 196),    # Secondary elements
+    "gray": RGBColor(89, 89, 89),            # Subtitles
+    "dark_gray": RGBColor(64, 64, 64),       # Body text
+    "white": RGBColor(255, 255, 255),        # Light text
+    "light_bg": RGBColor(242, 242, 242),     # Light backgrounds
+    "accent": RGBColor(0, 176, 80),          # Success/highlights
+    "warning": RGBColor(255, 192, 0),        # Warnings
+}
+
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
+
+# Layout names
+TITLE_LAYOUT = "Strategy Title"
+SECTION_LAYOUT = "Strategy Section"
+CONTENT_LAYOUT = "Strategy Content"
+
+# Placeholder idx values
+TITLE_IDX = 0       # Title on every layout
+SUBTITLE_IDX = 1    # Title layout: deck title
+CAPTION_IDX = 13    # Title layout: date line; content layout: subtitle
+BODY_IDX = 14       # Content layout: bullet list
+
+# Applied to tables created on the deck's slides
+TABLE_STYLE_ID = "{8E2C6F4A-5B1D-4C3E-9A7F-2D6B1E0C4F31}"
+
+
+def _hex(name: str) -> str:
+    return str(COLORS[name])
+
+
+def _text_style(
+    size: int,
+    color: str,
+    bold: bool = False,
+    align: str = "l",
+    bullet: bool = False,
+    space_after: int = 0,
+) -> str:
+    """lstStyle level-1 paragraph properties."""
+    indent = 'marL="285750" indent="-285750"' if bullet else 'marL="0" indent="0"'
+    spacing = f'<a:spcAft><a:spcPts val="{space_after * 100}"/></a:spcAft>' if space_after else ""
+    marker = '<a:buFont typeface="Arial"/><a:buChar char="•"/>' if bullet else "<a:buNone/>"
+    return (
+        f'<a:lvl1pPr {indent} algn="{align}"><a:spcBef><a:spcPts val="0"/></a:spcBef>{spacing}{marker}'
+        f'<a:defRPr sz="{size * 100}" b="{1 if bold else 0}">'
+        f'<a:solidFill><a:srgbClr val="{_hex(color)}"/></a:solidFill></a:defRPr></a:lvl1pPr>'
+    )
+
+
+def _placeholder(
+    shape_id: int,
+    name: str,
+    ph: str,
+    box: tuple,
+    style: str,
+    anchor: str = "t",
+):
+    """A layout placeholder at box (left, top, width, height in inches)."""
+    left, top, width, height = (int(Inches(v)) for v in box)
+    return parse_xml(
+        f'<p:sp {nsdecls("a", "p")}>'
+        f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="{name}"/>'
+        f'<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr>{ph}</p:nvPr></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/></a:xfrm></p:spPr>'
+        f'<p:txBody><a:bodyPr wrap="square" anchor="{anchor}"><a:noAutofit/></a:bodyPr>'
+        f'<a:lstStyle>{style}</a:lstStyle><a:p><a:endParaRPr lang="en-US"/></a:p></p:txBody>'
+        f'</p:sp>'
+    )
+
+
+def _set_layout(layout, name: str, shapes: List, background: Optional[str] = None) -> None:
+    """Replace a layout's name, background and placeholders."""
+    c_sld = layout._element.cSld
+    c_sld.set("name", name)
+
+    if background:
+        bg = parse_xml(
+            f'<p:bg {nsdecls("a", "p")}><p:bgPr><a:solidFill><a:srgbClr val="{background}"/></a:solidFill>'
+            f'<a:effectLst/></p:bgPr></p:bg>'
+        )
+        c_sld.insert(0, bg)
+
+    sp_tree = c_sld.spTree
+    for shape in list(sp_tree)[2:]:  # Keep nvGrpSpPr and grpSpPr
+        sp_tree.remove(shape)
+    for shape in shapes:
+        sp_tree.append(shape)
+
+
+def _build_layouts(prs: Presentation) -> None:
+    """Turn three default layouts into the deck's layouts and drop the rest."""
+    layouts = list(prs.slide_layouts)
+    title, content, section = layouts[0], layouts[1], layouts[2]
+
+    _set_layout(title, TITLE_LAYOUT, [
+        _placeholder(2, "Company", '<p:ph type="ctrTitle"/>', (0.5, 2.5, 12.333, 1.5),
+                     _text_style(44, "dark_blue", bold=True, align="ctr")),
+        _placeholder(3, "Title", f'<p:ph type="subTitle" idx="{SUBTITLE_IDX}"/>', (0.5, 4, 12.333, 1),
+                     _text_style(32, "dark_gray", align="ctr")),
+        _placeholder(4, "Date", f'<p:ph type="body" sz="quarter" idx="{CAPTION_IDX}"/>', (0.5, 5, 12.333, 0.5),
+                     _text_style(18, "gray", align="ctr")),
+    ])
+
+    _set_layout(content, CONTENT_LAYOUT, [
+        _placeholder(2, "Title", '<p:ph type="title"/>', (0.5, 0.3, 12.333, 0.6),
+                     _text_style(28, "dark_blue", bold=True)),
+        _placeholder(3, "Subtitle", f'<p:ph type="body" sz="quarter" idx="{CAPTION_IDX}"/>', (0.5, 0.9, 12.333, 0.5),
+                     _text_style(16, "gray")),
+        _placeholder(4, "Body", f'<p:ph type="body" idx="{BODY_IDX}"/>', (0.5, 1.5, 12.333, 5.5),
+                     _text_style(18, "dark_gray", bullet=True, space_after=12)),
+    ])
+
+    _set_layout(section, SECTION_LAYOUT, [
+        _placeholder(2, "Title", '<p:ph type="title"/>', (0.5, 3, 12.333, 1.5),
+                     _text_style(40, "white", bold=True, align="ctr"), anchor="ctr"),
+    ], background=_hex("dark_blue"))
+
+    for layout in layouts[3:]:
+        prs.slide_layouts.remove(layout)
+
+
+def _set_default_text(prs: Presentation) -> None:
+    """Default text outside placeholders (tables, text boxes): 12pt body gray."""
+    other_style = prs.slide_master._element.find(qn("p:txStyles")).find(qn("p:otherStyle"))
+    for style in (other_style, prs.part._element.find(qn("p:defaultTextStyle"))):
+        if style is None:
+            continue
+        default = style.find(qn("a:lvl1pPr")).find(qn("a:defRPr"))
+        default.set("sz", str(int(Pt(12).centipoints)))
+
+
+def _edit_xml_part(part, edit) -> None:
+    """Apply edit() to the parsed XML of a part that python-pptx keeps as bytes."""
+    root = etree.fromstring(part.blob)
+    edit(root)
+    part._blob = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _theme_colors(theme) -> None:
+    scheme = theme.find(f"{qn('a:themeElements')}/{qn('a:clrScheme')}")
+    scheme.set("name", "Strategy Factory")
+    for slot, color in (
+        ("a:dk2", "dark_blue"),
+        ("a:lt2", "light_bg"),
+        ("a:accent1", "light_blue"),
+        ("a:accent2", "dark_blue"),
+        ("a:accent3", "accent"),
+        ("a:accent4", "warning"),
+    ):
+        element = scheme.find(qn(slot))
+        for child in list(element):
+            element.remove(child)
+        etree.SubElement(element, qn("a:srgbClr"), val=_hex(color))
+
+
+def _table_style(styles) -> None:
+    """Header row in dark blue, light banding on alternate body rows."""
+    border = "".join(
+        f'<a:{side}><a:ln w="12700"><a:solidFill><a:srgbClr val="{_hex("white")}"/></a:solidFill></a:ln></a:{side}>'
+        for side in ("left", "right", "top", "bottom", "insideH", "insideV")
+    )
+    styles.append(etree.fromstring(
+        f'<a:tblStyle {nsdecls("a")} styleId="{TABLE_STYLE_ID}" styleName="Strategy Factory">'
+        f'<a:wholeTbl><a:tcTxStyle><a:fontRef idx="minor"><a:prstClr val="black"/></a:fontRef>'
+        f'<a:srgbClr val="{_hex("dark_gray")}"/></a:tcTxStyle>'
+        f'<a:tcStyle><a:tcBdr>{border}</a:tcBdr><a:fill><a:solidFill><a:srgbClr val="{_hex("white")}"/>'
+        f'</a:solidFill></a:fill></a:tcStyle></a:wholeTbl>'
+        f'<a:band1H><a:tcStyle><a:tcBdr/><a:fill><a:solidFill><a:srgbClr val="{_hex("light_bg")}"/>'
+        f'</a:solidFill></a:fill></a:tcStyle></a:band1H>'
+        f'<a:firstRow><a:tcTxStyle b="on"><a:fontRef idx="minor"><a:prstClr val="black"/></a:fontRef>'
+        f'<a:srgbClr val="{_hex("white")}"/></a:tcTxStyle>'
+        f'<a:tcStyle><a:tcBdr/><a:fill><a:solidFill><a:srgbClr val="{_hex("dark_blue")}"/>'
+        f'</a:solidFill></a:fill></a:tcStyle></a:firstRow>'
+        f'</a:tblStyle>'
+    ))
+    styles.set("def", TABLE_STYLE_ID)
+
+
+def build_template() -> bytes:
+    """
+    Build the deck template.
+
+    Returns:
+        .pptx file contents with no slides.
+    """
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+
+    _build_layouts(prs)
+    _set_default_text(prs)
+    _edit_xml_part(prs.slide_master.part.part_related_by(RT.THEME), _theme_colors)
+    _edit_xml_part(prs.part.part_related_by(RT.TABLE_STYLES), _table_style)
+
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+_template: Optional[bytes] = None
+_template_lock = threading.Lock()
+
+
+def _load() -> bytes:
+    global _template
+
+    with _template_lock:
+        if _template is None:
+            _template = build_template()
+    return _template
+
+
+def preload() -> None:
+    """Build the template now, e.g. when a worker process starts."""
+    _load()
+
+
+def new_presentation() -> Presentation:
+    """
+    Open a fresh presentation from the shared template.
+
+    Returns:
+        Presentation with the deck layouts and no slides.
+    """
+    return Presentation(BytesIO(_load()))
@@ -0,0 +1,172 @@
+"""
+Generation stages and their dependencies.
+
+Each stage produces one artifact (or artifact group) from the synthesis
+output. Only the decks need the rendered mermaid images; everything else
+can be generated independently. run_stage() is a module-level function
+so it can be sent to a process pool: python-pptx and python-docx are
+CPU-bound and would otherwise serialize on the GIL. init_stage_worker()
+is the pool's initializer.
+"""
+
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..models import CompanyInput, ResearchOutput, SynthesisOutput
+
+from .markdown_generator import MarkdownGenerator
+from .mermaid_renderer import MermaidRenderer
+from .pptx_generator import PowerPointGenerator
+from .docx_generator import DocxGenerator
+from .docx_template import preload as preload_report_template
+from .pptx_template import preload as preload_deck_template
+
+# Stage -> stages whose output it needs. Insertion order is the order
+# artifacts are listed in the GenerationResult.
+STAGE_DEPENDENCIES: Dict[str, List[str]] = {
+    "markdown": [],
+    "mermaid": [],
+    "executive_summary_deck": ["mermaid"],
+    "full_findings_presentation": ["mermaid"],
+    "final_strategy_report": [],
+    "statement_of_work": [],
+}
+
+# Stages that build documents in Python and benefit from a separate process.
+# Markdown saving is file I/O and mermaid rendering waits on a subprocess,
+# so those stay in the parent.
+PROCESS_STAGES = frozenset({
+    "executive_summary_deck",
+    "full_findings_presentation",
+    "final_strategy_report",
+    "statement_of_work",
+})
+
+# Component names used in GenerationOrchestrator.errors
+STAGE_COMPONENTS: Dict[str, str] = {
+    "markdown": "markdown_generation",
+    "mermaid": "mermaid_rendering",
+    "executive_summary_deck": "executive_summary_pptx",
+    "full_findings_presentation": "full_findings_pptx",
+    "final_strategy_report": "strategy_report_docx",
+    "statement_of_work": "sow_docx",
+}
+
+# Progress messages: "Generating <label>" / "Finished <label>"
+STAGE_LABELS: Dict[str, str] = {
+    "markdown": "markdown files",
+    "mermaid": "mermaid diagrams",
+    "executive_summary_deck": "executive summary deck",
+    "full_findings_presentation": "full findings deck",
+    "final_strategy_report": "strategy report",
+    "statement_of_work": "statement of work",
+}
+
+
+def extract_diagram_names(content: str) -> List[str]:
+    """Extract diagram names from markdown headings."""
+    names = []
+    heading_pattern = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+
+    for match in heading_pattern.finditer(content):
+        heading = match.group(1).strip()
+        # Convert heading to snake_case for filename
+        name = re.sub(r'[^a-zA-Z0-9\s]', '', heading)
+        name = re.sub(r'\s+', '_', name).lower()
+        names.append(name)
+
+    return names if names else ["current_state", "future_state", "data_flow"]
+
+
+def init_stage_worker() -> None:
+    """
+    Prepare a worker process for document stages.
+
+    Runs once per worker (as the pool initializer), so templates are
+    built before the first stage arrives and reused by every later one.
+    """
+    preload_deck_template()
+    preload_report_template()
+
+
+def run_stage(
+    stage: str,
+    output_dir: Path,
+    company_slug: str,
+    company_input: CompanyInput,
+    research: ResearchOutput,
+    synthesis: SynthesisOutput,
+    mermaid_images: Optional[Dict[str, str]] = None,
+    abort_event: Optional[threading.Event] = None,
+) -> Dict[str, str]:
+    """
+    Generate one stage's artifacts.
+
+    Generators are created here rather than passed in, so the call only
+    carries picklable arguments and works the same in a worker process.
+
+    Args:
+        stage: Key of STAGE_DEPENDENCIES.
+        output_dir: Base output directory.
+        company_slug: URL-safe company name.
+        company_input: Original company input.
+        research: Research output.
+        synthesis: Synthesis output.
+        mermaid_images: Rendered diagrams (deck stages only).
+        abort_event: Stops mermaid rendering early (in-process only;
+                     events cannot be sent to a worker process).
+
+    Returns:
+        Dict mapping artifact keys to file paths.
+    """
+    if stage == "markdown":
+        return MarkdownGenerator(output_dir=output_dir).save_all(company_slug, synthesis)
+
+    if stage == "mermaid":
+        if "03_mermaid_diagrams" not in synthesis.deliverables:
+            return {}
+        mermaid_content = synthesis.deliverables["03_mermaid_diagrams"].content
+        if not mermaid_content:
+            return {}
+        renderer = MermaidRenderer(output_dir=output_dir, abort_event=abort_event)
+        images = renderer.render_from_markdown(
+            company_slug=company_slug,
+            markdown_content=mermaid_content,
+            diagram_names=extract_diagram_names(mermaid_content),
+        )
+        return {f"mermaid_{k}": v for k, v in images.items()}
+
+    if stage in ("executive_summary_deck", "full_findings_presentation"):
+        pptx_gen = PowerPointGenerator(output_dir=output_dir)
+        generate = (
+            pptx_gen.generate_executive_summary
+            if stage == "executive_summary_deck"
+            else pptx_gen.generate_full_findings
+        )
+        path = generate(
+            company_slug=company_slug,
+            company_input=company_input,
+            research=research,
+            synthesis=synthesis,
+            mermaid_images=mermaid_images or {},
+        )
+        return {stage: path}
+
+    if stage in ("final_strategy_report", "statement_of_work"):
+        docx_gen = DocxGenerator(output_dir=output_dir)
+        generate = (
+            docx_gen.generate_strategy_report
+            if stage == "final_strategy_report"
+            else docx_gen.generate_statement_of_work
+        )
+        path = generate(
+            company_slug=company_slug,
+            company_input=company_input,
+            research=research,
+            synthesis=synthesis,
+        )
+        return {stage: path}
+
+    raise ValueError(f"Unknown generation stage: {stage}")
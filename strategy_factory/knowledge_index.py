@@ -0,0 +1,270 @@
+"""
+Section index over the TLDR consulting guides.
+
+Each *_TLDR.md guide is split into heading-delimited sections. For every
+section the index records its byte range in the file, an estimated token
+count and its term counts, and persists all of it to a JSON sidecar.
+The sidecar entry for a guide is reused while the file's mtime and size
+are unchanged (or, if those changed, while its SHA-256 is), so guides are
+only re-split when they actually change. Ranking sections against a query
+is BM25Retriever's job (knowledge_retriever.py); it scores the stored
+term counts and reads just the matching byte ranges from disk through
+read_section().
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import KNOWLEDGE_INDEX_PATH, KNOWLEDGE_SECTION_MAX_TOKENS, TLDR_GUIDES_DIR
+from .text_utils import CHARS_PER_TOKEN, markdown_section_spans, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Bump when the sidecar layout or section splitting changes
+INDEX_VERSION = 2
+
+
+@dataclass
+class GuideSection:
+    """One heading-delimited section of a guide."""
+    guide: str
+    heading: str
+    position: int  # Index of the section within its guide
+    start: int  # Byte offsets into the guide file
+    end: int
+    tokens: int
+    terms: Dict[str, int] = field(default_factory=dict)  # term -> frequency (heading and body)
+
+
+@dataclass
+class _GuideEntry:
+    """Sidecar record for one guide file."""
+    mtime_ns: int
+    size: int
+    sha256: str
+    sections: List[GuideSection]
+
+
+class KnowledgeIndex:
+    """
+    Persistent, heading-level index of the TLDR guides.
+
+    Usage:
+        index = KnowledgeIndex()
+        for guide in index.guides():
+            for section in index.sections(guide):
+                print(guide, section.heading, index.read_section(section))
+    """
+
+    def __init__(
+        self,
+        guides_dir: Path = TLDR_GUIDES_DIR,
+        index_path: Path = KNOWLEDGE_INDEX_PATH,
+        max_section_tokens: int = KNOWLEDGE_SECTION_MAX_TOKENS,
+    ):
+        """
+        Initialize the index (loaded lazily on first use).
+
+        Args:
+            guides_dir: Path to TLDR guides directory
+            index_path: Path of the JSON sidecar
+            max_section_tokens: Sections larger than this are split at
+                                paragraph breaks
+        """
+        self.guides_dir = Path(guides_dir)
+        self.index_path = Path(index_path)
+        self.max_section_tokens = max_section_tokens
+
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, _GuideEntry]] = None
+
+    def refresh(self) -> bool:
+        """
+        Bring the index up to date with the guides directory.
+
+        Returns:
+            True if any guide was (re)indexed or removed
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_sidecar()
+
+            changed = False
+            present = {path.name: path for path in self.guides_dir.glob("*_TLDR.md")}
+
+            for name in list(self._entries):
+                if name not in present:
+                    del self._entries[name]
+                    changed = True
+
+            for name, path in sorted(present.items()):
+                entry = self._entries.get(name)
+                try:
+                    stat = path.stat()
+                except OSError as e:
+                    logger.warning(f"Cannot stat guide {name}: {e}")
+                    continue
+                if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                    continue
+
+                data = path.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if entry and entry.sha256 == digest:
+                    # Touched but unchanged: keep the sections
+                    entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                else:
+                    self._entries[name] = _GuideEntry(
+                        mtime_ns=stat.st_mtime_ns,
+                        size=stat.st_size,
+                        sha256=digest,
+                        sections=self._index_guide(name, data),
+                    )
+                    logger.debug(f"Indexed guide: {name}")
+                changed = True
+
+            if changed:
+                self._write_sidecar()
+            return changed
+
+    def _ensure_loaded(self) -> None:
+        if self._entries is None:
+            self.refresh()
+
+    def _index_guide(self, name: str, data: bytes) -> List[GuideSection]:
+        """Split one guide into sections with byte offsets and term counts."""
+        text = data.decode("utf-8", errors="replace")
+        sections = []
+        byte_offset = 0
+        char_offset = 0
+
+        for heading, start, end in markdown_section_spans(text, self.max_section_tokens):
+            # Spans are contiguous, so byte offsets advance incrementally
+            byte_offset += len(text[char_offset:start].encode("utf-8"))
+            byte_end = byte_offset + len(text[start:end].encode("utf-8"))
+            body = text[start:end]
+            counts = Counter(tokenize(f"{heading}\n{body}"))
+            sections.append(GuideSection(
+                guide=name,
+                heading=heading,
+                position=len(sections),
+                start=byte_offset,
+                end=byte_end,
+                tokens=max(1, len(body.strip()) // CHARS_PER_TOKEN),
+                terms=dict(counts),
+            ))
+            byte_offset, char_offset = byte_end, end
+
+        return sections
+
+    def _read_sidecar(self) -> Dict[str, _GuideEntry]:
+        """Load the sidecar, or start empty if missing, stale or unreadable."""
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable knowledge index {self.index_path}: {e}")
+            return {}
+
+        if raw.get("version") != INDEX_VERSION or raw.get("max_section_tokens") != self.max_section_tokens:
+            return {}
+
+        entries = {}
+        for name, entry in raw.get("guides", {}).items():
+            entries[name] = _GuideEntry(
+                mtime_ns=entry["mtime_ns"],
+                size=entry["size"],
+                sha256=entry["sha256"],
+                sections=[GuideSection(guide=name, **s) for s in entry["sections"]],
+            )
+        return entries
+
+    def _write_sidecar(self) -> None:
+        """Atomically write the sidecar."""
+        guides = {}
+        for name, entry in self._entries.items():
+            sections = []
+            for section in entry.sections:
+                record = asdict(section)
+                del record["guide"]
+                sections.append(record)
+            guides[name] = {
+                "mtime_ns": entry.mtime_ns,
+                "size": entry.size,
+                "sha256": entry.sha256,
+                "sections": sections,
+            }
+        payload = json.dumps({
+            "version": INDEX_VERSION,
+            "max_section_tokens": self.max_section_tokens,
+            "guides": guides,
+        }, ensure_ascii=False, separators=(",", ":"))
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_name, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not write knowledge index {self.index_path}: {e}")
+
+    def guides(self) -> List[str]:
+        """Get the indexed guide filenames."""
+        self._ensure_loaded()
+        return sorted(self._entries)
+
+    def sections(self, guide: str) -> List[GuideSection]:
+        """
+        Get every section of a guide, in document order.
+
+        Args:
+            guide: Guide filename
+
+        Returns:
+            Sections, or an empty list for unknown guides
+        """
+        self._ensure_loaded()
+        entry = self._entries.get(guide)
+        return list(entry.sections) if entry else []
+
+    def read_section(self, section: GuideSection) -> str:
+        """
+        Read a section's text from its guide file.
+
+        Only the section's byte range is read. If the guide changed since
+        it was indexed, the index is refreshed and the section re-resolved
+        by guide and position.
+
+        Args:
+            section: Section returned by sections()
+
+        Returns:
+            Section text (empty if the guide or section is gone)
+        """
+        path = self.guides_dir / section.guide
+        entry = self._entries.get(section.guide) if self._entries else None
+        try:
+            stat = path.stat()
+        except OSError:
+            return ""
+
+        if entry is None or entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+            self.refresh()
+            current = self.sections(section.guide)
+            if section.position >= len(current):
+                return ""
+            section = current[section.position]
+
+        with open(path, "rb") as f:
+            f.seek(section.start)
+            data = f.read(section.end - section.start)
+        return data.decode("utf-8", errors="replace").strip()
@@ -9,7 +9,15 @@ from pathlib import Path
 from typing import List, Dict, Optional, Set
 import logging
 
-from .config import TLDR_GUIDES_DIR, DELIVERABLES, TLDR_TOPIC_MAPPING
+from .config import (
+    TLDR_GUIDES_DIR,
+    DELIVERABLES,
+    TLDR_TOPIC_MAPPING,
+    KNOWLEDGE_INDEX_PATH,
+    KNOWLEDGE_TOP_N_SECTIONS,
+)
+from .knowledge_index import KnowledgeIndex
+from .knowledge_retriever import BM25Retriever
 
 logger = logging.getLogger(__name__)
 
@@ -21,26 +29,48 @@ class KnowledgeLoader:
     Usage:
         loader = KnowledgeLoader()
 
-        # Load guides for a specific deliverable
+        # Load the most relevant guide sections for a deliverable
         content = loader.load_for_deliverable("04_maturity_assessment")
 
-        # Load guides for a topic
+        # Load the most relevant guide sections for a topic
         content = loader.load_for_topic("maturity")
 
         # Load specific guides
         content = loader.load_guides(["bcg-wheres-the-value-in-ai_TLDR.md"])
     """
 
-    def __init__(self, guides_dir: Path = TLDR_GUIDES_DIR):
+    def __init__(
+        self,
+        guides_dir: Path = TLDR_GUIDES_DIR,
+        index_path: Path = KNOWLEDGE_INDEX_PATH,
+    ):
         """
         Initialize knowledge loader.
 
         Args:
             guides_dir: Path to TLDR guides directory
+            index_path: Path of the section index sidecar
         """
         self.guides_dir = Path(guides_dir)
+        self.index_path = Path(index_path)
         self._cache: Dict[str, str] = {}
         self._available_guides: Optional[List[str]] = None
+        self._index: Optional[KnowledgeIndex] = None
+        self._retriever: Optional[BM25Retriever] = None
+
+    @property
+    def index(self) -> KnowledgeIndex:
+        """Section index over the guides (built or loaded on first use)."""
+        if self._index is None:
+            self._index = KnowledgeIndex(self.guides_dir, self.index_path)
+        return self._index
+
+    @property
+    def retriever(self) -> BM25Retriever:
+        """BM25 retriever over the indexed guide sections."""
+        if self._retriever is None:
+            self._retriever = BM25Retriever(self.index)
+        return self._retriever
 
     @property
     def available_guides(self) -> List[str]:
@@ -99,15 +129,64 @@ class KnowledgeLoader:
 
         return "\n\n".join(contents)
 
-    def load_for_deliverable(self, deliverable_id: str) -> str:
+    def load_sections(
+        self,
+        filenames: List[str],
+        query: str,
+        top_n: int = KNOWLEDGE_TOP_N_SECTIONS,
+    ) -> str:
+        """
+        Load the sections of some guides most relevant to a query.
+
+        Args:
+            filenames: Guide filenames to search
+            query: Free text describing what is needed
+            top_n: Maximum sections to include
+
+        Returns:
+            Combined sections, grouped by guide in document order
+        """
+        matches = self.retriever.search(query, top_n=top_n, guides=filenames)
+        if not matches:
+            return ""
+
+        by_guide: Dict[str, list] = {}
+        for section, text, _ in matches:
+            by_guide.setdefault(section.guide, []).append((section, text))
+
+        contents = []
+        for filename in filenames:
+            passages = sorted(by_guide.get(filename, []), key=lambda p: p[0].position)
+            if not passages:
+                continue
+            header = f"\n{'='*60}\n# Source: {filename}\n{'='*60}\n"
+            parts = []
+            for section, text in passages:
+                if section.heading and not text.startswith("#"):
+                    # Continuation of a long section: restore its heading
+                    text = f"## {section.heading}\n{text}"
+                parts.append(text)
+            body = "\n\n".join(parts)
+            contents.append(header + body)
+
+        return "\n\n".join(contents)
+
+    def load_for_deliverable(
+        self,
+        deliverable_id: str,
+        top_n: Optional[int] = KNOWLEDGE_TOP_N_SECTIONS,
+        query: Optional[str] = None,
+    ) -> str:
         """
-        Load relevant guides for a specific deliverable.
+        Load relevant guide content for a specific deliverable.
 
         Args:
             deliverable_id: ID of the deliverable (e.g., "04_maturity_assessment")
+            top_n: Maximum sections to include; None loads the whole guides
+            query: Relevance query (defaults to the deliverable name)
 
         Returns:
-            Combined content of relevant guides
+            Combined content of the most relevant guide sections
         """
         deliverable_info = DELIVERABLES.get(deliverable_id, {})
         guide_files = deliverable_info.get("tldr_guides", [])
@@ -116,17 +195,28 @@ class KnowledgeLoader:
             logger.info(f"No specific guides for {deliverable_id}")
             return ""
 
-        return self.load_guides(guide_files)
+        if top_n is None:
+            return self.load_guides(guide_files)
 
-    def load_for_topic(self, topic: str) -> str:
+        query = query or deliverable_info.get("name", deliverable_id)
+        return self.load_sections(guide_files, query, top_n)
+
+    def load_for_topic(
+        self,
+        topic: str,
+        top_n: Optional[int] = KNOWLEDGE_TOP_N_SECTIONS,
+        query: Optional[str] = None,
+    ) -> str:
         """
-        Load guides relevant to a topic.
+        Load guide content relevant to a topic.
 
         Args:
             topic: Topic key from TLDR_TOPIC_MAPPING
+            top_n: Maximum sections to include; None loads the whole guides
+            query: Relevance query (defaults to the topic name)
 
         Returns:
-            Combined content of relevant guides
+            Combined content of the most relevant guide sections
         """
         guide_files = TLDR_TOPIC_MAPPING.get(topic, [])
 
@@ -134,7 +224,11 @@ class KnowledgeLoader:
             logger.warning(f"Unknown topic: {topic}")
             return ""
 
-        return self.load_guides(guide_files)
+        if top_n is None:
+            return self.load_guides(guide_files)
+
+        query = query or topic.replace("_", " ")
+        return self.load_sections(guide_files, query, top_n)
 
     def load_for_deliverables(self, deliverable_ids: List[str]) -> str:
         """
@@ -0,0 +1,187 @@
+"""
+BM25 retrieval over the indexed TLDR guide sections.
+
+Every section in the KnowledgeIndex becomes a document in a sparse
+inverted index, built from the term counts stored in the index sidecar,
+so building reads no guide text; only the returned passages are read
+from disk. Scoring is Okapi BM25; with NumPy/SciPy installed the
+per-term weights live in a sparse CSC matrix and a query is one sparse
+column slice and matrix-vector product, otherwise the same weights are
+kept in plain posting lists.
+"""
+
+import logging
+import math
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+from .knowledge_index import GuideSection, KnowledgeIndex
+from .text_utils import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Score multiplier for sections from preferred guides (e.g. the guides
+# configured for a deliverable), so the static mapping is a hint rather
+# than a filter
+PREFERRED_GUIDE_BOOST = 1.25
+
+
+class BM25Retriever:
+    """
+    Lexical retriever over guide sections.
+
+    Usage:
+        retriever = BM25Retriever(KnowledgeIndex())
+        for section, text, score in retriever.search("healthcare claims automation", top_n=8):
+            ...
+    """
+
+    def __init__(self, index: KnowledgeIndex, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize the retriever (built lazily on first search).
+
+        Args:
+            index: Section index to retrieve from
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.index = index
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.Lock()
+        self._built = False
+        self._sections: List[GuideSection] = []
+        self._vocabulary: Dict[str, int] = {}
+        self._idf: List[float] = []
+        self._matrix = None  # scipy CSC (documents x terms), when available
+        self._postings: Dict[int, List[Tuple[int, float]]] = {}
+
+    def refresh(self) -> None:
+        """Rebuild if the underlying index changed (or was never built)."""
+        changed = self.index.refresh()
+        with self._lock:
+            if changed or not self._built:
+                self._build()
+
+    def _build(self) -> None:
+        """Build BM25 term weights for every indexed section."""
+        sections = [
+            section
+            for guide in self.index.guides()
+            for section in self.index.sections(guide)
+        ]
+
+        counts = [section.terms for section in sections]
+        lengths = [sum(c.values()) for c in counts]
+        avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+        vocabulary: Dict[str, int] = {}
+        document_frequency: Counter = Counter()
+        for c in counts:
+            document_frequency.update(c.keys())
+            for term in c:
+                vocabulary.setdefault(term, len(vocabulary))
+
+        n = len(sections)
+        idf = [0.0] * len(vocabulary)
+        for term, col in vocabulary.items():
+            df = document_frequency[term]
+            idf[col] = math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+        rows, cols, weights = [], [], []
+        for row, (c, length) in enumerate(zip(counts, lengths)):
+            norm = self.k1 * (1 - self.b + self.b * length / avg_length) if avg_length else self.k1
+            for term, tf in c.items():
+                rows.append(row)
+                cols.append(vocabulary[term])
+                weights.append(tf * (self.k1 + 1) / (tf + norm))
+
+        self._sections = sections
+        self._vocabulary, self._idf = vocabulary, idf
+
+        if HAS_SCIPY:
+            self._matrix = sparse.csc_matrix(
+                (np.asarray(weights, dtype=np.float64), (rows, cols)),
+                shape=(n, len(vocabulary)),
+            )
+            self._idf_array = np.asarray(idf, dtype=np.float64)
+            self._postings = {}
+        else:
+            self._matrix = None
+            postings: Dict[int, List[Tuple[int, float]]] = {}
+            for row, col, weight in zip(rows, cols, weights):
+                postings.setdefault(col, []).append((row, weight))
+            self._postings = postings
+
+        self._built = True
+        logger.debug(f"BM25 index built: {n} sections, {len(vocabulary)} terms")
+
+    def _score(self, columns: List[int]) -> Dict[int, float]:
+        """BM25 score of every document matching any of the term columns."""
+        if self._matrix is not None:
+            scores = self._matrix[:, columns] @ self._idf_array[columns]
+            matched = np.flatnonzero(scores)
+            return dict(zip(matched.tolist(), scores[matched].tolist()))
+
+        scores: Dict[int, float] = {}
+        for col in columns:
+            idf = self._idf[col]
+            for row, weight in self._postings.get(col, []):
+                scores[row] = scores.get(row, 0.0) + idf * weight
+        return scores
+
+    def search(
+        self,
+        query: str,
+        top_n: int = 8,
+        guides: Optional[Iterable[str]] = None,
+        preferred_guides: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[GuideSection, str, float]]:
+        """
+        Find the passages most relevant to a query.
+
+        Args:
+            query: Free text (industry, pain points, deliverable name, ...)
+            top_n: Maximum passages to return
+            guides: Optional guide filenames to restrict the search to
+            preferred_guides: Guides whose sections get PREFERRED_GUIDE_BOOST
+
+        Returns:
+            (section, text, score) triples, best first
+        """
+        if not self._built:
+            self.refresh()
+
+        columns = sorted({
+            self._vocabulary[term] for term in tokenize(query)
+            if term in self._vocabulary
+        })
+        if not columns:
+            return []
+
+        allowed = set(guides) if guides is not None else None
+        preferred = set(preferred_guides or [])
+
+        ranked = []
+        for row, score in self._score(columns).items():
+            section = self._sections[row]
+            if allowed is not None and section.guide not in allowed:
+                continue
+            if section.guide in preferred:
+                score *= PREFERRED_GUIDE_BOOST
+            ranked.append((score, row))
+        ranked.sort(key=lambda pair: (-pair[0], pair[1]))
+
+        return [
+            (self._sections[row], self.index.read_section(self._sections[row]), score)
+            for score, row in ranked[:top_n]
+        ]
@@ -133,6 +133,16 @@ Examples:
             action="store_true",
             help="Skip final document generation (PPTX, DOCX)",
         )
+        run_parser.add_argument(
+            "--async-io",
+            action="store_true",
+            help="Run research queries on the async Perplexity client (pooled connections)",
+        )
+        run_parser.add_argument(
+            "--no-synthesis-cache",
+            action="store_true",
+            help="Regenerate every deliverable instead of reusing cached Gemini responses",
+        )
         run_parser.add_argument(
             "--verbose", "-v",
             action="store_true",
@@ -146,6 +156,11 @@ Examples:
         resume_parser.add_argument(
             "company", type=str, help="Company name"
         )
+        resume_parser.add_argument(
+            "--no-synthesis-cache",
+            action="store_true",
+            help="Regenerate every deliverable instead of reusing cached Gemini responses",
+        )
         resume_parser.add_argument(
             "--verbose", "-v",
             action="store_true",
@@ -249,7 +264,9 @@ Examples:
         try:
             # Phase 1: Research
             if not args.skip_research:
-                research_output = self._run_research(tracker, company_input, mode)
+                research_output = self._run_research(
+                    tracker, company_input, mode, async_io=args.async_io
+                )
                 if not research_output:
                     return 1
             else:
@@ -261,7 +278,10 @@ Examples:
 
             # Phase 2: Synthesis
             if not args.skip_synthesis:
-                synthesis_output = self._run_synthesis(tracker, company_input, research_output)
+                synthesis_output = self._run_synthesis(
+                    tracker, company_input, research_output,
+                    use_cache=not args.no_synthesis_cache,
+                )
                 if not synthesis_output:
                     return 1
             else:
@@ -345,7 +365,10 @@ Examples:
             # Resume synthesis if needed
             if not all_markdown_done:
                 print("Resuming synthesis phase...")
-                synthesis_output = self._run_synthesis(tracker, company_input, research_output)
+                synthesis_output = self._run_synthesis(
+                    tracker, company_input, research_output,
+                    use_cache=not args.no_synthesis_cache,
+                )
                 if not synthesis_output:
                     return 1
             else:
@@ -484,6 +507,7 @@ Examples:
         tracker: ProgressTracker,
         company_input: CompanyInput,
         mode: ResearchMode,
+        async_io: bool = False,
     ) -> Optional[ResearchOutput]:
         """Execute the research phase."""
         print("Phase 1: Research")
@@ -502,6 +526,7 @@ Examples:
                 mode=mode,
                 cache_dir=Path(tracker.output_dir),
                 progress_callback=progress_callback,
+                async_io=async_io,
             )
 
             research_output = orchestrator.research(company_input)
@@ -534,6 +559,7 @@ Examples:
         tracker: ProgressTracker,
         company_input: CompanyInput,
         research: ResearchOutput,
+        use_cache: bool = True,
     ) -> Optional:
         """Execute the synthesis phase."""
         from strategy_factory.synthesis.orchestrator import SynthesisOrchestrator
@@ -553,6 +579,7 @@ Examples:
             orchestrator = SynthesisOrchestrator(
                 output_dir=OUTPUT_DIR,
                 progress_callback=progress_callback,
+                use_cache=use_cache,
             )
 
             synthesis_output = orchestrator.synthesize(company_input, research)
@@ -575,6 +602,14 @@ Examples:
             print(f"\n  ✓ Synthesis complete")
             print(f"    Deliverables: {completed_count}")
             print(f"    Cost: ${cost_summary['total_cost']:.4f}")
+            if cost_summary.get("cache_hits"):
+                print(f"    Reused from cache: {cost_summary['cache_hits']}")
+            timing = orchestrator.get_timing_summary()
+            if timing:
+                print(f"    Time: {timing['wall_time']:.0f}s "
+                      f"(serial {timing['serial_time']:.0f}s, "
+                      f"critical path {timing['critical_path_time']:.0f}s)")
+                print(f"    Critical path: {' → '.join(timing['critical_path'])}")
             if orchestrator.errors:
                 print(f"    Errors: {len(orchestrator.errors)}")
             print()
@@ -729,7 +764,8 @@ Examples:
         print(f"    │   ├── final_strategy_report.docx")
         print(f"    │   └── statement_of_work.docx")
         print(f"    ├── state.json")
-        print(f"    └── research_cache.json")
+        print(f"    ├── research_cache.json")
+        print(f"    └── research_cache.sqlite3")
 
         # Total estimates
         print("\nTotal Estimated Cost:")
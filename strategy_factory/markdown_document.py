@@ -0,0 +1,434 @@
+"""
+Parsed model of a markdown deliverable.
+
+A deliverable is parsed once into blocks (headings, paragraphs, list
+items, tables, fenced code) and a heading outline. The Word, PowerPoint
+and markdown generators all read from this model instead of re-scanning
+the raw text with their own regexes; DeliverableContent.document caches
+it per deliverable.
+"""
+
+import difflib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Block kinds
+HEADING = "heading"
+PARAGRAPH = "paragraph"
+BULLET = "bullet"
+NUMBERED = "numbered"
+TABLE = "table"
+CODE = "code"
+
+# Line-only kinds (never stored as blocks)
+BLANK = "blank"
+RULE = "rule"
+FENCE = "fence"
+TABLE_ROW = "table_row"
+
+# Longer "table" lines are corrupted model output: dropped, ending the table
+MAX_TABLE_LINE_LENGTH = 1000
+
+# Minimum difflib similarity for a fuzzy heading match
+HEADING_MATCH_CUTOFF = 0.6
+
+_RULE_RE = re.compile(r'^[-*_]{3,}\s*$')
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_BULLET_RE = re.compile(r'^[-*+]\s+(.+)$')
+_NUMBERED_RE = re.compile(r'^\d+\.\s+(.+)$')
+
+# (kind, text, heading level)
+LineToken = Tuple[str, str, int]
+
+
+def _classify_heading(line: str) -> LineToken:
+    match = _HEADING_RE.match(line)
+    if match:
+        return HEADING, match.group(2), len(match.group(1))
+    return PARAGRAPH, line, 0
+
+
+def _classify_rule_or_bullet(line: str) -> LineToken:
+    if _RULE_RE.match(line):
+        return RULE, line, 0
+    match = _BULLET_RE.match(line)
+    if match:
+        return BULLET, match.group(1), 0
+    return PARAGRAPH, line, 0
+
+
+def _classify_rule(line: str) -> LineToken:
+    if _RULE_RE.match(line):
+        return RULE, line, 0
+    return PARAGRAPH, line, 0
+
+
+def _classify_bullet(line: str) -> LineToken:
+    match = _BULLET_RE.match(line)
+    if match:
+        return BULLET, match.group(1), 0
+    return PARAGRAPH, line, 0
+
+
+def _classify_numbered(line: str) -> LineToken:
+    match = _NUMBERED_RE.match(line)
+    if match:
+        return NUMBERED, match.group(1), 0
+    return PARAGRAPH, line, 0
+
+
+def _classify_fence(line: str) -> LineToken:
+    if line.startswith("```"):
+        return FENCE, line[3:].strip().lower(), 0
+    return PARAGRAPH, line, 0
+
+
+def _classify_table_row(line: str) -> LineToken:
+    if line.endswith("|"):
+        return TABLE_ROW, line, 0
+    return PARAGRAPH, line, 0
+
+
+# First character -> classifier. Each markdown construct is recognised by
+# its leading character, so a line is only tried against the patterns
+# that can match it; anything else is a paragraph.
+_LINE_CLASSIFIERS = {
+    "#": _classify_heading,
+    "-": _classify_rule_or_bullet,
+    "*": _classify_rule_or_bullet,
+    "_": _classify_rule,
+    "+": _classify_bullet,
+    "`": _classify_fence,
+    "|": _classify_table_row,
+}
+_LINE_CLASSIFIERS.update(dict.fromkeys("0123456789", _classify_numbered))
+
+
+def classify_line(line: str) -> LineToken:
+    """
+    Classify one stripped line.
+
+    Args:
+        line: Line with surrounding whitespace removed.
+
+    Returns:
+        (kind, text, level): text is the heading/list item text, the
+        lowercased info string for a fence, otherwise the line itself.
+    """
+    if not line:
+        return BLANK, line, 0
+    classifier = _LINE_CLASSIFIERS.get(line[0])
+    if classifier is None:
+        return PARAGRAPH, line, 0
+    return classifier(line)
+
+
+_LINK_TEXT_RE = re.compile(r'\[([^\]]+)\]\([^)]*\)')
+_ENUMERATION_RE = re.compile(r'^(?:(?:section|part|step)\s+)?(?:\d+|[ivx]+|[a-z])[.):]\s+')
+_NON_WORD_RE = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_heading(heading: str) -> str:
+    """
+    Reduce a heading to a lookup key.
+
+    Drops inline markdown, a leading enumeration ("2.", "iv)", "Step 3:")
+    and punctuation, so "## 2. **Pain Point Matrix** by Department"
+    and "pain point matrix by department" share a key.
+    """
+    text = _LINK_TEXT_RE.sub(r'\1', heading).lower().replace("&", " and ")
+    text = _ENUMERATION_RE.sub("", text.strip(" *_`#"))
+    return _NON_WORD_RE.sub(" ", text).strip()
+
+
+def is_horizontal_rule(line: str) -> bool:
+    """Whether a line is a markdown horizontal rule (---, ***, ___)."""
+    return bool(_RULE_RE.match(line.strip()))
+
+
+def split_table_row(line: str) -> List[str]:
+    """Split a markdown table row into stripped cell texts."""
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+@dataclass
+class Block:
+    """One structural element of a markdown document."""
+    kind: str
+    text: str = ""  # Heading/list/paragraph text (inline markdown kept); code body
+    level: int = 0  # Heading level
+    language: str = ""  # Code fence info string, lowercased
+    lines: List[str] = field(default_factory=list)  # Table rows or code lines
+    line: int = 0  # Source line index where the block starts
+
+    @property
+    def headers(self) -> List[str]:
+        """Header cells of a table block."""
+        return split_table_row(self.lines[0]) if self.lines else []
+
+    @property
+    def rows(self) -> List[List[str]]:
+        """Body rows of a table block (the separator row is skipped)."""
+        return [split_table_row(line) for line in self.lines[2:]]
+
+
+def bullet_texts(blocks: List[Block], max_items: Optional[int] = None) -> List[str]:
+    """
+    Bullet item texts from a run of blocks.
+
+    Args:
+        blocks: Blocks to scan (a whole document or one section).
+        max_items: Optional limit.
+
+    Returns:
+        Bullet texts with inline markdown kept.
+    """
+    items = [block.text.strip() for block in blocks if block.kind == BULLET]
+    return items[:max_items] if max_items is not None else items
+
+
+def first_table(blocks: List[Block]) -> Optional[Dict[str, List]]:
+    """
+    First table in a run of blocks, as headers and rows.
+
+    Rows with a different cell count than the header are dropped.
+
+    Returns:
+        {"headers": [...], "rows": [[...], ...]}, or None if the first
+        table has no body rows
+    """
+    for block in blocks:
+        if block.kind != TABLE:
+            continue
+        if len(block.lines) < 3:
+            return None
+        headers = block.headers
+        rows = [row for row in block.rows if len(row) == len(headers)]
+        return {"headers": headers, "rows": rows}
+    return None
+
+
+@dataclass
+class Section:
+    """A heading and the blocks up to the next heading of the same or higher rank."""
+    heading: str
+    level: int
+    index: int  # Position of the heading block in MarkdownDocument.blocks
+    start_line: int  # First body line (after the heading)
+    end_line: int  # Exclusive
+    end_block: int  # Exclusive index into MarkdownDocument.blocks
+
+
+class MarkdownDocument:
+    """
+    Markdown deliverable parsed in a single pass.
+
+    Usage:
+        doc = MarkdownDocument(content)
+        for block in doc.blocks:
+            ...
+        doc.bullets(max_items=6)
+        doc.first_table()
+        doc.section_text("Quick Wins")
+        first_table(doc.section_blocks(doc.find_section("ROI")))
+    """
+
+    def __init__(self, text: str):
+        """
+        Parse markdown text.
+
+        Args:
+            text: Markdown content.
+        """
+        self.text = text
+        self.lines = text.split("\n")
+        self.front_matter: List[str] = []
+        self.blocks: List[Block] = []
+        self.sections: List[Section] = []
+        # Normalized heading -> first section with it (level 2 and deeper)
+        self.heading_index: Dict[str, Section] = {}
+        self._lookups: Dict[str, Optional[Section]] = {}
+        self._parse()
+        self._build_sections()
+
+    def _parse(self) -> None:
+        """Classify every line once and group lines into blocks."""
+        lines = self.lines
+        blocks = self.blocks
+        i = 0
+
+        # YAML front matter (only at the very start)
+        if lines and lines[0].strip() == "---":
+            i = 1
+            while i < len(lines) and lines[i].strip() != "---":
+                self.front_matter.append(lines[i])
+                i += 1
+            i += 1
+
+        table: Optional[Block] = None
+        append = blocks.append
+
+        while i < len(lines):
+            stripped = lines[i].strip()
+            kind, text, level = classify_line(stripped)
+
+            # Horizontal rules are dropped (and do not interrupt a table)
+            if kind == RULE:
+                i += 1
+                continue
+
+            if kind == TABLE_ROW:
+                if len(stripped) > MAX_TABLE_LINE_LENGTH:
+                    table = None
+                elif table is None:
+                    table = Block(kind=TABLE, lines=[stripped], line=i)
+                    append(table)
+                else:
+                    table.lines.append(stripped)
+                i += 1
+                continue
+            table = None
+
+            if kind == FENCE:
+                start = i
+                i += 1
+                code_lines = []
+                while i < len(lines) and not lines[i].strip().startswith("```"):
+                    code_lines.append(lines[i])
+                    i += 1
+                i += 1  # Closing fence
+                append(Block(
+                    kind=CODE,
+                    text="\n".join(code_lines).strip(),
+                    language=text,
+                    lines=code_lines,
+                    line=start,
+                ))
+                continue
+
+            if kind != BLANK:
+                append(Block(kind=kind, text=text, level=level, line=i))
+            i += 1
+
+    def _build_sections(self) -> None:
+        """Pair each heading with the span it governs."""
+        open_sections: List[Section] = []
+
+        def close(level: int, end_line: int, end_block: int) -> None:
+            while open_sections and open_sections[-1].level >= level:
+                section = open_sections.pop()
+                section.end_line = end_line
+                section.end_block = end_block
+
+        for index, block in enumerate(self.blocks):
+            if block.kind != HEADING:
+                continue
+            close(block.level, block.line, index)
+            section = Section(
+                heading=block.text.strip(),
+                level=block.level,
+                index=index,
+                start_line=block.line + 1,
+                end_line=len(self.lines),
+                end_block=len(self.blocks),
+            )
+            self.sections.append(section)
+            open_sections.append(section)
+            if block.level >= 2:
+                self.heading_index.setdefault(normalize_heading(section.heading), section)
+
+        close(0, len(self.lines), len(self.blocks))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def bullets(self, max_items: Optional[int] = None) -> List[str]:
+        """Bullet item texts across the whole document."""
+        return bullet_texts(self.blocks, max_items)
+
+    def tables(self) -> List[Block]:
+        """Table blocks with a header, separator and at least one row."""
+        return [block for block in self.blocks if block.kind == TABLE and len(block.lines) >= 3]
+
+    def first_table(self) -> Optional[Dict[str, List]]:
+        """First table in the document (see first_table())."""
+        return first_table(self.blocks)
+
+    def code_blocks(self, language: Optional[str] = None) -> List[Block]:
+        """Fenced code blocks, optionally only those of one language."""
+        return [
+            block for block in self.blocks
+            if block.kind == CODE and (language is None or block.language.startswith(language))
+        ]
+
+    def find_section(self, name: str, fuzzy: bool = True) -> Optional[Section]:
+        """
+        Find a section (level 2 or deeper) by heading.
+
+        Headings are compared after normalize_heading(). An exact match
+        wins, then the first heading starting with name, then (if fuzzy)
+        the closest heading by difflib similarity. Results are memoized,
+        so repeated lookups are dictionary hits.
+
+        Args:
+            name: Heading text, e.g. "Quick Win Comparison Matrix".
+            fuzzy: Allow approximate matches.
+
+        Returns:
+            Section or None
+        """
+        key = normalize_heading(name)
+        memo_key = key if fuzzy else "\0" + key
+        if memo_key in self._lookups:
+            return self._lookups[memo_key]
+
+        section = self.heading_index.get(key)
+        if section is None and key:
+            section = next(
+                (candidate for heading, candidate in self.heading_index.items() if heading.startswith(key)),
+                None,
+            )
+        if section is None and key and fuzzy:
+            matches = difflib.get_close_matches(key, list(self.heading_index), n=1, cutoff=HEADING_MATCH_CUTOFF)
+            if matches:
+                section = self.heading_index[matches[0]]
+
+        self._lookups[memo_key] = section
+        return section
+
+    def section_blocks(self, section: Section) -> List[Block]:
+        """Blocks inside a section, excluding its heading."""
+        return self.blocks[section.index + 1:section.end_block]
+
+    def section_text(self, name: str) -> Optional[str]:
+        """Raw markdown under a heading, or None if there is no such section."""
+        section = self.find_section(name)
+        if section is None:
+            return None
+        return "\n".join(self.lines[section.start_line:section.end_line]).strip()
+
+    def flat_sections(self, max_level: int = 3, preamble: str = "introduction") -> Dict[str, str]:
+        """
+        Split the raw text at headings up to max_level.
+
+        Each entry holds the text from one such heading to the next
+        (deeper headings stay inside). Text before the first heading is
+        keyed by preamble.
+
+        Returns:
+            Dict of heading text -> section text
+        """
+        result: Dict[str, str] = {}
+        boundaries: List[Tuple[str, int, int]] = [(preamble, 0, 0)]
+        for block in self.blocks:
+            if block.kind == HEADING and block.level <= max_level:
+                boundaries.append((block.text.strip(), block.line, block.line + 1))
+
+        for n, (heading, line, body_start) in enumerate(boundaries):
+            end = boundaries[n + 1][1] if n + 1 < len(boundaries) else len(self.lines)
+            body = self.lines[body_start:end]
+            if body:
+                result[heading] = "\n".join(body).strip()
+        return result
@@ -11,7 +11,9 @@ These models define the structure for:
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .markdown_document import MarkdownDocument
 
 
 # ============================================================================
@@ -193,8 +195,19 @@ class DeliverableContent(BaseModel):
     file_path: Optional[str] = None
     generated_at: Optional[datetime] = None
     synthesis_cost: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
     error: Optional[str] = None
 
+    _document: Optional[MarkdownDocument] = PrivateAttr(default=None)
+
+    @property
+    def document(self) -> MarkdownDocument:
+        """Parsed content, built on first use and rebuilt if content is replaced."""
+        if self._document is None or self._document.text is not self.content:
+            self._document = MarkdownDocument(self.content)
+        return self._document
+
 
 class SynthesisOutput(BaseModel):
     """Complete synthesis output."""
@@ -290,3 +303,5 @@ class GenerationResult(BaseModel):
     total_cost: float = 0.0
     generation_time: float = 0.0  # seconds
     errors: List[str] = Field(default_factory=list)
+    artifact_timings: Dict[str, float] = Field(default_factory=dict)  # stage -> seconds
+    artifact_errors: Dict[str, str] = Field(default_factory=dict)  # stage -> error message
@@ -0,0 +1,157 @@
+"""
+Token-bucket rate limiting shared by the API clients.
+
+A single bucket can be shared by any number of threads, so concurrent
+research or synthesis requests are throttled against one budget instead
+of each caller sleeping on its own fixed delay. PerMinuteQuota pairs a
+request bucket with a token bucket for per-minute API quotas.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers reserve tokens up front, so waits are assigned in arrival order
+    and the sleep happens outside the lock.
+
+    Usage:
+        bucket = TokenBucket(rate=1.0, capacity=5)
+        bucket.acquire()  # Blocks until a token is available
+        await bucket.acquire_async()  # Same, without blocking the event loop
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum burst size. Defaults to one second of tokens.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Reserve tokens and return how long the caller must wait.
+
+        The balance is allowed to go negative so later callers queue
+        behind earlier reservations.
+        """
+        tokens = min(float(tokens), self.capacity)
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until the requested tokens are available.
+
+        Args:
+            tokens: Number of tokens to take (clamped to capacity).
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Wait for the requested tokens without blocking the event loop.
+
+        Args:
+            tokens: Number of tokens to take (clamped to capacity).
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class PerMinuteQuota:
+    """
+    Requests-per-minute plus tokens-per-minute limit.
+
+    Each call takes one request and the call's estimated tokens; the wait
+    is whichever bucket is further behind. Buckets allow a burst of up to
+    ``burst_seconds`` worth of quota.
+
+    Usage:
+        quota = PerMinuteQuota(requests_per_minute=15, tokens_per_minute=1_000_000)
+        quota.acquire(tokens=estimated_prompt_tokens)
+        await quota.acquire_async(tokens=estimated_prompt_tokens)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        burst_seconds: float = 10.0,
+    ):
+        """
+        Initialize the quota.
+
+        Args:
+            requests_per_minute: Requests allowed per minute.
+            tokens_per_minute: Tokens allowed per minute.
+            burst_seconds: Seconds of quota that may be used back-to-back.
+        """
+        self.requests = TokenBucket(
+            rate=requests_per_minute / 60,
+            capacity=max(1.0, requests_per_minute / 60 * burst_seconds),
+        )
+        self.tokens = TokenBucket(
+            rate=tokens_per_minute / 60,
+            capacity=max(1.0, tokens_per_minute / 60 * burst_seconds),
+        )
+
+    def acquire(self, tokens: float = 0.0) -> float:
+        """
+        Block until one request and ``tokens`` tokens are available.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = max(self.requests._reserve(1), self.tokens._reserve(tokens) if tokens else 0.0)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 0.0) -> float:
+        """
+        Wait for one request and ``tokens`` tokens without blocking the event loop.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = max(self.requests._reserve(1), self.tokens._reserve(tokens) if tokens else 0.0)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
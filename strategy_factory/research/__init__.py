@@ -10,15 +10,27 @@ including:
 - Regulatory context
 """
 
-from .perplexity_client import PerplexityClient
-from .query_templates import QueryTemplates
+from .perplexity_client import PerplexityClient, AsyncPerplexityClient
+from .cache_store import (
+    ResearchCacheStore,
+    MemoryCacheStore,
+    SQLiteCacheStore,
+    get_shared_research_cache,
+)
+from .query_templates import QueryTemplates, CacheScope
 from .model_selector import ModelSelector
 from .orchestrator import ResearchOrchestrator
 from .result_processor import ResultProcessor
 
 __all__ = [
     "PerplexityClient",
+    "AsyncPerplexityClient",
+    "ResearchCacheStore",
+    "MemoryCacheStore",
+    "SQLiteCacheStore",
+    "get_shared_research_cache",
     "QueryTemplates",
+    "CacheScope",
     "ModelSelector",
     "ResearchOrchestrator",
     "ResultProcessor",
@@ -0,0 +1,461 @@
+"""
+Pluggable storage backends for the Perplexity query cache.
+
+Each entry is keyed by PerplexityClient._get_cache_key and read or
+written individually, so a search costs O(1) cache I/O regardless of how
+many results are already cached. Expiry is enforced by the store itself.
+
+Backends:
+- MemoryCacheStore: process-local dict (used when no cache_dir is set)
+- SQLiteCacheStore: single-file on-disk index with lazy deserialization,
+  optional entry/byte caps with LRU eviction
+
+Industry-scoped queries (those that do not mention the company) also go
+to a process-shared store, see get_shared_research_cache().
+
+Caches written by older versions (cache_dir/research_cache.json) are
+imported into the SQLite store the first time it is opened, then removed.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config import (
+    SHARED_RESEARCH_CACHE_PATH,
+    SHARED_RESEARCH_CACHE_MAX_BYTES,
+    SHARED_RESEARCH_CACHE_MAX_ENTRIES,
+)
+from ..models import QueryResult
+
+
+class ResearchCacheStore(ABC):
+    """
+    Interface for query result cache backends.
+    
+    Implementations must be safe to call from multiple threads.
+    Hit/miss/eviction counters are kept per store instance.
+    """
+    
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[QueryResult]:
+        """
+        Get an unexpired result by cache key.
+        
+        Args:
+            key: Cache key.
+        
+        Returns:
+            QueryResult, or None if missing or expired.
+        """
+        result = self._fetch(key)
+        with self._stats_lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+    
+    @abstractmethod
+    def _fetch(self, key: str) -> Optional[QueryResult]:
+        """Backend lookup used by get()."""
+    
+    @abstractmethod
+    def put(self, key: str, query: str, result: QueryResult, ttl_hours: float) -> None:
+        """
+        Store a result.
+        
+        Args:
+            key: Cache key.
+            query: Query text (kept for inspection).
+            result: Result to cache.
+            ttl_hours: Hours until the entry expires.
+        """
+    
+    @abstractmethod
+    def count(self) -> int:
+        """Number of unexpired entries."""
+    
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """
+        Remove expired entries.
+        
+        Returns:
+            Number of entries removed.
+        """
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+    
+    def close(self) -> None:
+        """Release any resources held by the store."""
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for this store."""
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": self.count(),
+            }
+
+
+@dataclass
+class _MemoryEntry:
+    """In-memory cache entry."""
+    query: str
+    result: QueryResult
+    expires_at: float
+
+
+class MemoryCacheStore(ResearchCacheStore):
+    """Process-local cache store."""
+    
+    def __init__(self):
+        super().__init__()
+        self._entries: Dict[str, _MemoryEntry] = {}
+        self._lock = threading.Lock()
+    
+    def _fetch(self, key: str) -> Optional[QueryResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return entry.result
+    
+    def put(self, key: str, query: str, result: QueryResult, ttl_hours: float) -> None:
+        with self._lock:
+            self._entries[key] = _MemoryEntry(
+                query=query,
+                result=result,
+                expires_at=time.time() + ttl_hours * 3600,
+            )
+    
+    def count(self) -> int:
+        now = time.time()
+        with self._lock:
+            return sum(1 for e in self._entries.values() if e.expires_at > now)
+    
+    def purge_expired(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+            return len(expired)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheStore(ResearchCacheStore):
+    """
+    On-disk cache store backed by SQLite.
+    
+    Results are stored as serialized JSON and only deserialized when a
+    key is actually read. Expired rows are filtered by an indexed
+    expires_at column and purged when the store is opened.
+    
+    With max_entries/max_bytes set, the least recently read entries are
+    evicted after each write until the store is back under its caps.
+    SQLite handles locking, so several processes can share one file.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS query_cache (
+            key TEXT PRIMARY KEY,
+            query TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            size_bytes INTEGER NOT NULL DEFAULT 0,
+            last_accessed REAL NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_query_cache_expires
+            ON query_cache (expires_at);
+    """
+    
+    # Columns added after the first schema version
+    MIGRATIONS = {
+        "size_bytes": "ALTER TABLE query_cache ADD COLUMN size_bytes INTEGER NOT NULL DEFAULT 0",
+        "last_accessed": "ALTER TABLE query_cache ADD COLUMN last_accessed REAL NOT NULL DEFAULT 0",
+    }
+    
+    def __init__(
+        self,
+        db_path: Path,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Open (or create) a cache database.
+        
+        Args:
+            db_path: Path to the SQLite file.
+            max_entries: Optional cap on stored entries.
+            max_bytes: Optional cap on total payload size.
+        """
+        super().__init__()
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,  # autocommit; each write is its own transaction
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._migrate()
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_query_cache_accessed "
+            "ON query_cache (last_accessed)"
+        )
+        self.purge_expired()
+    
+    def _migrate(self) -> None:
+        """Add columns missing from databases created by older versions."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(query_cache)")}
+        for column, statement in self.MIGRATIONS.items():
+            if column not in columns:
+                self._conn.execute(statement)
+    
+    def _fetch(self, key: str) -> Optional[QueryResult]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM query_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE query_cache SET last_accessed = ? WHERE key = ?",
+                    (now, key),
+                )
+        if row is None:
+            return None
+        try:
+            return QueryResult.model_validate_json(row[0])
+        except ValueError as e:
+            print(f"Warning: Discarding unreadable cache entry {key}: {e}")
+            return None
+    
+    def put(self, key: str, query: str, result: QueryResult, ttl_hours: float) -> None:
+        now = time.time()
+        payload = result.model_dump_json()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO query_cache "
+                "(key, query, payload, created_at, expires_at, size_bytes, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, query, payload, now, now + ttl_hours * 3600,
+                 len(payload.encode("utf-8")), now),
+            )
+            evicted = self._evict()
+        if evicted:
+            with self._stats_lock:
+                self.evictions += evicted
+    
+    def _evict(self) -> int:
+        """
+        Evict least recently used entries until under the caps.
+        
+        Must be called with self._lock held.
+        
+        Returns:
+            Number of entries evicted.
+        """
+        if not self.max_entries and not self.max_bytes:
+            return 0
+        
+        evicted = 0
+        if self.max_entries:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM query_cache").fetchone()
+            excess = count - self.max_entries
+            if excess > 0:
+                cursor = self._conn.execute(
+                    "DELETE FROM query_cache WHERE key IN ("
+                    "SELECT key FROM query_cache ORDER BY last_accessed ASC LIMIT ?)",
+                    (excess,),
+                )
+                evicted += cursor.rowcount
+        
+        if self.max_bytes:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM query_cache"
+            ).fetchone()
+            if total > self.max_bytes:
+                victims = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size_bytes FROM query_cache ORDER BY last_accessed ASC"
+                ):
+                    if total <= self.max_bytes:
+                        break
+                    victims.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM query_cache WHERE key = ?", victims)
+                evicted += len(victims)
+        
+        return evicted
+    
+    def count(self) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM query_cache WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchone()
+        return row[0]
+    
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM query_cache WHERE expires_at <= ?",
+                (time.time(),),
+            )
+        return cursor.rowcount
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM query_cache")
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Cache file of clients before the SQLite store; the same path in an
+# output directory also holds research output (ProgressTracker,
+# ResearchOrchestrator.save_research_cache)
+LEGACY_JSON_CACHE_NAME = "research_cache.json"
+
+
+def _is_legacy_json_cache(data: Any) -> bool:
+    """True if data has the old client cache's {key: {query, result, ...}} shape."""
+    return (
+        isinstance(data, dict)
+        and bool(data)
+        and all(
+            isinstance(entry, dict) and {"query", "result", "timestamp"} <= entry.keys()
+            for entry in data.values()
+        )
+    )
+
+
+def import_legacy_json_cache(store: ResearchCacheStore, path: Path) -> int:
+    """
+    Move unexpired entries of an old JSON query cache into a store.
+    
+    The file is only imported (and then deleted) if it has the old
+    client cache's shape; research output saved under the same name is
+    left alone.
+    
+    Args:
+        store: Store to import into.
+        path: Path of the legacy research_cache.json.
+    
+    Returns:
+        Number of entries imported.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0
+    if not _is_legacy_json_cache(data):
+        return 0
+    
+    now = datetime.now()
+    imported = 0
+    for key, entry in data.items():
+        try:
+            age_hours = (now - datetime.fromisoformat(entry["timestamp"])).total_seconds() / 3600
+            ttl_hours = entry.get("ttl_hours", 24) - age_hours
+            if ttl_hours <= 0:
+                continue
+            store.put(key, entry["query"], QueryResult.model_validate(entry["result"]), ttl_hours)
+            imported += 1
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Skipping unreadable legacy cache entry {key}: {e}")
+    
+    try:
+        Path(path).unlink()
+    except OSError as e:
+        print(f"Warning: Could not remove legacy research cache {path}: {e}")
+    return imported
+
+
+def create_cache_store(
+    cache_dir: Optional[Path] = None,
+    backend: str = "sqlite",
+) -> ResearchCacheStore:
+    """
+    Create a cache store for a client.
+    
+    Args:
+        cache_dir: Directory for on-disk backends. Without one, falls back
+                   to an in-memory store. A legacy research_cache.json
+                   there is imported into the SQLite store.
+        backend: "sqlite" or "memory".
+    
+    Returns:
+        ResearchCacheStore instance.
+    """
+    if backend == "memory" or cache_dir is None:
+        return MemoryCacheStore()
+    if backend == "sqlite":
+        store = SQLiteCacheStore(Path(cache_dir) / "research_cache.sqlite3")
+        import_legacy_json_cache(store, Path(cache_dir) / LEGACY_JSON_CACHE_NAME)
+        return store
+    raise ValueError(f"Unknown research cache backend: {backend}")
+
+
+# Process-wide store for industry-scoped research
+_shared_store: Optional[ResearchCacheStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_shared_research_cache() -> ResearchCacheStore:
+    """
+    Get the research cache shared by every company in this process.
+    
+    Industry-level queries (industry overview, AI regulations, AI tools,
+    ...) render identically for every company in the same industry, so
+    they are served from this store across companies and runs. Entries
+    beyond SHARED_RESEARCH_CACHE_MAX_ENTRIES / _MAX_BYTES are evicted
+    least recently used first.
+    
+    Returns:
+        Shared ResearchCacheStore instance.
+    """
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SQLiteCacheStore(
+                SHARED_RESEARCH_CACHE_PATH,
+                max_entries=SHARED_RESEARCH_CACHE_MAX_ENTRIES,
+                max_bytes=SHARED_RESEARCH_CACHE_MAX_BYTES,
+            )
+        return _shared_store
@@ -10,7 +10,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any
 
-from ..config import ResearchMode, PerplexityModel
+from ..config import (
+    ResearchMode,
+    PerplexityModel,
+    PERPLEXITY_MAX_CONCURRENCY,
+    INDUSTRY_CACHE_TTL_HOURS,
+)
 from ..models import (
     CompanyInput,
     ResearchOutput,
@@ -18,8 +23,9 @@ from ..models import (
     CompanyInfoTier,
 )
 from ..temporal import get_temporal_context, TemporalContext
-from .perplexity_client import PerplexityClient
-from .query_templates import QueryTemplates, QueryCategory, QueryTemplate
+from ..async_runtime import run_coroutine
+from .perplexity_client import PerplexityClient, AsyncPerplexityClient
+from .query_templates import QueryTemplates, QueryCategory, QueryTemplate, CacheScope
 from .model_selector import ModelSelector
 from .result_processor import ResultProcessor
 
@@ -76,6 +82,8 @@ class ResearchOrchestrator:
         mode: ResearchMode = ResearchMode.QUICK,
         cache_dir: Optional[Path] = None,
         progress_callback: Optional[Callable[[str, float], None]] = None,
+        max_concurrency: int = PERPLEXITY_MAX_CONCURRENCY,
+        async_io: bool = False,
     ):
         """
         Initialize the research orchestrator.
@@ -84,13 +92,22 @@ class ResearchOrchestrator:
             mode: Research mode (quick or comprehensive).
             cache_dir: Directory for caching results.
             progress_callback: Callback for progress updates (phase, progress).
+            max_concurrency: Maximum queries in flight within a phase.
+                             Use 1 to run queries sequentially.
+            async_io: Use AsyncPerplexityClient on the shared background
+                      event loop instead of a thread per query.
         """
         self.mode = mode
         self.cache_dir = cache_dir
         self.progress_callback = progress_callback
+        self.max_concurrency = max(1, max_concurrency)
+        self.async_io = async_io
         
         # Initialize components
-        self.client = PerplexityClient(cache_dir=cache_dir)
+        if async_io:
+            self.client = AsyncPerplexityClient(cache_dir=cache_dir)
+        else:
+            self.client = PerplexityClient(cache_dir=cache_dir)
         self.templates = QueryTemplates()
         self.model_selector = ModelSelector(mode=mode)
         self.result_processor = ResultProcessor()
@@ -200,7 +217,9 @@ class ResearchOrchestrator:
                 self.templates.get_template(q).required_for_quick_mode
             ]
         
-        for i, query_name in enumerate(queries):
+        # Render queries and select models up front so dispatch order is fixed
+        planned = []
+        for query_name in queries:
             template = self.templates.get_template(query_name)
             if not template:
                 continue
@@ -218,21 +237,62 @@ class ResearchOrchestrator:
                 info_tier=self.info_tier,
             )
             
-            # Execute query
-            result = self.client.search(
-                query=query,
-                max_results=10,
-                search_recency_filter=template.recency_filter,
-                model=selection.model,
-            )
-            
-            # Store result
+            planned.append((query_name, query, template, selection))
+        
+        if not planned:
+            return
+        
+        # Queries within a phase are independent; the client batches those
+        # sharing parameters into multi-query calls, and its shared token
+        # bucket keeps the request rate within limits.
+        if self.async_io:
+            results = run_coroutine(self._search_all_async(planned))
+        else:
+            results = self._search_all_threaded(planned)
+        
+        # Store results and report in plan order, regardless of
+        # which query finished first
+        for i, ((query_name, _, _, _), result) in enumerate(zip(planned, results)):
             self.results[query_name] = result
             
             # Update progress within phase
-            phase_progress = (i + 1) / len(queries)
+            phase_progress = (i + 1) / len(planned)
             self._report_progress(f"{phase}: {query_name}", None)
     
+    @staticmethod
+    def _cache_options(template: QueryTemplate) -> Dict[str, Any]:
+        """Cache scope and TTL for a template's query."""
+        if template.scope == CacheScope.INDUSTRY:
+            return {"scope": CacheScope.INDUSTRY, "cache_ttl_hours": INDUSTRY_CACHE_TTL_HOURS}
+        return {"scope": CacheScope.COMPANY}
+    
+    def _search_requests(self, planned: List[tuple]) -> List[Dict[str, Any]]:
+        """search() arguments for each planned query."""
+        return [
+            {
+                "query": query,
+                "max_results": 10,
+                "search_recency_filter": template.recency_filter,
+                "model": selection.model,
+                **self._cache_options(template),
+            }
+            for _, query, template, selection in planned
+        ]
+    
+    def _search_all_threaded(self, planned: List[tuple]) -> List[QueryResult]:
+        """Run planned queries as batched calls on a bounded thread pool, preserving order."""
+        return self.client.search_batch(
+            self._search_requests(planned),
+            max_concurrency=self.max_concurrency,
+        )
+    
+    async def _search_all_async(self, planned: List[tuple]) -> List[QueryResult]:
+        """Run planned queries as concurrent batched calls, preserving order."""
+        return await self.client.search_batch(
+            self._search_requests(planned),
+            max_concurrency=self.max_concurrency,
+        )
+    
     def _report_progress(self, message: str, progress: Optional[float]) -> None:
         """Report progress to callback if set."""
         if self.progress_callback and progress is not None:
@@ -323,7 +383,7 @@ class ResearchOrchestrator:
                 )
             
             return True
-            
+        
         except Exception as e:
             print(f"Warning: Could not load cache: {e}")
             return False
@@ -336,6 +396,7 @@ def run_research(
     mode: ResearchMode = ResearchMode.QUICK,
     cache_dir: Optional[Path] = None,
     progress_callback: Optional[Callable[[str, float], None]] = None,
+    async_io: bool = False,
 ) -> ResearchOutput:
     """
     Convenience function to run research for a company.
@@ -347,6 +408,7 @@ def run_research(
         mode: Research mode.
         cache_dir: Cache directory.
         progress_callback: Progress callback.
+        async_io: Use the async Perplexity client.
     
     Returns:
         ResearchOutput with research results.
@@ -362,6 +424,7 @@ def run_research(
         mode=mode,
         cache_dir=cache_dir,
         progress_callback=progress_callback,
+        async_io=async_io,
     )
     
     return orchestrator.research(company_input)
@@ -3,84 +3,123 @@ Perplexity API client wrapper with retry logic and rate limiting.
 
 Provides a robust interface for making Perplexity Search API calls
 with automatic retries, exponential backoff, and cost tracking.
+
+Company-specific results are cached per company (cache_dir); industry-
+scoped results also go to a process-shared store so every company in the
+same industry reuses them.
+
+Two clients share the same caching and cost logic:
+- PerplexityClient: synchronous, one blocking call per search
+- AsyncPerplexityClient: asyncio-based, many searches over one pooled
+  HTTP session
+
+Both offer search_batch(), which packs cache misses that share request
+parameters into multi-query calls of up to MAX_QUERIES_PER_CALL queries.
+The first multi-query call is a 2-query probe: if the API answers with
+a flat result list, batching is turned off before full chunks are sent.
 """
 
+import asyncio
 import os
 import time
 import hashlib
 import json
+import threading
+import weakref
 from datetime import datetime
+from types import SimpleNamespace
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple, Union
 
-from perplexity import Perplexity
+import httpx
+from perplexity import Perplexity, AsyncPerplexity, DefaultAsyncHttpxClient
 
 from ..config import (
     RETRY_CONFIG,
     PERPLEXITY_COSTS,
+    PERPLEXITY_REQUESTS_PER_SECOND,
+    PERPLEXITY_BURST,
+    PERPLEXITY_MAX_CONNECTIONS,
+    RESEARCH_CACHE_BACKEND,
     PerplexityModel,
     QUALITY_DOMAINS,
 )
 from ..models import SearchResult, QueryResult
+from ..rate_limiter import TokenBucket
+from .cache_store import ResearchCacheStore, create_cache_store, get_shared_research_cache
+from .query_templates import CacheScope
 
 
 @dataclass
-class CacheEntry:
-    """Represents a cached query result."""
-    query_hash: str
-    query: str
-    result: QueryResult
-    timestamp: datetime
-    ttl_hours: int = 24
+class _PendingQuery:
+    """A cache miss waiting to be sent as part of a batch."""
+    index: int
+    cache_key: str
+    query_str: str
+    params: Dict[str, Any]
+    model: PerplexityModel
+    ttl_hours: float
+    scope: CacheScope
 
 
-class PerplexityClient:
+class _PerplexityClientBase:
     """
-    Wrapper for Perplexity Search API with retry logic and caching.
-    
-    Features:
-    - Automatic retry with exponential backoff
-    - Query result caching
-    - Cost estimation and tracking
-    - Rate limiting
-    - Multi-query support
+    Caching, request building and cost tracking shared by the sync
+    and async clients.
     """
     
+    # The Search API accepts at most this many queries per request
+    MAX_QUERIES_PER_CALL = 5
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         cache_dir: Optional[Path] = None,
         enable_cache: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache_store: Optional[ResearchCacheStore] = None,
+        shared_cache_store: Optional[ResearchCacheStore] = None,
+        use_shared_cache: bool = True,
     ):
-        """
-        Initialize the Perplexity client.
-        
-        Args:
-            api_key: Perplexity API key. If not provided, uses PERPLEXITY_API_KEY env var.
-            cache_dir: Directory for caching query results.
-            enable_cache: Whether to enable result caching.
-        """
         self.api_key = api_key or os.getenv("PERPLEXITY_API_KEY")
         if not self.api_key:
             raise ValueError("PERPLEXITY_API_KEY not found in environment variables")
         
-        self.client = Perplexity(api_key=self.api_key)
         self.enable_cache = enable_cache
         self.cache_dir = cache_dir
-        self.cache: Dict[str, CacheEntry] = {}
+        self.cache_store: Optional[ResearchCacheStore] = None
+        if self.enable_cache:
+            self.cache_store = cache_store or create_cache_store(
+                cache_dir, backend=RESEARCH_CACHE_BACKEND
+            )
+        self.shared_cache_store: Optional[ResearchCacheStore] = None
+        if self.enable_cache and use_shared_cache:
+            self.shared_cache_store = shared_cache_store or get_shared_research_cache()
+        
+        # Lookups made by this client (stores may be shared with other clients)
+        self.cache_hits = {scope.value: 0 for scope in CacheScope}
+        self.cache_misses = {scope.value: 0 for scope in CacheScope}
         
         # Cost tracking
         self.total_cost = 0.0
         self.query_count = 0
         
         # Rate limiting
-        self.last_request_time = 0.0
-        self.min_request_interval = 1.0  # seconds between requests
+        self.rate_limiter = rate_limiter or TokenBucket(
+            rate=PERPLEXITY_REQUESTS_PER_SECOND,
+            capacity=PERPLEXITY_BURST,
+        )
+        
+        # Guards cost counters when searches run in parallel
+        self._lock = threading.RLock()
         
-        # Load cache from disk if available
-        if self.cache_dir and self.enable_cache:
-            self._load_cache()
+        # Cleared if the API answers a multi-query call with ungrouped results
+        self.batching_enabled = True
+        # Set once a multi-query response has come back grouped per query;
+        # until then search_batch() probes with a 2-query call first
+        self.batch_grouping_verified = False
     
     def _get_cache_key(self, query: str, **params) -> str:
         """Generate a cache key from query and parameters."""
@@ -88,72 +127,6 @@ class PerplexityClient:
         cache_str = json.dumps(cache_data, sort_keys=True)
         return hashlib.md5(cache_str.encode()).hexdigest()
     
-    def _load_cache(self) -> None:
-        """Load cache from disk."""
-        if not self.cache_dir:
-            return
-        
-        cache_file = self.cache_dir / "research_cache.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for key, entry in data.items():
-                        # Reconstruct QueryResult from dict
-                        result_dict = entry["result"]
-                        result_dict["timestamp"] = datetime.fromisoformat(result_dict["timestamp"])
-                        results = [SearchResult(**r) for r in result_dict["results"]]
-                        result_dict["results"] = results
-                        
-                        self.cache[key] = CacheEntry(
-                            query_hash=key,
-                            query=entry["query"],
-                            result=QueryResult(**result_dict),
-                            timestamp=datetime.fromisoformat(entry["timestamp"]),
-                            ttl_hours=entry.get("ttl_hours", 24),
-                        )
-            except Exception as e:
-                print(f"Warning: Could not load cache: {e}")
-    
-    def _save_cache(self) -> None:
-        """Save cache to disk."""
-        if not self.cache_dir:
-            return
-        
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = self.cache_dir / "research_cache.json"
-        
-        try:
-            data = {}
-            for key, entry in self.cache.items():
-                result_dict = entry.result.model_dump()
-                result_dict["timestamp"] = result_dict["timestamp"].isoformat()
-                result_dict["results"] = [r.model_dump() for r in entry.result.results]
-                
-                data[key] = {
-                    "query": entry.query,
-                    "result": result_dict,
-                    "timestamp": entry.timestamp.isoformat(),
-                    "ttl_hours": entry.ttl_hours,
-                }
-            
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, default=str)
-        except Exception as e:
-            print(f"Warning: Could not save cache: {e}")
-    
-    def _is_cache_valid(self, entry: CacheEntry) -> bool:
-        """Check if a cache entry is still valid."""
-        age_hours = (datetime.now() - entry.timestamp).total_seconds() / 3600
-        return age_hours < entry.ttl_hours
-    
-    def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
-    
     def _estimate_cost(
         self,
         model: PerplexityModel,
@@ -166,7 +139,7 @@ class PerplexityClient:
         )
         return (input_tokens / 1000 * input_cost) + (output_tokens / 1000 * output_cost)
     
-    def search(
+    def _prepare_search(
         self,
         query: Union[str, List[str]],
         max_results: int = 10,
@@ -178,26 +151,12 @@ class PerplexityClient:
         search_domain_filter: Optional[List[str]] = None,
         use_quality_domains: bool = False,
         model: PerplexityModel = PerplexityModel.SONAR,
-        cache_ttl_hours: int = 24,
-    ) -> QueryResult:
+    ) -> Tuple[str, str, Dict[str, Any]]:
         """
-        Execute a Perplexity search query with retry logic.
-        
-        Args:
-            query: Search query string or list of queries (max 5).
-            max_results: Maximum number of results (1-20).
-            max_tokens_per_page: Content extraction depth per page.
-            country: ISO country code for regional results.
-            search_recency_filter: Filter by recency (day, week, month, year).
-            search_after_date: Only results after this date (MM/DD/YYYY).
-            search_before_date: Only results before this date (MM/DD/YYYY).
-            search_domain_filter: Allowlist or denylist of domains.
-            use_quality_domains: If True, filter to quality domains.
-            model: Perplexity model to use (for cost tracking).
-            cache_ttl_hours: How long to cache results.
+        Build the cache key and request parameters for a search.
         
         Returns:
-            QueryResult with search results and metadata.
+            Tuple of (cache_key, query_str, request params).
         """
         # Build cache key
         cache_params = {
@@ -212,12 +171,6 @@ class PerplexityClient:
         query_str = query if isinstance(query, str) else "|".join(query)
         cache_key = self._get_cache_key(query_str, **cache_params)
         
-        # Check cache
-        if self.enable_cache and cache_key in self.cache:
-            entry = self.cache[cache_key]
-            if self._is_cache_valid(entry):
-                return entry.result
-        
         # Build request parameters
         params: Dict[str, Any] = {
             "query": query,
@@ -240,28 +193,414 @@ class PerplexityClient:
         elif search_domain_filter:
             params["search_domain_filter"] = search_domain_filter[:20]
         
-        # Execute with retry
-        result = self._execute_with_retry(params, model)
+        return cache_key, query_str, params
+    
+    def _get_cached(
+        self,
+        cache_key: str,
+        scope: CacheScope = CacheScope.COMPANY,
+    ) -> Optional[QueryResult]:
+        """
+        Return a valid cached result for a key, if any.
         
-        # Cache result
-        if self.enable_cache:
-            self.cache[cache_key] = CacheEntry(
-                query_hash=cache_key,
-                query=query_str,
-                result=result,
-                timestamp=datetime.now(),
-                ttl_hours=cache_ttl_hours,
+        Industry-scoped keys are looked up in the shared store first, then
+        in the company store.
+        """
+        stores = [self.cache_store]
+        if scope == CacheScope.INDUSTRY:
+            stores.insert(0, self.shared_cache_store)
+        
+        cached = None
+        for store in stores:
+            if store:
+                cached = store.get(cache_key)
+                if cached:
+                    break
+        
+        with self._lock:
+            if cached:
+                self.cache_hits[scope.value] += 1
+            else:
+                self.cache_misses[scope.value] += 1
+        return cached
+    
+    def _store_cached(
+        self,
+        cache_key: str,
+        query_str: str,
+        result: QueryResult,
+        ttl_hours: float,
+        scope: CacheScope = CacheScope.COMPANY,
+    ) -> None:
+        """Cache a fresh result (failed industry searches are not shared)."""
+        if self.cache_store:
+            self.cache_store.put(cache_key, query_str, result, ttl_hours)
+        if scope == CacheScope.INDUSTRY and self.shared_cache_store and not result.error:
+            self.shared_cache_store.put(cache_key, query_str, result, ttl_hours)
+    
+    def _build_result(
+        self,
+        response: Any,
+        params: Dict[str, Any],
+        model: PerplexityModel,
+    ) -> QueryResult:
+        """Convert an API response into a QueryResult and record its cost."""
+        return self._make_result(self._query_str(params), response.results, model)
+    
+    def _make_result(
+        self,
+        query_str: str,
+        raw_results: List[Any],
+        model: PerplexityModel,
+    ) -> QueryResult:
+        """Build a QueryResult from raw API results and record its cost."""
+        # Parse results
+        results = []
+        for r in raw_results:
+            if isinstance(r, dict):
+                r = SimpleNamespace(**r)
+            results.append(SearchResult(
+                title=r.title,
+                url=r.url,
+                snippet=r.snippet,
+                date=getattr(r, 'date', None),
+                last_updated=getattr(r, 'last_updated', None),
+            ))
+        
+        # Estimate cost
+        cost = self._estimate_cost(model)
+        with self._lock:
+            self.total_cost += cost
+            self.query_count += 1
+        
+        return QueryResult(
+            query=query_str,
+            model_used=model.value,
+            results=results,
+            result_count=len(results),
+            timestamp=datetime.now(),
+            cost_estimate=cost,
+        )
+    
+    def _plan_batch(
+        self,
+        requests: List[Dict[str, Any]],
+    ) -> Tuple[List[Optional[QueryResult]], List[List[_PendingQuery]]]:
+        """
+        Resolve cache hits and group the misses into API calls.
+        
+        Misses are grouped by everything in the request except the query
+        text (recency, dates, domains, country, model, ...), then chunked
+        to MAX_QUERIES_PER_CALL.
+        
+        Args:
+            requests: One dict of search() keyword arguments per query.
+        
+        Returns:
+            Tuple of (results with None for misses, chunks of misses).
+        """
+        results: List[Optional[QueryResult]] = [None] * len(requests)
+        groups: Dict[str, List[_PendingQuery]] = {}
+        
+        for index, request in enumerate(requests):
+            request = dict(request)
+            if not isinstance(request.get("query"), str):
+                raise ValueError("search_batch() requests must each contain a single query string")
+            model = request.get("model", PerplexityModel.SONAR)
+            ttl_hours = request.pop("cache_ttl_hours", 24)
+            scope = request.pop("scope", CacheScope.COMPANY)
+            
+            cache_key, query_str, params = self._prepare_search(**request)
+            cached = self._get_cached(cache_key, scope)
+            if cached:
+                results[index] = cached
+                continue
+            
+            group_key = json.dumps(
+                {**{k: v for k, v in params.items() if k != "query"}, "model": model.value},
+                sort_keys=True,
             )
-            self._save_cache()
+            groups.setdefault(group_key, []).append(_PendingQuery(
+                index=index,
+                cache_key=cache_key,
+                query_str=query_str,
+                params=params,
+                model=model,
+                ttl_hours=ttl_hours,
+                scope=scope,
+            ))
         
-        return result
+        size = self.MAX_QUERIES_PER_CALL if self.batching_enabled else 1
+        chunks = [
+            pending[i:i + size]
+            for pending in groups.values()
+            for i in range(0, len(pending), size)
+        ]
+        return results, chunks
     
-    def _execute_with_retry(
+    @staticmethod
+    def _batch_params(chunk: List[_PendingQuery]) -> Dict[str, Any]:
+        """Request params for one multi-query call."""
+        return {**chunk[0].params, "query": [p.params["query"] for p in chunk]}
+    
+    def _split_batch_response(
+        self,
+        response: Any,
+        chunk: List[_PendingQuery],
+    ) -> Optional[List[QueryResult]]:
+        """
+        Split a multi-query response into one QueryResult per query.
+        
+        Multi-query calls return one result list per query, in order.
+        
+        Returns:
+            QueryResults in chunk order, or None if the response is not
+            grouped per query and cannot be attributed.
+        """
+        groups = response.results
+        if len(groups) != len(chunk) or not all(isinstance(g, list) for g in groups):
+            return None
+        return [
+            self._make_result(pending.query_str, group, pending.model)
+            for pending, group in zip(chunk, groups)
+        ]
+    
+    def _take_probe(
+        self,
+        chunks: List[List[_PendingQuery]],
+    ) -> Tuple[Optional[List[_PendingQuery]], List[List[_PendingQuery]]]:
+        """
+        Split a 2-query probe off the first multi-query chunk.
+        
+        Until grouping is verified, a full chunk could be paid for and
+        then discarded if the response is flat. The probe risks two
+        queries instead of MAX_QUERIES_PER_CALL.
+        
+        Returns:
+            Tuple of (probe chunk or None, remaining chunks).
+        """
+        if not self.batching_enabled or self.batch_grouping_verified:
+            return None, chunks
+        for i, chunk in enumerate(chunks):
+            if len(chunk) > 1:
+                rest = [chunk[2:]] if len(chunk) > 2 else []
+                return chunk[:2], chunks[:i] + rest + chunks[i + 1:]
+        return None, chunks
+    
+    def _handle_batch_response(
+        self,
+        response: Any,
+        chunk: List[_PendingQuery],
+    ) -> Optional[List[QueryResult]]:
+        """
+        Split a multi-query response, or account for it if it cannot be.
+        
+        An ungrouped response was still a paid call: its cost is recorded
+        before batching is disabled and the queries are re-sent one by one.
+        
+        Returns:
+            QueryResults in chunk order, or None to retry individually.
+        """
+        split = self._split_batch_response(response, chunk)
+        if split is not None:
+            self.batch_grouping_verified = True
+            return split
+        with self._lock:
+            self.total_cost += self._estimate_cost(chunk[0].model)
+            self.query_count += 1
+        self._disable_batching()
+        return None
+    
+    def _finish_batch(
+        self,
+        results: List[Optional[QueryResult]],
+        chunk: List[_PendingQuery],
+        chunk_results: List[QueryResult],
+    ) -> None:
+        """Cache each query's result and slot it into the batch output."""
+        for pending, result in zip(chunk, chunk_results):
+            self._store_cached(
+                pending.cache_key, pending.query_str, result, pending.ttl_hours, pending.scope
+            )
+            results[pending.index] = result
+    
+    def _disable_batching(self) -> None:
+        """Fall back to one query per call after an ungrouped response."""
+        if self.batching_enabled:
+            print("Warning: Multi-query response was not grouped per query; "
+                  "sending queries individually")
+            self.batching_enabled = False
+    
+    def _failed_result(
         self,
         params: Dict[str, Any],
         model: PerplexityModel,
+        error: Optional[Exception],
     ) -> QueryResult:
-        """Execute a search with retry logic."""
+        """Build the empty result returned once all retries fail."""
+        return QueryResult(
+            query=self._query_str(params),
+            model_used=model.value,
+            results=[],
+            result_count=0,
+            timestamp=datetime.now(),
+            cost_estimate=0.0,
+            error=str(error),
+        )
+    
+    @staticmethod
+    def _query_str(params: Dict[str, Any]) -> str:
+        """Display form of the query in request params."""
+        query_str = params["query"]
+        if isinstance(query_str, list):
+            query_str = " | ".join(query_str)
+        return query_str
+    
+    def get_cost_summary(self) -> Dict[str, Any]:
+        """Get a summary of API usage and costs."""
+        return {
+            "total_cost": round(self.total_cost, 4),
+            "query_count": self.query_count,
+            "avg_cost_per_query": round(self.total_cost / max(1, self.query_count), 4),
+            "cache_hits": sum(self.cache_hits.values()),
+            "cache_misses": sum(self.cache_misses.values()),
+            "cache_by_scope": {
+                scope.value: {
+                    "hits": self.cache_hits[scope.value],
+                    "misses": self.cache_misses[scope.value],
+                }
+                for scope in CacheScope
+            },
+            "shared_cache": self.shared_cache_store.stats() if self.shared_cache_store else None,
+        }
+    
+    def clear_cache(self) -> None:
+        """Clear this client's query cache (the shared store is left intact)."""
+        if self.cache_store:
+            self.cache_store.clear()
+
+
+class PerplexityClient(_PerplexityClientBase):
+    """
+    Wrapper for Perplexity Search API with retry logic and caching.
+    
+    Features:
+    - Automatic retry with exponential backoff
+    - Query result caching
+    - Cost estimation and tracking
+    - Rate limiting (thread-safe token bucket)
+    - Multi-query support and batching of independent searches
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        enable_cache: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache_store: Optional[ResearchCacheStore] = None,
+        shared_cache_store: Optional[ResearchCacheStore] = None,
+        use_shared_cache: bool = True,
+    ):
+        """
+        Initialize the Perplexity client.
+        
+        Args:
+            api_key: Perplexity API key. If not provided, uses PERPLEXITY_API_KEY env var.
+            cache_dir: Directory for caching query results.
+            enable_cache: Whether to enable result caching.
+            rate_limiter: Token bucket shared by concurrent callers. Defaults to
+                          PERPLEXITY_REQUESTS_PER_SECOND with a PERPLEXITY_BURST burst.
+            cache_store: Cache backend. Defaults to RESEARCH_CACHE_BACKEND
+                         in cache_dir (in-memory without a cache_dir).
+            shared_cache_store: Store for industry-scoped results. Defaults to
+                                the process-wide get_shared_research_cache().
+            use_shared_cache: Whether industry-scoped results are shared
+                              across companies.
+        """
+        super().__init__(
+            api_key=api_key,
+            cache_dir=cache_dir,
+            enable_cache=enable_cache,
+            rate_limiter=rate_limiter,
+            cache_store=cache_store,
+            shared_cache_store=shared_cache_store,
+            use_shared_cache=use_shared_cache,
+        )
+        self.client = Perplexity(api_key=self.api_key)
+    
+    def _rate_limit(self) -> None:
+        """Wait for a token from the shared rate limiter."""
+        self.rate_limiter.acquire()
+    
+    def search(
+        self,
+        query: Union[str, List[str]],
+        max_results: int = 10,
+        max_tokens_per_page: int = 1024,
+        country: Optional[str] = None,
+        search_recency_filter: Optional[str] = None,
+        search_after_date: Optional[str] = None,
+        search_before_date: Optional[str] = None,
+        search_domain_filter: Optional[List[str]] = None,
+        use_quality_domains: bool = False,
+        model: PerplexityModel = PerplexityModel.SONAR,
+        cache_ttl_hours: float = 24,
+        scope: CacheScope = CacheScope.COMPANY,
+    ) -> QueryResult:
+        """
+        Execute a Perplexity search query with retry logic.
+        
+        Args:
+            query: Search query string or list of queries (max 5).
+            max_results: Maximum number of results (1-20).
+            max_tokens_per_page: Content extraction depth per page.
+            country: ISO country code for regional results.
+            search_recency_filter: Filter by recency (day, week, month, year).
+            search_after_date: Only results after this date (MM/DD/YYYY).
+            search_before_date: Only results before this date (MM/DD/YYYY).
+            search_domain_filter: Allowlist or denylist of domains.
+            use_quality_domains: If True, filter to quality domains.
+            model: Perplexity model to use (for cost tracking).
+            cache_ttl_hours: How long to cache results.
+            scope: CacheScope.INDUSTRY to share the result with other companies.
+        
+        Returns:
+            QueryResult with search results and metadata.
+        """
+        cache_key, query_str, params = self._prepare_search(
+            query,
+            max_results=max_results,
+            max_tokens_per_page=max_tokens_per_page,
+            country=country,
+            search_recency_filter=search_recency_filter,
+            search_after_date=search_after_date,
+            search_before_date=search_before_date,
+            search_domain_filter=search_domain_filter,
+            use_quality_domains=use_quality_domains,
+            model=model,
+        )
+        
+        # Check cache
+        cached = self._get_cached(cache_key, scope)
+        if cached:
+            return cached
+        
+        # Execute with retry
+        result = self._execute_with_retry(params, model)
+        
+        # Cache result
+        self._store_cached(cache_key, query_str, result, cache_ttl_hours, scope)
+        
+        return result
+    
+    def _request_with_retry(self, params: Dict[str, Any]) -> Tuple[Any, Optional[Exception]]:
+        """
+        Call the Search API with retry logic.
+        
+        Returns:
+            Tuple of (response, None) on success or (None, last error).
+        """
         max_retries = RETRY_CONFIG["max_retries"]
         delay = RETRY_CONFIG["initial_delay"]
         max_delay = RETRY_CONFIG["max_delay"]
@@ -273,37 +612,8 @@ class PerplexityClient:
             try:
                 self._rate_limit()
                 
-                response = self.client.search.create(**params)
-                
-                # Parse results
-                results = []
-                for r in response.results:
-                    results.append(SearchResult(
-                        title=r.title,
-                        url=r.url,
-                        snippet=r.snippet,
-                        date=getattr(r, 'date', None),
-                        last_updated=getattr(r, 'last_updated', None),
-                    ))
-                
-                # Estimate cost
-                cost = self._estimate_cost(model)
-                self.total_cost += cost
-                self.query_count += 1
-                
-                query_str = params["query"]
-                if isinstance(query_str, list):
-                    query_str = " | ".join(query_str)
-                
-                return QueryResult(
-                    query=query_str,
-                    model_used=model.value,
-                    results=results,
-                    result_count=len(results),
-                    timestamp=datetime.now(),
-                    cost_estimate=cost,
-                )
-                
+                return self.client.search.create(**params), None
+            
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
@@ -312,19 +622,66 @@ class PerplexityClient:
                     delay = min(delay * backoff, max_delay)
         
         # All retries failed
-        query_str = params["query"]
-        if isinstance(query_str, list):
-            query_str = " | ".join(query_str)
-            
-        return QueryResult(
-            query=query_str,
-            model_used=model.value,
-            results=[],
-            result_count=0,
-            timestamp=datetime.now(),
-            cost_estimate=0.0,
-            error=str(last_error),
-        )
+        return None, last_error
+    
+    def _execute_with_retry(
+        self,
+        params: Dict[str, Any],
+        model: PerplexityModel,
+    ) -> QueryResult:
+        """Execute a search with retry logic."""
+        response, error = self._request_with_retry(params)
+        if response is None:
+            return self._failed_result(params, model, error)
+        return self._build_result(response, params, model)
+    
+    def _execute_chunk(self, chunk: List[_PendingQuery]) -> List[QueryResult]:
+        """Run one chunk of a batch as a single (multi-query) API call."""
+        if len(chunk) > 1 and self.batching_enabled:
+            params = self._batch_params(chunk)
+            response, error = self._request_with_retry(params)
+            if response is None:
+                return [self._failed_result(p.params, p.model, error) for p in chunk]
+            split = self._handle_batch_response(response, chunk)
+            if split is not None:
+                return split
+        return [self._execute_with_retry(p.params, p.model) for p in chunk]
+    
+    def search_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: int = 1,
+    ) -> List[QueryResult]:
+        """
+        Execute independent searches, batching compatible cache misses.
+        
+        Queries that share every other request parameter are sent together
+        in multi-query calls of up to MAX_QUERIES_PER_CALL, then split back
+        into one cached QueryResult per query.
+        
+        Args:
+            requests: One dict of search() keyword arguments per query
+                      (a single query string each).
+            max_concurrency: Number of API calls in flight at once.
+        
+        Returns:
+            List of QueryResult objects, in the order of requests.
+        """
+        results, chunks = self._plan_batch(requests)
+        probe, chunks = self._take_probe(chunks)
+        if probe:
+            self._finish_batch(results, probe, self._execute_chunk(probe))
+        
+        workers = max(1, min(max_concurrency, len(chunks)))
+        if workers == 1:
+            chunk_results = [self._execute_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                chunk_results = list(executor.map(self._execute_chunk, chunks))
+        
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            self._finish_batch(results, chunk, chunk_result)
+        return results
     
     def search_multi(
         self,
@@ -332,7 +689,7 @@ class PerplexityClient:
         **kwargs,
     ) -> List[QueryResult]:
         """
-        Execute multiple independent searches.
+        Execute multiple independent searches with shared parameters.
         
         Args:
             queries: List of search queries.
@@ -341,25 +698,264 @@ class PerplexityClient:
         Returns:
             List of QueryResult objects.
         """
-        results = []
-        for query in queries:
-            result = self.search(query, **kwargs)
-            results.append(result)
-        return results
+        return self.search_batch([{"query": query, **kwargs} for query in queries])
+
+
+# One pooled HTTP session per event loop, shared by every AsyncPerplexityClient
+# on that loop. httpx connections are bound to the loop that opened them.
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP session for the running event loop.
     
-    def get_cost_summary(self) -> Dict[str, Any]:
-        """Get a summary of API usage and costs."""
-        return {
-            "total_cost": round(self.total_cost, 4),
-            "query_count": self.query_count,
-            "avg_cost_per_query": round(self.total_cost / max(1, self.query_count), 4),
-            "cache_hits": len([e for e in self.cache.values() if self._is_cache_valid(e)]),
-        }
+    Returns:
+        httpx.AsyncClient with keep-alive connections sized by
+        PERPLEXITY_MAX_CONNECTIONS.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=PERPLEXITY_MAX_CONNECTIONS,
+                max_keepalive_connections=PERPLEXITY_MAX_CONNECTIONS,
+            ),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+class AsyncPerplexityClient(_PerplexityClientBase):
+    """
+    Asyncio variant of PerplexityClient.
     
-    def clear_cache(self) -> None:
-        """Clear the query cache."""
-        self.cache = {}
-        if self.cache_dir:
-            cache_file = self.cache_dir / "research_cache.json"
-            if cache_file.exists():
-                cache_file.unlink()
+    Same search()/search_multi() surface, but coroutines: searches wait
+    on the network without holding a thread, share one pooled HTTP session
+    per event loop, and back off with asyncio.sleep.
+    
+    From synchronous code (CLI, Flask request threads) run coroutines on the
+    shared background loop:
+        
+        from strategy_factory.async_runtime import run_coroutine
+        client = AsyncPerplexityClient()
+        result = run_coroutine(client.search("Acme Corp overview"))
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        enable_cache: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache_store: Optional[ResearchCacheStore] = None,
+        shared_cache_store: Optional[ResearchCacheStore] = None,
+        use_shared_cache: bool = True,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        Initialize the async Perplexity client.
+        
+        Args:
+            api_key: Perplexity API key. If not provided, uses PERPLEXITY_API_KEY env var.
+            cache_dir: Directory for caching query results.
+            enable_cache: Whether to enable result caching.
+            rate_limiter: Token bucket shared by concurrent callers.
+            cache_store: Cache backend (see PerplexityClient).
+            shared_cache_store: Store for industry-scoped results (see PerplexityClient).
+            use_shared_cache: Whether industry-scoped results are shared.
+            http_client: HTTP session to use. Defaults to the pooled session
+                         of the event loop the first search runs on.
+        """
+        super().__init__(
+            api_key=api_key,
+            cache_dir=cache_dir,
+            enable_cache=enable_cache,
+            rate_limiter=rate_limiter,
+            cache_store=cache_store,
+            shared_cache_store=shared_cache_store,
+            use_shared_cache=use_shared_cache,
+        )
+        self._http_client = http_client
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncPerplexity]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    @property
+    def client(self) -> AsyncPerplexity:
+        """SDK client bound to the running event loop's pooled session."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = AsyncPerplexity(
+                api_key=self.api_key,
+                http_client=self._http_client or get_shared_http_client(),
+            )
+            self._clients[loop] = client
+        return client
+    
+    async def _rate_limit(self) -> None:
+        """Wait for a token from the shared rate limiter."""
+        await self.rate_limiter.acquire_async()
+    
+    async def search(
+        self,
+        query: Union[str, List[str]],
+        max_results: int = 10,
+        max_tokens_per_page: int = 1024,
+        country: Optional[str] = None,
+        search_recency_filter: Optional[str] = None,
+        search_after_date: Optional[str] = None,
+        search_before_date: Optional[str] = None,
+        search_domain_filter: Optional[List[str]] = None,
+        use_quality_domains: bool = False,
+        model: PerplexityModel = PerplexityModel.SONAR,
+        cache_ttl_hours: float = 24,
+        scope: CacheScope = CacheScope.COMPANY,
+    ) -> QueryResult:
+        """
+        Execute a Perplexity search query with retry logic.
+        
+        Accepts the same arguments as PerplexityClient.search().
+        
+        Returns:
+            QueryResult with search results and metadata.
+        """
+        cache_key, query_str, params = self._prepare_search(
+            query,
+            max_results=max_results,
+            max_tokens_per_page=max_tokens_per_page,
+            country=country,
+            search_recency_filter=search_recency_filter,
+            search_after_date=search_after_date,
+            search_before_date=search_before_date,
+            search_domain_filter=search_domain_filter,
+            use_quality_domains=use_quality_domains,
+            model=model,
+        )
+        
+        # Check cache
+        cached = self._get_cached(cache_key, scope)
+        if cached:
+            return cached
+        
+        # Execute with retry
+        result = await self._execute_with_retry(params, model)
+        
+        # Cache result
+        self._store_cached(cache_key, query_str, result, cache_ttl_hours, scope)
+        
+        return result
+    
+    async def _request_with_retry(
+        self,
+        params: Dict[str, Any],
+    ) -> Tuple[Any, Optional[Exception]]:
+        """
+        Call the Search API with non-blocking retry and backoff.
+        
+        Returns:
+            Tuple of (response, None) on success or (None, last error).
+        """
+        max_retries = RETRY_CONFIG["max_retries"]
+        delay = RETRY_CONFIG["initial_delay"]
+        max_delay = RETRY_CONFIG["max_delay"]
+        backoff = RETRY_CONFIG["backoff_multiplier"]
+        
+        last_error = None
+        
+        for attempt in range(max_retries):
+            try:
+                await self._rate_limit()
+                
+                return await self.client.search.create(**params), None
+            
+            except Exception as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    print(f"Retry {attempt + 1}/{max_retries} after error: {e}")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * backoff, max_delay)
+        
+        # All retries failed
+        return None, last_error
+    
+    async def _execute_with_retry(
+        self,
+        params: Dict[str, Any],
+        model: PerplexityModel,
+    ) -> QueryResult:
+        """Execute a search with non-blocking retry and backoff."""
+        response, error = await self._request_with_retry(params)
+        if response is None:
+            return self._failed_result(params, model, error)
+        return self._build_result(response, params, model)
+    
+    async def _execute_chunk(self, chunk: List[_PendingQuery]) -> List[QueryResult]:
+        """Run one chunk of a batch as a single (multi-query) API call."""
+        if len(chunk) > 1 and self.batching_enabled:
+            params = self._batch_params(chunk)
+            response, error = await self._request_with_retry(params)
+            if response is None:
+                return [self._failed_result(p.params, p.model, error) for p in chunk]
+            split = self._handle_batch_response(response, chunk)
+            if split is not None:
+                return split
+        return list(await asyncio.gather(
+            *(self._execute_with_retry(p.params, p.model) for p in chunk)
+        ))
+    
+    async def search_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[QueryResult]:
+        """
+        Execute independent searches, batching compatible cache misses.
+        
+        Same batching as PerplexityClient.search_batch(); the resulting
+        API calls run concurrently.
+        
+        Args:
+            requests: One dict of search() keyword arguments per query.
+            max_concurrency: Maximum API calls in flight (unbounded if None).
+        
+        Returns:
+            List of QueryResult objects, in the order of requests.
+        """
+        results, chunks = self._plan_batch(requests)
+        probe, chunks = self._take_probe(chunks)
+        if probe:
+            self._finish_batch(results, probe, await self._execute_chunk(probe))
+        
+        semaphore = asyncio.Semaphore(max_concurrency or max(1, len(chunks)))
+        
+        async def bounded_chunk(chunk: List[_PendingQuery]) -> List[QueryResult]:
+            async with semaphore:
+                return await self._execute_chunk(chunk)
+        
+        chunk_results = await asyncio.gather(*(bounded_chunk(chunk) for chunk in chunks))
+        
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            self._finish_batch(results, chunk, chunk_result)
+        return results
+    
+    async def search_multi(
+        self,
+        queries: List[str],
+        **kwargs,
+    ) -> List[QueryResult]:
+        """
+        Execute multiple independent searches concurrently.
+        
+        Args:
+            queries: List of search queries.
+            **kwargs: Additional parameters passed to search().
+        
+        Returns:
+            List of QueryResult objects, in the order of queries.
+        """
+        return await self.search_batch([{"query": query, **kwargs} for query in queries])
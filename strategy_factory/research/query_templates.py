@@ -25,6 +25,12 @@ class QueryCategory(str, Enum):
     FUNDING = "funding"
 
 
+class CacheScope(str, Enum):
+    """Who a query's results can be reused for."""
+    COMPANY = "company"    # Mentions the company; cached per company
+    INDUSTRY = "industry"  # Same for every company in the industry; shared
+
+
 @dataclass
 class QueryTemplate:
     """Represents a query template with metadata."""
@@ -35,6 +41,13 @@ class QueryTemplate:
     priority: int  # 1 = highest priority
     required_for_quick_mode: bool
     description: str
+    
+    @property
+    def scope(self) -> CacheScope:
+        """Industry scope if the rendered query carries nothing company-specific."""
+        if "{company_name}" in self.template or "{context}" in self.template:
+            return CacheScope.COMPANY
+        return CacheScope.INDUSTRY
 
 
 class QueryTemplates:
@@ -0,0 +1,253 @@
+"""
+Dependency-graph scheduler.
+
+Runs each task of a DAG on a worker pool as soon as everything it
+depends on has finished, so total time approaches the longest dependency
+chain rather than the sum of all tasks. Synthesis schedules deliverables
+(for_deliverables() reads DELIVERABLES[...]["dependencies"]); generation
+schedules its output stages.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .config import DELIVERABLES
+
+
+@dataclass
+class TaskTiming:
+    """Timing of one scheduled task, in seconds since the run started."""
+    task_id: str
+    started: float
+    finished: float
+    succeeded: bool
+    
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+
+@dataclass
+class ScheduleReport:
+    """Outcome and timing of a scheduler run."""
+    timings: Dict[str, TaskTiming] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    wall_time: float = 0.0
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_time: float = 0.0
+    
+    @property
+    def serial_time(self) -> float:
+        """Time the same tasks would have taken one after another."""
+        return sum(t.duration for t in self.timings.values())
+    
+    def summary(self) -> Dict[str, object]:
+        """Serializable summary for logs and progress files."""
+        return {
+            "wall_time": round(self.wall_time, 2),
+            "serial_time": round(self.serial_time, 2),
+            "critical_path": self.critical_path,
+            "critical_path_time": round(self.critical_path_time, 2),
+            "skipped": self.skipped,
+        }
+
+
+class DependencyScheduler:
+    """
+    Runs tasks in dependency order on a bounded thread pool.
+    
+    A task is submitted once all of its dependencies succeeded. When a
+    task fails, everything downstream of it is skipped. Among ready tasks,
+    those heading the longest remaining chain are started first.
+    
+    Usage:
+        scheduler = DependencyScheduler.for_deliverables(["01_tech_inventory", ...])
+        report = scheduler.run(generate_one, max_workers=3)
+    """
+    
+    def __init__(self, dependencies: Dict[str, List[str]]):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            dependencies: Task ID -> IDs it depends on. Dependencies that
+                          are not tasks themselves are ignored. Insertion
+                          order breaks ties between ready tasks.
+        """
+        self.tasks = list(dependencies)
+        self.dependencies = {
+            task: [d for d in deps if d in dependencies and d != task]
+            for task, deps in dependencies.items()
+        }
+        self.dependents: Dict[str, List[str]] = {task: [] for task in self.tasks}
+        for task, deps in self.dependencies.items():
+            for dep in deps:
+                self.dependents[dep].append(task)
+        
+        self.order = self._topological_order()
+        self.height = self._chain_heights()
+    
+    @classmethod
+    def for_deliverables(cls, deliverable_ids: List[str]) -> "DependencyScheduler":
+        """
+        Build the graph for a set of deliverables from DELIVERABLES.
+        
+        "ALL_MARKDOWN" expands to every markdown deliverable in the set.
+        
+        Args:
+            deliverable_ids: Deliverables to schedule.
+        
+        Returns:
+            DependencyScheduler over those deliverables.
+        """
+        markdown_ids = [
+            d for d in deliverable_ids
+            if DELIVERABLES.get(d, {}).get("format") == "markdown"
+        ]
+        
+        dependencies = {}
+        for d_id in deliverable_ids:
+            deps = []
+            for dep in DELIVERABLES.get(d_id, {}).get("dependencies", []):
+                if dep == "ALL_MARKDOWN":
+                    deps.extend(markdown_ids)
+                else:
+                    deps.append(dep)
+            dependencies[d_id] = deps
+        
+        return cls(dependencies)
+    
+    def _topological_order(self) -> List[str]:
+        """Kahn's algorithm; raises ValueError on cycles."""
+        remaining = {task: len(deps) for task, deps in self.dependencies.items()}
+        ready = [task for task in self.tasks if remaining[task] == 0]
+        order = []
+        
+        while ready:
+            task = ready.pop(0)
+            order.append(task)
+            for dependent in self.dependents[task]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        
+        if len(order) != len(self.tasks):
+            cyclic = sorted(task for task, count in remaining.items() if count > 0)
+            raise ValueError(f"Dependency cycle among: {', '.join(cyclic)}")
+        
+        return order
+    
+    def _chain_heights(self) -> Dict[str, int]:
+        """Length of the longest chain starting at each task."""
+        height: Dict[str, int] = {}
+        for task in reversed(self.order):
+            height[task] = 1 + max((height[d] for d in self.dependents[task]), default=0)
+        return height
+    
+    def run(
+        self,
+        task_fn: Callable[[str], bool],
+        max_workers: int = 1,
+        on_start: Optional[Callable[[str], None]] = None,
+        on_skip: Optional[Callable[[str], None]] = None,
+    ) -> ScheduleReport:
+        """
+        Run every task, respecting dependencies.
+        
+        Args:
+            task_fn: Called with a task ID on a worker thread; returns True
+                     on success. Exceptions count as failure.
+            max_workers: Maximum tasks running at once.
+            on_start: Called (on the scheduling thread) as each task is submitted.
+            on_skip: Called for each task skipped because a dependency failed.
+        
+        Returns:
+            ScheduleReport with per-task timing and the critical path.
+        """
+        report = ScheduleReport()
+        timings_lock = threading.Lock()
+        start = time.monotonic()
+        
+        def timed(task: str) -> bool:
+            started = time.monotonic() - start
+            succeeded = False
+            try:
+                succeeded = bool(task_fn(task))
+            except Exception as e:
+                print(f"Warning: {task} failed: {e}")
+            finally:
+                with timings_lock:
+                    report.timings[task] = TaskTiming(
+                        task_id=task,
+                        started=started,
+                        finished=time.monotonic() - start,
+                        succeeded=succeeded,
+                    )
+            return succeeded
+        
+        remaining = {task: len(deps) for task, deps in self.dependencies.items()}
+        rank = {task: i for i, task in enumerate(self.tasks)}
+        ready = [task for task in self.tasks if remaining[task] == 0]
+        running: Dict[Future, str] = {}
+        skipped = set()
+        
+        def skip_downstream(task: str) -> None:
+            for dependent in self.dependents[task]:
+                if dependent not in skipped:
+                    skipped.add(dependent)
+                    report.skipped.append(dependent)
+                    if on_skip:
+                        on_skip(dependent)
+                    skip_downstream(dependent)
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while ready or running:
+                # Longest remaining chain first, then declaration order
+                ready.sort(key=lambda t: (-self.height[t], rank[t]))
+                while ready and len(running) < max(1, max_workers):
+                    task = ready.pop(0)
+                    if on_start:
+                        on_start(task)
+                    running[executor.submit(timed, task)] = task
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    if not future.result():
+                        skip_downstream(task)
+                        continue
+                    for dependent in self.dependents[task]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0 and dependent not in skipped:
+                            ready.append(dependent)
+        
+        report.wall_time = time.monotonic() - start
+        report.critical_path, report.critical_path_time = self._critical_path(report.timings)
+        return report
+    
+    def _critical_path(self, timings: Dict[str, TaskTiming]) -> Tuple[List[str], float]:
+        """Longest chain of measured task durations through the graph."""
+        best: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        
+        for task in self.order:
+            if task not in timings:
+                continue
+            prior = [d for d in self.dependencies[task] if d in best]
+            parent = max(prior, key=lambda d: best[d], default=None)
+            best[task] = timings[task].duration + (best[parent] if parent else 0.0)
+            previous[task] = parent
+        
+        if not best:
+            return [], 0.0
+        
+        task: Optional[str] = max(best, key=lambda t: best[t])
+        total = best[task]
+        path = []
+        while task:
+            path.append(task)
+            task = previous[task]
+        return list(reversed(path)), total
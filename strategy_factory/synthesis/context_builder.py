@@ -5,13 +5,67 @@ Combines research results, TLDR knowledge, and user context
 into structured prompts for synthesis.
 """
 
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
 
-from ..config import DELIVERABLES, TLDR_GUIDES_DIR
+from ..config import (
+    DELIVERABLES,
+    KNOWLEDGE_RETRIEVAL_TOP_N,
+    SYNTHESIS_CONTEXT_TOKEN_BUDGET,
+    TLDR_GUIDES_DIR,
+)
 from ..models import ResearchOutput, CompanyInput
 from ..temporal import get_temporal_context, TemporalContext
 from ..knowledge_loader import KnowledgeLoader
+from .context_packer import (
+    ContextBlock,
+    ContextPacker,
+    blocks_from_markdown,
+    budget_for,
+    group_by_source,
+    render_blocks,
+)
+
+
+# Relevance prior for sections of upstream deliverables
+DEPENDENCY_BLOCK_WEIGHT = 1.5
+
+# Research sections every prompt starts with
+CORE_RESEARCH_SECTIONS = ("company_profile", "industry_context", "tech_landscape")
+
+
+class ResearchSnapshot:
+    """
+    Formatted research sections for one ResearchOutput.
+    
+    Each section is formatted the first time a deliverable needs it and
+    reused by every later deliverable in the run.
+    """
+    
+    def __init__(self, research: ResearchOutput, formatters: Dict[str, Callable[[ResearchOutput], str]]):
+        """
+        Initialize the snapshot.
+        
+        Args:
+            research: Research output the sections are formatted from.
+            formatters: Section name -> formatting function.
+        """
+        self.research = research
+        self._formatters = formatters
+        self._sections: Dict[str, str] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, name: str) -> str:
+        """Get a formatted section, formatting it on first use."""
+        with self._lock:
+            if name in self._sections:
+                return self._sections[name]
+        
+        # Formatting is pure, so a concurrent duplicate is harmless
+        text = self._formatters[name](self.research)
+        with self._lock:
+            return self._sections.setdefault(name, text)
 
 
 class ContextBuilder:
@@ -24,6 +78,10 @@ class ContextBuilder:
     - User-provided context
     - Temporal context
     - Previously generated deliverables (for dependencies)
+    
+    Guide sections, dependency sections and optional research sections
+    are ranked by relevance and packed into a per-deliverable token
+    budget (see context_packer).
     """
     
     def __init__(
@@ -41,6 +99,55 @@ class ContextBuilder:
         self.knowledge_loader = knowledge_loader or KnowledgeLoader()
         self.temporal = temporal or get_temporal_context()
         self.generated_deliverables: Dict[str, str] = {}
+        
+        self._temporal_values = self.temporal.get_context()
+        self._temporal_prompt = self.temporal.format_for_prompt()
+        self._snapshot: Optional[ResearchSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+    
+    def _research_snapshot(self, research: ResearchOutput) -> ResearchSnapshot:
+        """Get the formatted-section snapshot for this run's research."""
+        with self._snapshot_lock:
+            if self._snapshot is None or self._snapshot.research is not research:
+                self._snapshot = ResearchSnapshot(research, {
+                    "company_profile": self._format_company_profile,
+                    "industry_context": self._format_industry_context,
+                    "competitors": self._format_competitors,
+                    "tech_landscape": self._format_tech_landscape,
+                    "regulatory_context": self._format_regulatory_context,
+                })
+            return self._snapshot
+    
+    def _optional_sections(self, deliverable_id: str, research: ResearchOutput) -> Dict[str, bool]:
+        """
+        Optional research sections a deliverable's prompt may include.
+        
+        Competitor and regulatory research is always included (pinned) for
+        the deliverables that are about them, and otherwise competes for
+        the context budget when there is any.
+        
+        Returns:
+            Section name -> whether it is pinned.
+        """
+        lowered = deliverable_id.lower()
+        reg = research.regulatory
+        candidates = [
+            (
+                "competitors",
+                "competitor" in lowered or "vendor" in lowered,
+                bool(research.competitors),
+            ),
+            (
+                "regulatory_context",
+                any(word in lowered for word in ["policy", "governance", "regulatory"]),
+                bool(reg.industry_regulations or reg.ai_regulations or reg.data_privacy_requirements),
+            ),
+        ]
+        return {
+            name: pinned
+            for name, pinned, available in candidates
+            if pinned or available
+        }
     
     def build_context(
         self,
@@ -60,6 +167,8 @@ class ContextBuilder:
             Dict with all context needed for synthesis.
         """
         deliverable_config = DELIVERABLES.get(deliverable_id, {})
+        snapshot = self._research_snapshot(research)
+        optional = self._optional_sections(deliverable_id, research)
         
         context = {
             # Company info
@@ -68,18 +177,13 @@ class ContextBuilder:
             "industry": company_input.industry or research.industry.primary_industry,
             
             # Temporal context
-            **self.temporal.get_context(),
-            "temporal_prompt": self.temporal.format_for_prompt(),
+            **self._temporal_values,
+            "temporal_prompt": self._temporal_prompt,
             
-            # Research sections
-            "company_profile": self._format_company_profile(research),
-            "industry_context": self._format_industry_context(research),
-            "competitors": self._format_competitors(research),
-            "tech_landscape": self._format_tech_landscape(research),
-            "regulatory_context": self._format_regulatory_context(research),
-            
-            # Knowledge base
-            "tldr_knowledge": self._load_tldr_knowledge(deliverable_id),
+            # Research sections (only those this deliverable can use)
+            **{name: snapshot.get(name) for name in CORE_RESEARCH_SECTIONS},
+            **{name: snapshot.get(name) for name in optional},
+            "optional_sections": optional,
             
             # Dependencies (previously generated content)
             "dependencies": self._get_dependencies(deliverable_id),
@@ -233,30 +337,54 @@ class ContextBuilder:
         
         return "\n\n".join(sections) if sections else "No regulatory context available."
     
-    def _load_tldr_knowledge(self, deliverable_id: str) -> str:
-        """Load relevant TLDR knowledge for a deliverable."""
+    def _retrieval_query(
+        self,
+        deliverable_id: str,
+        research: ResearchOutput,
+        company_input: CompanyInput,
+    ) -> str:
+        """Knowledge base query: industry, pain points and deliverable name."""
         deliverable_config = DELIVERABLES.get(deliverable_id, {})
-        tldr_guides = deliverable_config.get("tldr_guides", [])
-        
-        if not tldr_guides:
-            return ""
-        
-        knowledge_sections = []
-        
-        for guide_name in tldr_guides:
-            content = self.knowledge_loader.load_guide(guide_name)
-            if content:
-                # Truncate to reasonable length
-                if len(content) > 5000:
-                    content = content[:5000] + "\n\n[Content truncated...]"
-                knowledge_sections.append(
-                    f"### From: {guide_name}\n{content}"
-                )
-        
-        if knowledge_sections:
-            return "## Consulting Knowledge Base\n\n" + "\n\n---\n\n".join(knowledge_sections)
+        parts = [
+            deliverable_config.get("name", deliverable_id),
+            company_input.industry or research.industry.primary_industry,
+            *(company_input.challenges or []),
+            *research.industry.challenges[:5],
+        ]
+        return "\n".join(part for part in parts if part)
+    
+    def _guide_blocks(
+        self,
+        deliverable_id: str,
+        research: ResearchOutput,
+        company_input: CompanyInput,
+    ) -> List[ContextBlock]:
+        """
+        Candidate blocks from the guide passages most relevant to a deliverable.
         
-        return ""
+        Passages are retrieved with BM25 across every guide; the guides
+        configured for the deliverable are preferred, not required.
+        """
+        deliverable_config = DELIVERABLES.get(deliverable_id, {})
+        matches = self.knowledge_loader.retriever.search(
+            self._retrieval_query(deliverable_id, research, company_input),
+            top_n=KNOWLEDGE_RETRIEVAL_TOP_N,
+            preferred_guides=deliverable_config.get("tldr_guides", []),
+        )
+        
+        # Candidate order is render order: group by guide, then document order
+        matches.sort(key=lambda match: (match[0].guide, match[0].position))
+        return [
+            ContextBlock(
+                kind="guide",
+                source=section.guide,
+                heading=section.heading,
+                text=text,
+                order=section.position,
+                tokens=section.tokens,
+            )
+            for section, text, _ in matches
+        ]
     
     def _get_dependencies(self, deliverable_id: str) -> Dict[str, str]:
         """Get content from dependent deliverables."""
@@ -271,7 +399,7 @@ class ContextBuilder:
         for dep_id in dependencies:
             if dep_id == "ALL_MARKDOWN":
                 # Include all markdown deliverables
-                for d_id, content in self.generated_deliverables.items():
+                for d_id, content in list(self.generated_deliverables.items()):
                     if DELIVERABLES.get(d_id, {}).get("format") == "markdown":
                         dep_content[d_id] = content
             elif dep_id in self.generated_deliverables:
@@ -289,31 +417,127 @@ class ContextBuilder:
         """
         self.generated_deliverables[deliverable_id] = content
     
-    def format_dependencies_for_prompt(self, dependencies: Dict[str, str]) -> str:
-        """Format dependencies for inclusion in prompt."""
-        if not dependencies:
+    def _dependency_blocks(self, dependencies: Dict[str, str]) -> List[ContextBlock]:
+        """Split previously generated deliverables into candidate blocks."""
+        blocks = []
+        for dep_id, content in dependencies.items():
+            # Upstream deliverables are written for this client, so they
+            # outrank generic guide material at equal lexical relevance
+            blocks.extend(blocks_from_markdown(
+                "dependency", dep_id, content, weight=DEPENDENCY_BLOCK_WEIGHT
+            ))
+        return blocks
+    
+    def _research_blocks(self, context: Dict[str, Any]) -> List[ContextBlock]:
+        """Optional research sections (see _optional_sections) as candidate blocks."""
+        return [
+            ContextBlock(
+                kind="research",
+                source=name,
+                heading="",
+                text=context[name],
+                pinned=pinned,
+            )
+            for name, pinned in context["optional_sections"].items()
+        ]
+    
+    def format_dependencies_for_prompt(
+        self,
+        blocks: Union[List[ContextBlock], Dict[str, str]],
+    ) -> str:
+        """
+        Format packed dependency blocks for inclusion in prompt.
+        
+        Args:
+            blocks: Packed dependency blocks. A dict of deliverable ID ->
+                    content (the pre-packing signature) is still accepted
+                    and split into blocks unpacked.
+        
+        Returns:
+            Prompt section, or "" if there are no dependencies.
+        """
+        if isinstance(blocks, dict):
+            blocks = self._dependency_blocks(blocks)
+        if not blocks:
             return ""
         
         sections = ["## Previously Generated Content\n"]
         
-        for dep_id, content in dependencies.items():
+        for dep_id, dep_blocks in group_by_source(blocks).items():
             dep_name = DELIVERABLES.get(dep_id, {}).get("name", dep_id)
-            # Truncate long content
-            if len(content) > 3000:
-                content = content[:3000] + "\n\n[Content truncated...]"
-            sections.append(f"### {dep_name}\n{content}")
+            sections.append(f"### {dep_name}\n{render_blocks(dep_blocks)}")
         
         return "\n\n".join(sections)
     
-    def build_full_prompt(
+    def format_knowledge_for_prompt(self, blocks: List[ContextBlock]) -> str:
+        """Format packed guide blocks for inclusion in prompt."""
+        if not blocks:
+            return ""
+        
+        knowledge_sections = [
+            f"### From: {guide_name}\n{render_blocks(guide_blocks)}"
+            for guide_name, guide_blocks in group_by_source(blocks).items()
+        ]
+        return "## Consulting Knowledge Base\n\n" + "\n\n---\n\n".join(knowledge_sections)
+    
+    def pack_context(
+        self,
+        deliverable_id: str,
+        research: ResearchOutput,
+        company_input: CompanyInput,
+        context: Dict[str, Any],
+        prompt_template: str,
+    ) -> Dict[str, List[ContextBlock]]:
+        """
+        Choose the research, guide and dependency blocks for a prompt.
+        
+        Candidates are ranked against the deliverable name, its prompt
+        template and the industry, then packed into the deliverable's
+        token budget (DELIVERABLES[...]["context_budget"], defaulting to
+        SYNTHESIS_CONTEXT_TOKEN_BUDGET).
+        
+        Args:
+            deliverable_id: ID of the deliverable.
+            research: Research output.
+            company_input: Company input.
+            context: Output of build_context.
+            prompt_template: The prompt template to use.
+        
+        Returns:
+            Selected blocks by kind ("research", "guide", "dependency").
+        """
+        deliverable_config = DELIVERABLES.get(deliverable_id, {})
+        packer = ContextPacker(budget_for(deliverable_config, SYNTHESIS_CONTEXT_TOKEN_BUDGET))
+        
+        candidates = (
+            self._research_blocks(context)
+            + self._guide_blocks(deliverable_id, research, company_input)
+            + self._dependency_blocks(context["dependencies"])
+        )
+        query = "\n".join([
+            context["deliverable_name"],
+            context["industry"] or "",
+            prompt_template,
+        ])
+        
+        selected: Dict[str, List[ContextBlock]] = {"research": [], "guide": [], "dependency": []}
+        for block in packer.pack(candidates, query):
+            selected[block.kind].append(block)
+        return selected
+    
+    def build_prompt_parts(
         self,
         deliverable_id: str,
         prompt_template: str,
         research: ResearchOutput,
         company_input: CompanyInput,
-    ) -> str:
+    ) -> Tuple[str, str]:
         """
-        Build complete prompt with all context.
+        Build a prompt as a shared prefix and a per-deliverable suffix.
+        
+        The prefix (temporal context, company research, client context)
+        is identical for every deliverable in a run, so it can be cached
+        by the model provider; prefix + suffix is the full prompt.
         
         Args:
             deliverable_id: ID of the deliverable.
@@ -322,12 +546,13 @@ class ContextBuilder:
             company_input: Company input.
         
         Returns:
-            Fully formatted prompt string.
+            (prefix, suffix) tuple.
         """
         context = self.build_context(deliverable_id, research, company_input)
+        packed = self.pack_context(deliverable_id, research, company_input, context, prompt_template)
         
-        # Build the full prompt
-        prompt_parts = [
+        # Shared prefix: the same for every deliverable
+        prefix_parts = [
             context["temporal_prompt"],
             f"\n# Company: {context['company_name']}",
             f"\n{context['company_profile']}",
@@ -335,31 +560,55 @@ class ContextBuilder:
             f"\n{context['tech_landscape']}",
         ]
         
-        # Add competitors if relevant
-        if "competitor" in deliverable_id.lower() or "vendor" in deliverable_id.lower():
-            prompt_parts.append(f"\n{context['competitors']}")
+        # Add user context if provided
+        if context["company_context"]:
+            prefix_parts.append(
+                f"\n## Additional Context from Client\n{context['company_context']}"
+            )
         
-        # Add regulatory context if relevant
-        if any(word in deliverable_id.lower() for word in ["policy", "governance", "regulatory"]):
-            prompt_parts.append(f"\n{context['regulatory_context']}")
+        # Per-deliverable suffix
+        suffix_parts = []
+        
+        # Add competitor / regulatory research that made the cut
+        for block in packed["research"]:
+            suffix_parts.append(f"\n{block.text}")
         
         # Add TLDR knowledge
-        if context["tldr_knowledge"]:
-            prompt_parts.append(f"\n{context['tldr_knowledge']}")
+        if packed["guide"]:
+            suffix_parts.append(f"\n{self.format_knowledge_for_prompt(packed['guide'])}")
         
         # Add dependencies
-        if context["dependencies"]:
-            prompt_parts.append(
-                f"\n{self.format_dependencies_for_prompt(context['dependencies'])}"
-            )
-        
-        # Add user context if provided
-        if context["company_context"]:
-            prompt_parts.append(
-                f"\n## Additional Context from Client\n{context['company_context']}"
+        if packed["dependency"]:
+            suffix_parts.append(
+                f"\n{self.format_dependencies_for_prompt(packed['dependency'])}"
             )
         
         # Add the actual prompt template
-        prompt_parts.append(f"\n---\n\n{prompt_template}")
+        suffix_parts.append(f"\n---\n\n{prompt_template}")
+        
+        return "\n".join(prefix_parts) + "\n", "\n".join(suffix_parts)
+    
+    def build_full_prompt(
+        self,
+        deliverable_id: str,
+        prompt_template: str,
+        research: ResearchOutput,
+        company_input: CompanyInput,
+    ) -> str:
+        """
+        Build complete prompt with all context.
         
-        return "\n".join(prompt_parts)
+        Args:
+            deliverable_id: ID of the deliverable.
+            prompt_template: The prompt template to use.
+            research: Research output.
+            company_input: Company input.
+        
+        Returns:
+            Fully formatted prompt string.
+        """
+        prefix, suffix = self.build_prompt_parts(
+            deliverable_id, prompt_template, research, company_input
+        )
+        return prefix + suffix
+        
\ No newline at end of file
@@ -0,0 +1,224 @@
+"""
+Token-budgeted context packing for synthesis prompts.
+
+Instead of cutting every guide and dependency at a fixed character count
+(which keeps whatever happens to come first), candidate context is split
+into heading-delimited blocks, each block is scored for relevance to the
+deliverable, and the best blocks are packed greedily into a token budget.
+Selected blocks are emitted in their original document order.
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from ..text_utils import CHARS_PER_TOKEN, estimate_tokens, split_markdown_sections, tokenize
+
+
+# Blocks larger than this are split further at paragraph boundaries
+MAX_BLOCK_TOKENS = 800
+
+# Remaining budget below which an oversized block is not truncated to fit
+MIN_TRUNCATED_TOKENS = 150
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to about max_tokens, at a line boundary where possible."""
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    if cut < limit // 2:
+        cut = limit
+    return text[:cut].rstrip() + "\n\n[Content truncated...]"
+
+
+@dataclass
+class ContextBlock:
+    """A candidate piece of prompt context."""
+    kind: str  # "research", "guide" or "dependency"
+    source: str  # Guide file, deliverable ID or research section name
+    heading: str  # Heading path within the source
+    text: str
+    order: int = 0  # Position within the source
+    pinned: bool = False  # Always included, ahead of ranked blocks
+    weight: float = 1.0  # Prior multiplier on relevance
+    tokens: int = 0
+    score: float = 0.0
+    terms: Counter = field(default_factory=Counter, repr=False)
+    
+    def __post_init__(self):
+        if not self.tokens:
+            self.tokens = estimate_tokens(self.text)
+        if not self.terms:
+            self.terms = Counter(tokenize(f"{self.heading}\n{self.text}"))
+
+
+def blocks_from_markdown(
+    kind: str,
+    source: str,
+    text: str,
+    weight: float = 1.0,
+    max_block_tokens: int = MAX_BLOCK_TOKENS,
+) -> List[ContextBlock]:
+    """
+    Split a markdown document into context blocks.
+    
+    Args:
+        kind: Block kind.
+        source: Source name (guide file, deliverable ID, ...).
+        text: Markdown content.
+        weight: Relevance prior for every block.
+        max_block_tokens: Size above which sections are split further.
+    
+    Returns:
+        Blocks in document order.
+    """
+    return [
+        ContextBlock(
+            kind=kind,
+            source=source,
+            heading=heading,
+            text=body,
+            order=order,
+            weight=weight,
+        )
+        for order, (heading, body) in enumerate(split_markdown_sections(text, max_block_tokens))
+    ]
+
+
+class ContextPacker:
+    """
+    Ranks context blocks against a query and packs them into a budget.
+    
+    Relevance is a TF-IDF style overlap between the query and each block,
+    with IDF taken over the candidate blocks themselves, dampened by block
+    length and scaled by the block's prior weight. Earlier blocks of a
+    source (summaries, key concepts) get a mild position boost.
+    
+    Usage:
+        packer = ContextPacker(budget_tokens=5000)
+        selected = packer.pack(blocks, query="AI maturity assessment readiness")
+    """
+    
+    def __init__(self, budget_tokens: int):
+        """
+        Initialize the packer.
+        
+        Args:
+            budget_tokens: Maximum estimated tokens of packed context.
+        """
+        self.budget_tokens = budget_tokens
+    
+    def score(self, blocks: List[ContextBlock], query: str) -> None:
+        """Set each block's relevance score for the query."""
+        query_terms = set(tokenize(query))
+        if not blocks:
+            return
+        
+        df: Counter = Counter()
+        for block in blocks:
+            df.update(set(block.terms) & query_terms)
+        n = len(blocks)
+        
+        for block in blocks:
+            overlap = 0.0
+            for term in query_terms:
+                tf = block.terms.get(term, 0)
+                if tf:
+                    overlap += (1 + math.log(tf)) * math.log(1 + n / df[term])
+            length_norm = 1 + math.log(1 + block.tokens / 100)
+            position_boost = 1 + 0.25 / (1 + block.order)
+            block.score = block.weight * position_boost * overlap / length_norm
+    
+    def pack(self, blocks: Iterable[ContextBlock], query: str) -> List[ContextBlock]:
+        """
+        Select the most relevant blocks that fit the budget.
+        
+        Pinned blocks go in first. Remaining blocks are taken best-first;
+        a block that does not fit is skipped in favour of smaller ones,
+        except that the best block that does not fit is truncated into
+        the leftover budget when enough of it remains.
+        
+        Args:
+            blocks: Candidate blocks.
+            query: Text describing what the deliverable needs.
+        
+        Returns:
+            Selected blocks, in candidate order.
+        """
+        blocks = list(blocks)
+        self.score(blocks, query)
+        
+        selected: Dict[int, ContextBlock] = {}
+        remaining = self.budget_tokens
+        
+        for i, block in enumerate(blocks):
+            if block.pinned:
+                selected[i] = block
+                remaining -= block.tokens
+        
+        ranked = sorted(
+            (i for i, b in enumerate(blocks) if not b.pinned and b.score > 0),
+            key=lambda i: -blocks[i].score,
+        )
+        truncated_one = False
+        for i in ranked:
+            if remaining <= 0:
+                break
+            block = blocks[i]
+            if block.tokens <= remaining:
+                selected[i] = block
+                remaining -= block.tokens
+            elif not truncated_one and remaining >= MIN_TRUNCATED_TOKENS:
+                text = truncate_to_tokens(block.text, remaining)
+                selected[i] = ContextBlock(
+                    kind=block.kind,
+                    source=block.source,
+                    heading=block.heading,
+                    text=text,
+                    order=block.order,
+                    weight=block.weight,
+                    score=block.score,
+                    terms=block.terms,
+                )
+                remaining -= selected[i].tokens
+                truncated_one = True
+        
+        return [selected[i] for i in sorted(selected)]
+
+
+def group_by_source(blocks: List[ContextBlock]) -> Dict[str, List[ContextBlock]]:
+    """Group blocks by source, keeping first-seen source order."""
+    grouped: Dict[str, List[ContextBlock]] = {}
+    for block in blocks:
+        grouped.setdefault(block.source, []).append(block)
+    return grouped
+
+
+def render_blocks(blocks: List[ContextBlock], heading_level: int = 4) -> str:
+    """
+    Render one source's blocks, restoring each block's own heading.
+    
+    Args:
+        blocks: Blocks from a single source, in order.
+        heading_level: Markdown level for heading paths of blocks whose
+                       text does not start with its heading.
+    
+    Returns:
+        Markdown text.
+    """
+    parts = []
+    for block in blocks:
+        text = block.text
+        if block.heading and not text.lstrip().startswith("#"):
+            text = f"{'#' * heading_level} {block.heading}\n{text}"
+        parts.append(text)
+    return "\n\n".join(parts)
+
+
+def budget_for(deliverable_config: Dict, default: int) -> int:
+    """Per-deliverable context budget (DELIVERABLES[...]["context_budget"])."""
+    budget: Optional[int] = deliverable_config.get("context_budget")
+    return budget if budget else default
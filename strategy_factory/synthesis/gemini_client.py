@@ -3,17 +3,51 @@ Gemini API client wrapper with retry logic.
 
 Provides a robust interface for making Gemini API calls
 with automatic retries, exponential backoff, and cost tracking.
+
+generate()/generate_markdown() block the calling thread;
+generate_async()/generate_markdown_async() are coroutines, so many
+requests can be in flight at once. Both draw from the same per-minute
+request and token quota.
+
+Requests that share a long prompt prefix can pass it separately
+(prefix=...): it is registered once as provider cached content and each
+request then sends only its own suffix.
 """
 
+import asyncio
+import hashlib
+import json
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Callable
+from dataclasses import dataclass, asdict
 
 import google.generativeai as genai
 
-from ..config import GEMINI_MODEL, GEMINI_REQUEST_DELAY, RETRY_CONFIG
+from ..config import (
+    GEMINI_CONTEXT_CACHE,
+    GEMINI_CONTEXT_CACHE_MIN_TOKENS,
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS,
+    GEMINI_MODEL,
+    GEMINI_MODEL_CACHE_SIZE,
+    GEMINI_PREFLIGHT_TOKEN_COUNT,
+    GEMINI_REQUESTS_PER_MINUTE,
+    GEMINI_TOKENS_PER_MINUTE,
+    RETRY_CONFIG,
+    SYNTHESIS_CACHE_DIR,
+    SYNTHESIS_CACHE_MAX_BYTES,
+)
+from ..disk_cache import DiskCache, make_cache_key
+from ..rate_limiter import PerMinuteQuota
+from .prefix_cache import GeminiPrefixCache, PrefixCacheProvider
+
+
+# Receives each piece of response text as it streams in
+StreamCallback = Callable[[str], None]
 
 
 @dataclass
@@ -26,6 +60,8 @@ class SynthesisResult:
     completion_tokens: int
     cost_estimate: float
     error: Optional[str] = None
+    cached: bool = False  # Served from the synthesis cache (no API cost)
+    tokens_estimated: bool = False  # No usage_metadata; counts are len // 4 guesses
 
 
 class GeminiClient:
@@ -35,18 +71,50 @@ class GeminiClient:
     Features:
     - Automatic retry with exponential backoff
     - Cost estimation and tracking
-    - Rate limiting
-    - Token counting
+    - Rate limiting (requests and tokens per minute)
+    - Token accounting from response usage_metadata, with optional
+      memoized count_tokens preflight
+    - Async variants for many concurrent requests
+    - Response cache keyed on model, instruction, prompt and config
+    - Optional streaming of response text to a callback
+    - Shared prompt prefixes registered once as cached content
+    
+    Safe to share between threads and coroutines; all callers draw from
+    one GEMINI_REQUESTS_PER_MINUTE / GEMINI_TOKENS_PER_MINUTE quota.
     """
     
     # Gemini 2.5 Flash pricing (per 1M tokens)
     COST_PER_1M_INPUT = 0.075  # $0.075 per 1M input tokens
     COST_PER_1M_OUTPUT = 0.30  # $0.30 per 1M output tokens
+    COST_PER_1M_CACHED_INPUT = 0.01875  # cached prefix tokens bill at 25%
+    
+    # Preflight count_tokens results kept in memory (least recently used dropped)
+    TOKEN_COUNT_CACHE_SIZE = 256
+    
+    MARKDOWN_INSTRUCTION = """
+You are generating professional consulting documentation in Markdown format.
+Follow these formatting guidelines:
+- Use proper heading hierarchy (# for title, ## for sections, ### for subsections)
+- Use bullet points and numbered lists for clarity
+- Include tables where appropriate using markdown syntax
+- CRITICAL: For markdown tables, each row must be on a single line. Table separator row must only have dashes like |---|---|---|
+- Use **bold** for emphasis and `code` for technical terms
+- Keep paragraphs concise and actionable
+- Do not include ```markdown``` code fences around the output
+"""
     
     def __init__(
         self,
         api_key: Optional[str] = None,
         model_name: str = GEMINI_MODEL,
+        quota: Optional[PerMinuteQuota] = None,
+        model_cache_size: int = GEMINI_MODEL_CACHE_SIZE,
+        enable_cache: bool = True,
+        response_cache: Optional[DiskCache] = None,
+        preflight_token_count: bool = GEMINI_PREFLIGHT_TOKEN_COUNT,
+        enable_prefix_cache: bool = GEMINI_CONTEXT_CACHE,
+        prefix_cache: Optional[PrefixCacheProvider] = None,
+        prefix_cache_ttl: int = GEMINI_CONTEXT_CACHE_TTL_SECONDS,
     ):
         """
         Initialize the Gemini client.
@@ -54,6 +122,20 @@ class GeminiClient:
         Args:
             api_key: Gemini API key. If not provided, uses GEMINI_API_KEY env var.
             model_name: Model to use for synthesis.
+            quota: Request/token limiter, shareable between clients. Defaults
+                   to GEMINI_REQUESTS_PER_MINUTE and GEMINI_TOKENS_PER_MINUTE.
+            model_cache_size: How many models (one per distinct system
+                              instruction) to keep for reuse.
+            enable_cache: Whether to serve identical requests from the
+                          synthesis cache.
+            response_cache: Cache to use. Defaults to SYNTHESIS_CACHE_DIR.
+            preflight_token_count: Call count_tokens before each request so
+                                   the token quota is reserved exactly.
+            enable_prefix_cache: Whether prefixes passed to generate() are
+                                 registered as cached content.
+            prefix_cache: Provider for cached prefixes. Defaults to the
+                          Gemini cached-content API.
+            prefix_cache_ttl: Seconds the provider keeps each prefix.
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
@@ -70,33 +152,367 @@ class GeminiClient:
         self.request_count = 0
         
         # Rate limiting
-        self.last_request_time = 0.0
-        self.min_request_interval = GEMINI_REQUEST_DELAY
-    
-    def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
-    
-    def _estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
-        """Estimate the cost of a request."""
-        input_cost = (input_tokens / 1_000_000) * self.COST_PER_1M_INPUT
+        self.quota = quota or PerMinuteQuota(
+            requests_per_minute=GEMINI_REQUESTS_PER_MINUTE,
+            tokens_per_minute=GEMINI_TOKENS_PER_MINUTE,
+        )
+        
+        # Guards counters across threads
+        self._lock = threading.Lock()
+        
+        # Models keyed by (model name, instruction hash), least recently used first
+        self._models: "OrderedDict[tuple, genai.GenerativeModel]" = OrderedDict()
+        self._models_lock = threading.Lock()
+        self.model_cache_size = model_cache_size
+        
+        # Response cache
+        self.response_cache: Optional[DiskCache] = None
+        if enable_cache:
+            self.response_cache = response_cache or DiskCache(
+                SYNTHESIS_CACHE_DIR,
+                max_bytes=SYNTHESIS_CACHE_MAX_BYTES,
+                suffix=".json",
+            )
+        self.cache_hits = 0
+        
+        # Preflight token counts keyed on (model, instruction, prompt) hash
+        self.preflight_token_count = preflight_token_count
+        self._token_counts: "OrderedDict[str, int]" = OrderedDict()
+        self._token_counts_lock = threading.Lock()
+        self.estimated_requests = 0
+    
+        # Cached prompt prefixes keyed on (model, instruction, prefix) hash.
+        # Each future resolves to (handle, model), or None for prefixes that
+        # are sent inline; the lock only guards the dict, never a registration
+        self.prefix_cache: Optional[PrefixCacheProvider] = None
+        if enable_prefix_cache or prefix_cache:
+            self.prefix_cache = prefix_cache or GeminiPrefixCache(GEMINI_CONTEXT_CACHE_MIN_TOKENS)
+        self.prefix_cache_ttl = prefix_cache_ttl
+        self._prefixes: Dict[str, Future] = {}
+        self._prefixes_lock = threading.Lock()
+        self.prefix_registrations = 0
+        self.total_cached_tokens = 0
+    
+    def _rate_limit(self, input_tokens: int = 0) -> None:
+        """Wait for quota for one request of input_tokens tokens."""
+        self.quota.acquire(tokens=input_tokens)
+    
+    async def _rate_limit_async(self, input_tokens: int = 0) -> None:
+        """Wait for quota without blocking the event loop."""
+        await self.quota.acquire_async(tokens=input_tokens)
+    
+    def _estimate_cost(self, input_tokens: int, output_tokens: int, cached_tokens: int = 0) -> float:
+        """Estimate the cost of a request (cached_tokens are part of input_tokens)."""
+        input_cost = ((input_tokens - cached_tokens) / 1_000_000) * self.COST_PER_1M_INPUT
+        cached_cost = (cached_tokens / 1_000_000) * self.COST_PER_1M_CACHED_INPUT
         output_cost = (output_tokens / 1_000_000) * self.COST_PER_1M_OUTPUT
-        return input_cost + output_cost
+        return input_cost + cached_cost + output_cost
     
     def _count_tokens(self, text: str) -> int:
-        """Estimate token count for text."""
+        """Estimate token count for text (fallback when the API gives no usage)."""
         # Rough estimate: ~4 characters per token
         return len(text) // 4
     
+    def _get_model(self, system_instruction: Optional[str]) -> genai.GenerativeModel:
+        """
+        Model to call, with the system instruction if provided.
+        
+        Deliverables share a handful of system instructions, so models are
+        cached per instruction instead of being rebuilt for every call.
+        """
+        if not system_instruction:
+            return self.model
+        
+        key = (
+            self.model_name,
+            hashlib.sha256(system_instruction.encode("utf-8")).hexdigest(),
+        )
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+        
+        model = genai.GenerativeModel(
+            self.model_name,
+            system_instruction=system_instruction,
+        )
+        
+        with self._models_lock:
+            # Another thread may have built the same model meanwhile
+            model = self._models.setdefault(key, model)
+            self._models.move_to_end(key)
+            while len(self._models) > max(1, self.model_cache_size):
+                self._models.popitem(last=False)
+        return model
+    
+    def _prefix_model(self, prefix: str, system_instruction: Optional[str]) -> Optional[Any]:
+        """
+        Model serving requests after a cached prefix, registering it on first use.
+        
+        The first caller for a prefix registers it outside the lock;
+        concurrent callers for the same prefix wait on its future, while
+        other prefixes are unaffected. Prefixes below the provider's
+        minimum size, or whose registration fails, are remembered and
+        sent inline from then on.
+        
+        Returns:
+            Cached-content model, or None to send the prefix inline.
+        """
+        if not self.prefix_cache or not prefix:
+            return None
+        
+        key = make_cache_key(self.model_name, system_instruction or "", prefix)
+        with self._prefixes_lock:
+            future = self._prefixes.get(key)
+            registering = future is None
+            if registering:
+                future = Future()
+                self._prefixes[key] = future
+        
+        if not registering:
+            entry = future.result()
+            return entry[1] if entry else None
+        
+        entry = None
+        try:
+            if self._count_tokens(prefix) >= self.prefix_cache.min_tokens:
+                handle = self.prefix_cache.create(
+                    self.model_name, system_instruction, prefix, self.prefix_cache_ttl
+                )
+                entry = (handle, self.prefix_cache.model_for(handle))
+                with self._lock:
+                    self.prefix_registrations += 1
+        except Exception as e:
+            print(f"Warning: Could not cache prompt prefix, sending it inline: {e}")
+        finally:
+            # Waiters are released even if registration raised
+            future.set_result(entry)
+        return entry[1] if entry else None
+    
+    def _drop_prefix(self, prefix: str, system_instruction: Optional[str]) -> None:
+        """
+        Stop using a cached prefix after a request on it failed.
+        
+        The handle has most likely expired. Later requests send the prefix
+        inline instead of each paying for a failed call first, and the
+        handle is deleted in case it still exists.
+        """
+        key = make_cache_key(self.model_name, system_instruction or "", prefix)
+        inline = Future()
+        inline.set_result(None)
+        with self._prefixes_lock:
+            future = self._prefixes.get(key)
+            # Another request may already have dropped it
+            if future is None or not future.done() or future.result() is None:
+                return
+            self._prefixes[key] = inline
+        
+        handle, _ = future.result()
+        try:
+            self.prefix_cache.delete(handle)
+        except Exception as e:
+            print(f"Warning: Could not delete cached prefix: {e}")
+    
+    def release_prefixes(self) -> None:
+        """Delete every cached prefix registered by this client."""
+        with self._prefixes_lock:
+            futures = list(self._prefixes.values())
+            self._prefixes.clear()
+        # Registrations still in flight are waited for, so their handles
+        # are deleted too
+        entries = [entry for entry in (future.result() for future in futures) if entry]
+        for handle, _ in entries:
+            try:
+                self.prefix_cache.delete(handle)
+            except Exception as e:
+                print(f"Warning: Could not delete cached prefix: {e}")
+    
+    def _prompt_tokens(self, prompt: str, system_instruction: Optional[str]) -> int:
+        """Estimated input tokens of a request."""
+        input_tokens = self._count_tokens(prompt)
+        if system_instruction:
+            input_tokens += self._count_tokens(system_instruction)
+        return input_tokens
+    
+    def _token_count_key(self, prompt: str, system_instruction: Optional[str]) -> str:
+        return make_cache_key(self.model_name, system_instruction or "", prompt)
+    
+    def _memoized_token_count(self, key: str) -> Optional[int]:
+        with self._token_counts_lock:
+            count = self._token_counts.get(key)
+            if count is not None:
+                self._token_counts.move_to_end(key)
+            return count
+    
+    def _memoize_token_count(self, key: str, count: int) -> None:
+        with self._token_counts_lock:
+            self._token_counts[key] = count
+            while len(self._token_counts) > self.TOKEN_COUNT_CACHE_SIZE:
+                self._token_counts.popitem(last=False)
+    
+    def count_tokens(self, prompt: str, system_instruction: Optional[str] = None) -> int:
+        """
+        Exact input token count of a request, via the count_tokens API.
+        
+        Counts are memoized per prompt hash. Falls back to the local
+        estimate if the call fails.
+        
+        Args:
+            prompt: The prompt.
+            system_instruction: Optional system instruction (counted too).
+        
+        Returns:
+            Input token count.
+        """
+        key = self._token_count_key(prompt, system_instruction)
+        count = self._memoized_token_count(key)
+        if count is not None:
+            return count
+        try:
+            count = self._get_model(system_instruction).count_tokens(prompt).total_tokens
+        except Exception as e:
+            print(f"Warning: count_tokens failed, using estimate: {e}")
+            return self._prompt_tokens(prompt, system_instruction)
+        self._memoize_token_count(key, count)
+        return count
+    
+    async def count_tokens_async(self, prompt: str, system_instruction: Optional[str] = None) -> int:
+        """Async variant of count_tokens()."""
+        key = self._token_count_key(prompt, system_instruction)
+        count = self._memoized_token_count(key)
+        if count is not None:
+            return count
+        try:
+            response = await self._get_model(system_instruction).count_tokens_async(prompt)
+            count = response.total_tokens
+        except Exception as e:
+            print(f"Warning: count_tokens failed, using estimate: {e}")
+            return self._prompt_tokens(prompt, system_instruction)
+        self._memoize_token_count(key, count)
+        return count
+    
+    def _build_result(
+        self,
+        content: str,
+        input_tokens: int,
+        usage: Any = None,
+    ) -> SynthesisResult:
+        """
+        Record usage for a response and wrap it in a SynthesisResult.
+        
+        Args:
+            content: Response text.
+            input_tokens: Input tokens known before the call (estimate or preflight).
+            usage: The response's usage_metadata, if any.
+        """
+        prompt_count = getattr(usage, "prompt_token_count", 0) if usage else 0
+        cached_tokens = 0
+        if prompt_count:
+            input_tokens = prompt_count
+            output_tokens = getattr(usage, "candidates_token_count", 0) or 0
+            cached_tokens = getattr(usage, "cached_content_token_count", 0) or 0
+            estimated = False
+        else:
+            output_tokens = self._count_tokens(content)
+            estimated = True
+        
+        # Calculate cost
+        cost = self._estimate_cost(input_tokens, output_tokens, cached_tokens)
+        
+        # Update tracking
+        with self._lock:
+            self.total_cost += cost
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cached_tokens += cached_tokens
+            self.request_count += 1
+            if estimated:
+                self.estimated_requests += 1
+        
+        return SynthesisResult(
+            content=content,
+            model_used=self.model_name,
+            timestamp=datetime.now(),
+            prompt_tokens=input_tokens,
+            completion_tokens=output_tokens,
+            cost_estimate=cost,
+            tokens_estimated=estimated,
+        )
+    
+    def _response_cache_key(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        temperature: float,
+        max_output_tokens: int,
+    ) -> str:
+        """Content address of a request."""
+        return make_cache_key(
+            self.model_name,
+            system_instruction or "",
+            prompt,
+            {"temperature": temperature, "max_output_tokens": max_output_tokens},
+        )
+    
+    def _get_cached_response(self, cache_key: str) -> Optional[SynthesisResult]:
+        """Cached result for a request, if any."""
+        if not self.response_cache:
+            return None
+        payload = self.response_cache.get_text(cache_key)
+        if payload is None:
+            return None
+        try:
+            data = json.loads(payload)
+            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+            result = SynthesisResult(**{**data, "cost_estimate": 0.0, "cached": True})
+        except (ValueError, TypeError, KeyError) as e:
+            print(f"Warning: Ignoring unreadable synthesis cache entry: {e}")
+            return None
+        with self._lock:
+            self.cache_hits += 1
+        return result
+    
+    def _store_cached_response(self, cache_key: str, result: SynthesisResult) -> None:
+        """Cache a successful result."""
+        if not self.response_cache or result.error or not result.content:
+            return
+        data = asdict(result)
+        data["timestamp"] = result.timestamp.isoformat()
+        self.response_cache.put_text(cache_key, json.dumps(data))
+    
+    @staticmethod
+    def _emit_chunk(chunk: Any, stream_callback: StreamCallback) -> str:
+        """Pass a streamed chunk's text to the callback and return it."""
+        try:
+            text = chunk.text
+        except ValueError:
+            # Chunks carrying only metadata (e.g. the finish reason) have no text
+            return ""
+        if text:
+            stream_callback(text)
+        return text
+    
+    def _failed_result(self, error: Optional[Exception]) -> SynthesisResult:
+        """Build the empty result returned once all retries fail."""
+        return SynthesisResult(
+            content="",
+            model_used=self.model_name,
+            timestamp=datetime.now(),
+            prompt_tokens=0,
+            completion_tokens=0,
+            cost_estimate=0.0,
+            error=str(error),
+        )
+    
     def generate(
         self,
         prompt: str,
         system_instruction: Optional[str] = None,
         temperature: float = 0.7,
         max_output_tokens: int = 8192,
+        stream_callback: Optional[StreamCallback] = None,
+        prefix: Optional[str] = None,
     ) -> SynthesisResult:
         """
         Generate content using Gemini.
@@ -106,86 +522,173 @@ class GeminiClient:
             system_instruction: Optional system instruction.
             temperature: Sampling temperature (0-1).
             max_output_tokens: Maximum tokens in response.
+            stream_callback: If set, the response is streamed and each text
+                             chunk is passed to it as it arrives. A retry
+                             streams the response again from the start.
+            prefix: Text that goes before the prompt and is shared with
+                    other requests. Sent once as cached content when the
+                    provider allows it, inline otherwise.
         
         Returns:
             SynthesisResult with generated content.
         """
+        full_prompt = f"{prefix}{prompt}" if prefix else prompt
+        cache_key = self._response_cache_key(
+            full_prompt, system_instruction, temperature, max_output_tokens
+        )
+        cached = self._get_cached_response(cache_key)
+        if cached:
+            if stream_callback:
+                stream_callback(cached.content)
+            return cached
+        
         max_retries = RETRY_CONFIG["max_retries"]
         delay = RETRY_CONFIG["initial_delay"]
         max_delay = RETRY_CONFIG["max_delay"]
         backoff = RETRY_CONFIG["backoff_multiplier"]
         
+        if self.preflight_token_count:
+            input_tokens = self.count_tokens(full_prompt, system_instruction)
+        else:
+            input_tokens = self._prompt_tokens(full_prompt, system_instruction)
         last_error = None
         
+        # Built once and reused by every retry
+        model = self._prefix_model(prefix, system_instruction)
+        request_prompt = prompt
+        if model is None:
+            model, request_prompt = self._get_model(system_instruction), full_prompt
+        generation_config = genai.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+        )
+        
         for attempt in range(max_retries):
             try:
-                self._rate_limit()
+                self._rate_limit(input_tokens)
                 
-                # Configure generation
-                generation_config = genai.GenerationConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_output_tokens,
+                # Generate response
+                response = model.generate_content(
+                    request_prompt,
+                    generation_config=generation_config,
+                    stream=stream_callback is not None,
                 )
                 
-                # Create model with system instruction if provided
-                if system_instruction:
-                    model = genai.GenerativeModel(
-                        self.model_name,
-                        system_instruction=system_instruction,
+                if stream_callback:
+                    content = "".join(
+                        self._emit_chunk(chunk, stream_callback) for chunk in response
                     )
                 else:
-                    model = self.model
+                    content = response.text
                 
-                # Generate response
-                response = model.generate_content(
-                    prompt,
-                    generation_config=generation_config,
+                result = self._build_result(
+                    content, input_tokens, getattr(response, "usage_metadata", None)
                 )
+                self._store_cached_response(cache_key, result)
+                return result
                 
-                # Extract content
-                content = response.text
-                
-                # Estimate tokens
-                input_tokens = self._count_tokens(prompt)
-                if system_instruction:
-                    input_tokens += self._count_tokens(system_instruction)
-                output_tokens = self._count_tokens(content)
+            except Exception as e:
+                last_error = e
+                if request_prompt is not full_prompt:
+                    # The cached prefix may have expired; retry with it inline
+                    self._drop_prefix(prefix, system_instruction)
+                    model, request_prompt = self._get_model(system_instruction), full_prompt
+                if attempt < max_retries - 1:
+                    print(f"Retry {attempt + 1}/{max_retries} after error: {e}")
+                    time.sleep(delay)
+                    delay = min(delay * backoff, max_delay)
+        
+        # All retries failed
+        return self._failed_result(last_error)
+    
+    async def generate_async(
+        self,
+        prompt: str,
+        system_instruction: Optional[str] = None,
+        temperature: float = 0.7,
+        max_output_tokens: int = 8192,
+        stream_callback: Optional[StreamCallback] = None,
+        prefix: Optional[str] = None,
+    ) -> SynthesisResult:
+        """
+        Generate content using Gemini without blocking the event loop.
+        
+        Accepts the same arguments as generate(). Throughput is bounded
+        by the shared per-minute quota, not by a fixed delay, so any
+        number of calls can be awaited together.
+        
+        Returns:
+            SynthesisResult with generated content.
+        """
+        full_prompt = f"{prefix}{prompt}" if prefix else prompt
+        cache_key = self._response_cache_key(
+            full_prompt, system_instruction, temperature, max_output_tokens
+        )
+        cached = self._get_cached_response(cache_key)
+        if cached:
+            if stream_callback:
+                stream_callback(cached.content)
+            return cached
+        
+        max_retries = RETRY_CONFIG["max_retries"]
+        delay = RETRY_CONFIG["initial_delay"]
+        max_delay = RETRY_CONFIG["max_delay"]
+        backoff = RETRY_CONFIG["backoff_multiplier"]
+        
+        if self.preflight_token_count:
+            input_tokens = await self.count_tokens_async(full_prompt, system_instruction)
+        else:
+            input_tokens = self._prompt_tokens(full_prompt, system_instruction)
+        last_error = None
+        
+        model = None
+        if prefix:
+            # Registration is a blocking API call
+            model = await asyncio.to_thread(self._prefix_model, prefix, system_instruction)
+        request_prompt = prompt
+        if model is None:
+            model, request_prompt = self._get_model(system_instruction), full_prompt
+        generation_config = genai.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+        )
+        
+        for attempt in range(max_retries):
+            try:
+                await self._rate_limit_async(input_tokens)
                 
-                # Calculate cost
-                cost = self._estimate_cost(input_tokens, output_tokens)
+                response = await model.generate_content_async(
+                    request_prompt,
+                    generation_config=generation_config,
+                    stream=stream_callback is not None,
+                )
                 
-                # Update tracking
-                self.total_cost += cost
-                self.total_input_tokens += input_tokens
-                self.total_output_tokens += output_tokens
-                self.request_count += 1
+                if stream_callback:
+                    content = "".join([
+                        self._emit_chunk(chunk, stream_callback) async for chunk in response
+                    ])
+                else:
+                    content = response.text
                 
-                return SynthesisResult(
-                    content=content,
-                    model_used=self.model_name,
-                    timestamp=datetime.now(),
-                    prompt_tokens=input_tokens,
-                    completion_tokens=output_tokens,
-                    cost_estimate=cost,
+                result = self._build_result(
+                    content, input_tokens, getattr(response, "usage_metadata", None)
                 )
+                self._store_cached_response(cache_key, result)
+                return result
                 
             except Exception as e:
                 last_error = e
+                if request_prompt is not full_prompt:
+                    # The cached prefix may have expired; retry with it inline
+                    await asyncio.to_thread(self._drop_prefix, prefix, system_instruction)
+                    model, request_prompt = self._get_model(system_instruction), full_prompt
                 if attempt < max_retries - 1:
                     print(f"Retry {attempt + 1}/{max_retries} after error: {e}")
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
                     delay = min(delay * backoff, max_delay)
         
         # All retries failed
-        return SynthesisResult(
-            content="",
-            model_used=self.model_name,
-            timestamp=datetime.now(),
-            prompt_tokens=0,
-            completion_tokens=0,
-            cost_estimate=0.0,
-            error=str(last_error),
-        )
+        return self._failed_result(last_error)
     
     def generate_with_context(
         self,
@@ -263,6 +766,8 @@ class GeminiClient:
         self,
         prompt: str,
         system_instruction: Optional[str] = None,
+        stream_callback: Optional[StreamCallback] = None,
+        prefix: Optional[str] = None,
     ) -> SynthesisResult:
         """
         Generate markdown content.
@@ -270,31 +775,19 @@ class GeminiClient:
         Args:
             prompt: The prompt.
             system_instruction: Optional system instruction.
+            stream_callback: Receives raw text chunks as they stream in.
+                             Table fixes apply to the returned content only.
+            prefix: Shared prompt prefix (see generate()).
 
         Returns:
             SynthesisResult with markdown content.
         """
-        # Add markdown formatting instruction
-        markdown_instruction = """
-You are generating professional consulting documentation in Markdown format.
-Follow these formatting guidelines:
-- Use proper heading hierarchy (# for title, ## for sections, ### for subsections)
-- Use bullet points and numbered lists for clarity
-- Include tables where appropriate using markdown syntax
-- CRITICAL: For markdown tables, each row must be on a single line. Table separator row must only have dashes like |---|---|---|
-- Use **bold** for emphasis and `code` for technical terms
-- Keep paragraphs concise and actionable
-- Do not include ```markdown``` code fences around the output
-"""
-
-        full_instruction = markdown_instruction
-        if system_instruction:
-            full_instruction = f"{markdown_instruction}\n\n{system_instruction}"
-
         result = self.generate(
             prompt=prompt,
-            system_instruction=full_instruction,
+            system_instruction=self._markdown_instruction(system_instruction),
             temperature=0.5,  # Lower temperature for more consistent formatting
+            stream_callback=stream_callback,
+            prefix=prefix,
         )
 
         # Post-process to fix any malformed tables
@@ -302,6 +795,44 @@ Follow these formatting guidelines:
             result.content = self._fix_malformed_tables(result.content)
 
         return result
+
+    async def generate_markdown_async(
+        self,
+        prompt: str,
+        system_instruction: Optional[str] = None,
+        stream_callback: Optional[StreamCallback] = None,
+        prefix: Optional[str] = None,
+    ) -> SynthesisResult:
+        """
+        Generate markdown content without blocking the event loop.
+
+        Args:
+            prompt: The prompt.
+            system_instruction: Optional system instruction.
+            stream_callback: Receives raw text chunks as they stream in.
+            prefix: Shared prompt prefix (see generate()).
+
+        Returns:
+            SynthesisResult with markdown content.
+        """
+        result = await self.generate_async(
+            prompt=prompt,
+            system_instruction=self._markdown_instruction(system_instruction),
+            temperature=0.5,
+            stream_callback=stream_callback,
+            prefix=prefix,
+        )
+
+        if result.content:
+            result.content = self._fix_malformed_tables(result.content)
+
+        return result
+
+    def _markdown_instruction(self, system_instruction: Optional[str]) -> str:
+        """Markdown formatting instruction, followed by the caller's instruction."""
+        if system_instruction:
+            return f"{self.MARKDOWN_INSTRUCTION}\n\n{system_instruction}"
+        return self.MARKDOWN_INSTRUCTION
     
     def get_cost_summary(self) -> Dict[str, Any]:
         """Get a summary of API usage and costs."""
@@ -310,6 +841,10 @@ Follow these formatting guidelines:
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
             "request_count": self.request_count,
+            "cache_hits": self.cache_hits,
+            "cached_input_tokens": self.total_cached_tokens,
+            "prefix_registrations": self.prefix_registrations,
+            "estimated_token_requests": self.estimated_requests,
             "avg_cost_per_request": round(
                 self.total_cost / max(1, self.request_count), 4
             ),
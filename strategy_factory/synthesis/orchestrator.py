@@ -6,11 +6,12 @@ manages context building, and tracks progress.
 """
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any
 
-from ..config import DELIVERABLES, OUTPUT_DIR
+from ..config import DELIVERABLES, OUTPUT_DIR, SYNTHESIS_MAX_CONCURRENCY
 from ..models import (
     CompanyInput,
     ResearchOutput,
@@ -20,6 +21,7 @@ from ..models import (
 )
 from ..knowledge_loader import KnowledgeLoader
 from ..temporal import get_temporal_context
+from ..scheduler import DependencyScheduler, ScheduleReport
 from .gemini_client import GeminiClient
 from .context_builder import ContextBuilder
 from .prompts import get_prompt, PROMPTS
@@ -30,30 +32,20 @@ class SynthesisOrchestrator:
     Orchestrates the synthesis of all deliverables.
     
     Responsibilities:
-    - Determine generation order based on dependencies
+    - Schedule deliverables from the DELIVERABLES dependency graph,
+      generating independent ones in parallel
     - Build context for each deliverable
     - Generate content using Gemini
     - Track progress and handle failures
     """
     
-    # Dependency levels for ordering
-    GENERATION_ORDER = [
-        # Level 1: No dependencies (Foundation)
-        ["01_tech_inventory", "02_pain_points", "13_glossary"],
-        # Level 2: Depends on foundation
-        ["04_maturity_assessment", "14_use_case_library"],
-        # Level 3: Depends on analysis
-        ["03_mermaid_diagrams", "06_quick_wins", "07_vendor_comparison"],
-        # Level 4: Depends on strategy
-        ["05_roadmap", "08_license_consolidation", "09_roi_calculator", "10_ai_policy"],
-        # Level 5: Depends on operations
-        ["11_data_governance", "12_prompt_library", "15_change_management"],
-    ]
-    
     def __init__(
         self,
         output_dir: Optional[Path] = None,
         progress_callback: Optional[Callable[[str, float], None]] = None,
+        max_concurrency: int = SYNTHESIS_MAX_CONCURRENCY,
+        use_cache: bool = True,
+        stream_callback: Optional[Callable[[str, str], None]] = None,
     ):
         """
         Initialize the synthesis orchestrator.
@@ -61,12 +53,21 @@ class SynthesisOrchestrator:
         Args:
             output_dir: Directory for output files.
             progress_callback: Callback for progress updates.
+            max_concurrency: Maximum deliverables generated at once.
+            use_cache: Reuse cached Gemini responses for unchanged prompts.
+                       Editing a prompt only regenerates that deliverable and
+                       its dependents, whose prompts embed its content.
+            stream_callback: Called with (deliverable_id, text chunk) as each
+                             deliverable streams in. Deliverables generating in
+                             parallel interleave their chunks.
         """
         self.output_dir = output_dir or OUTPUT_DIR
         self.progress_callback = progress_callback
+        self.stream_callback = stream_callback
+        self.max_concurrency = max_concurrency
         
         # Initialize components
-        self.gemini_client = GeminiClient()
+        self.gemini_client = GeminiClient(enable_cache=use_cache)
         self.knowledge_loader = KnowledgeLoader()
         self.context_builder = ContextBuilder(
             knowledge_loader=self.knowledge_loader,
@@ -76,6 +77,10 @@ class SynthesisOrchestrator:
         # Track state
         self.generated_content: Dict[str, DeliverableContent] = {}
         self.errors: List[Dict[str, Any]] = []
+        self.schedule_report: Optional[ScheduleReport] = None
+        
+        # Workers update shared state concurrently
+        self._state_lock = threading.Lock()
     
     def synthesize(
         self,
@@ -111,45 +116,57 @@ class SynthesisOrchestrator:
         
         self._report_progress("Starting synthesis", 0)
         
-        # Generate in dependency order
-        for level_index, level in enumerate(self.GENERATION_ORDER):
-            level_deliverables = [d for d in level if d in target_deliverables]
+        def run_one(deliverable_id: str) -> bool:
+            nonlocal completed_steps
             
-            for deliverable_id in level_deliverables:
-                self._report_progress(
-                    f"Generating {deliverable_id}",
-                    completed_steps / total_steps
-                )
-                
-                # Check if dependencies are met
-                if not self._check_dependencies(deliverable_id):
-                    self._record_error(
-                        deliverable_id,
-                        "Dependencies not met"
-                    )
-                    continue
-                
-                # Generate deliverable
-                content = self._generate_deliverable(
-                    deliverable_id,
-                    company_input,
-                    research,
-                )
-                
-                if content and not content.error:
+            # Dependencies outside this run must already be generated
+            if not self._check_dependencies(deliverable_id):
+                self._record_error(deliverable_id, "Dependencies not met")
+                return False
+            
+            # Generate deliverable
+            content = self._generate_deliverable(
+                deliverable_id,
+                company_input,
+                research,
+            )
+            
+            succeeded = bool(content and not content.error)
+            with self._state_lock:
+                if succeeded:
                     self.generated_content[deliverable_id] = content
                     # Register for dependency tracking
                     self.context_builder.register_deliverable(
                         deliverable_id,
                         content.content
                     )
-                else:
-                    self._record_error(
-                        deliverable_id,
-                        content.error if content else "Unknown error"
-                    )
-                
                 completed_steps += 1
+            
+            if not succeeded:
+                self._record_error(
+                    deliverable_id,
+                    content.error if content else "Unknown error"
+                )
+            return succeeded
+        
+        def on_start(deliverable_id: str) -> None:
+            self._report_progress(
+                f"Generating {deliverable_id}",
+                completed_steps / total_steps
+            )
+        
+        # Each deliverable starts as soon as its dependencies are done
+        scheduler = DependencyScheduler.for_deliverables(target_deliverables)
+        try:
+            self.schedule_report = scheduler.run(
+                run_one,
+                max_workers=self.max_concurrency,
+                on_start=on_start,
+                on_skip=lambda d_id: self._record_error(d_id, "Dependencies not met"),
+            )
+        finally:
+            # The shared research prefix is only needed for this run
+            self.gemini_client.release_prefixes()
         
         self._report_progress("Synthesis complete", 1.0)
         
@@ -190,18 +207,24 @@ class SynthesisOrchestrator:
                 error=f"No prompt template found for {deliverable_id}",
             )
         
-        # Build full prompt with context
-        full_prompt = self.context_builder.build_full_prompt(
+        # Build prompt: shared research prefix (cached once per run) + deliverable suffix
+        prompt_prefix, prompt_suffix = self.context_builder.build_prompt_parts(
             deliverable_id=deliverable_id,
             prompt_template=prompt_template,
             research=research,
             company_input=company_input,
         )
         
-        # Generate content
+        # Generate content, streaming chunks through if anyone is listening
+        stream = None
+        if self.stream_callback:
+            stream = lambda chunk: self.stream_callback(deliverable_id, chunk)
+        
         result = self.gemini_client.generate_markdown(
-            prompt=full_prompt,
+            prompt=prompt_suffix,
             system_instruction=self._get_system_instruction(deliverable_id),
+            stream_callback=stream,
+            prefix=prompt_prefix,
         )
         
         if result.error:
@@ -219,6 +242,8 @@ class SynthesisOrchestrator:
             content=result.content,
             generated_at=result.timestamp,
             synthesis_cost=result.cost_estimate,
+            prompt_tokens=result.prompt_tokens,
+            completion_tokens=result.completion_tokens,
         )
     
     def _get_system_instruction(self, deliverable_id: str) -> str:
@@ -242,22 +267,24 @@ Guidelines:
         deliverable_config = DELIVERABLES.get(deliverable_id, {})
         dependencies = deliverable_config.get("dependencies", [])
         
-        for dep in dependencies:
-            if dep == "ALL_MARKDOWN":
-                # Skip this check for final deliverables
-                continue
-            if dep not in self.generated_content:
-                return False
+        with self._state_lock:
+            for dep in dependencies:
+                if dep == "ALL_MARKDOWN":
+                    # Skip this check for final deliverables
+                    continue
+                if dep not in self.generated_content:
+                    return False
         
         return True
     
     def _record_error(self, deliverable_id: str, error: str) -> None:
         """Record an error during generation."""
-        self.errors.append({
-            "deliverable_id": deliverable_id,
-            "error": error,
-            "timestamp": datetime.now().isoformat(),
-        })
+        with self._state_lock:
+            self.errors.append({
+                "deliverable_id": deliverable_id,
+                "error": error,
+                "timestamp": datetime.now().isoformat(),
+            })
     
     def _report_progress(self, message: str, progress: float) -> None:
         """Report progress to callback if set."""
@@ -302,6 +329,12 @@ Guidelines:
         """Get cost summary for synthesis."""
         return self.gemini_client.get_cost_summary()
     
+    def get_timing_summary(self) -> Optional[Dict[str, Any]]:
+        """Get wall-clock vs critical-path timing of the last synthesize() run."""
+        if not self.schedule_report:
+            return None
+        return self.schedule_report.summary()
+    
     def get_generation_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all deliverables."""
         status = {}
@@ -313,6 +346,8 @@ Guidelines:
                     "status": "completed" if not content.error else "failed",
                     "error": content.error,
                     "cost": content.synthesis_cost,
+                    "prompt_tokens": content.prompt_tokens,
+                    "completion_tokens": content.completion_tokens,
                     "file_path": content.file_path,
                 }
             else:
@@ -334,6 +369,7 @@ def run_synthesis(
     research: ResearchOutput,
     output_dir: Optional[Path] = None,
     progress_callback: Optional[Callable[[str, float], None]] = None,
+    use_cache: bool = True,
 ) -> SynthesisOutput:
     """
     Convenience function to run synthesis.
@@ -343,6 +379,7 @@ def run_synthesis(
         research: Research output.
         output_dir: Output directory.
         progress_callback: Progress callback.
+        use_cache: Reuse cached Gemini responses for unchanged prompts.
     
     Returns:
         SynthesisOutput with generated deliverables.
@@ -350,6 +387,7 @@ def run_synthesis(
     orchestrator = SynthesisOrchestrator(
         output_dir=output_dir,
         progress_callback=progress_callback,
+        use_cache=use_cache,
     )
     
     return orchestrator.synthesize(company_input, research)
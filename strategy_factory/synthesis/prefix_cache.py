@@ -0,0 +1,224 @@
+"""
+Provider-side caching of shared prompt prefixes.
+
+Every deliverable prompt in a run starts with the same research context
+(see ContextBuilder.build_prompt_parts). Registering that prefix once as
+cached content lets each request send only its per-deliverable suffix;
+the provider bills cached tokens at a reduced rate and skips
+re-processing them.
+
+Providers:
+- GeminiPrefixCache: Gemini cached-content API
+- FakePrefixCache: in-process stand-in for tests, no network access
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, List, Optional
+
+import google.generativeai as genai
+
+
+class PrefixCacheProvider(ABC):
+    """
+    Interface for registering cached prompt prefixes.
+    
+    create() returns an opaque handle; model_for() turns it into a model
+    exposing generate_content / generate_content_async / count_tokens
+    whose requests are processed after the cached prefix.
+    """
+    
+    # Prefixes shorter than this are not worth (or not allowed) caching
+    min_tokens: int = 0
+    
+    @abstractmethod
+    def create(
+        self,
+        model_name: str,
+        system_instruction: Optional[str],
+        prefix: str,
+        ttl_seconds: int,
+    ) -> Any:
+        """
+        Register a prefix.
+        
+        Args:
+            model_name: Model the cache is created for.
+            system_instruction: System instruction baked into the cache.
+            prefix: Prompt text shared by later requests.
+            ttl_seconds: How long the provider keeps the cache.
+        
+        Returns:
+            Handle for model_for() and delete().
+        """
+    
+    @abstractmethod
+    def model_for(self, handle: Any) -> Any:
+        """Model that generates with the cached prefix in front of each prompt."""
+    
+    @abstractmethod
+    def delete(self, handle: Any) -> None:
+        """Release a cache before its TTL runs out."""
+
+
+class GeminiPrefixCache(PrefixCacheProvider):
+    """Gemini cached-content API (google.generativeai.caching)."""
+    
+    def __init__(self, min_tokens: int = 1024):
+        """
+        Initialize the provider.
+        
+        Args:
+            min_tokens: Smallest prefix the API accepts for caching.
+        """
+        self.min_tokens = min_tokens
+    
+    def create(
+        self,
+        model_name: str,
+        system_instruction: Optional[str],
+        prefix: str,
+        ttl_seconds: int,
+    ) -> Any:
+        if not model_name.startswith("models/"):
+            model_name = f"models/{model_name}"
+        return genai.caching.CachedContent.create(
+            model=model_name,
+            display_name="strategy-factory-research-prefix",
+            system_instruction=system_instruction,
+            contents=[prefix],
+            ttl=timedelta(seconds=ttl_seconds),
+        )
+    
+    def model_for(self, handle: Any) -> Any:
+        return genai.GenerativeModel.from_cached_content(cached_content=handle)
+    
+    def delete(self, handle: Any) -> None:
+        handle.delete()
+
+
+@dataclass
+class _FakeUsage:
+    prompt_token_count: int
+    candidates_token_count: int
+    cached_content_token_count: int
+
+
+@dataclass
+class _FakeTokenCount:
+    total_tokens: int
+
+
+@dataclass
+class _FakeChunk:
+    text: str
+
+
+@dataclass
+class _FakeResponse:
+    text: str
+    usage_metadata: _FakeUsage
+    chunks: List[_FakeChunk] = field(default_factory=list)
+    
+    def __iter__(self):
+        return iter(self.chunks)
+    
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@dataclass
+class _FakeCacheEntry:
+    model_name: str
+    system_instruction: Optional[str]
+    prefix: str
+    ttl_seconds: int
+    deleted: bool = False
+
+
+class _FakeCachedModel:
+    """Model double that answers with respond(prefix + prompt)."""
+    
+    def __init__(self, cache: "FakePrefixCache", entry: _FakeCacheEntry):
+        self._cache = cache
+        self._entry = entry
+    
+    def _respond(self, prompt: str, stream: bool) -> _FakeResponse:
+        if self._entry.deleted:
+            raise RuntimeError("Cached content was deleted")
+        self._cache.requests.append(prompt)
+        text = self._cache.respond(self._entry.prefix + prompt)
+        prefix_tokens = len(self._entry.prefix) // 4
+        return _FakeResponse(
+            text=text,
+            usage_metadata=_FakeUsage(
+                prompt_token_count=prefix_tokens + len(prompt) // 4,
+                candidates_token_count=len(text) // 4,
+                cached_content_token_count=prefix_tokens,
+            ),
+            chunks=[_FakeChunk(text)] if stream else [],
+        )
+    
+    def generate_content(self, prompt: str, generation_config: Any = None, stream: bool = False):
+        return self._respond(prompt, stream)
+    
+    async def generate_content_async(self, prompt: str, generation_config: Any = None, stream: bool = False):
+        return self._respond(prompt, stream)
+    
+    def count_tokens(self, prompt: str):
+        return _FakeTokenCount(total_tokens=(len(self._entry.prefix) + len(prompt)) // 4)
+    
+    async def count_tokens_async(self, prompt: str):
+        return self.count_tokens(prompt)
+
+
+class FakePrefixCache(PrefixCacheProvider):
+    """
+    In-process prefix cache for tests.
+    
+    Records every registration and suffix request, and answers with
+    respond(full prompt) instead of calling a model.
+    
+    Usage:
+        fake = FakePrefixCache(respond=lambda prompt: "# Deliverable")
+        client = GeminiClient(api_key="test", prefix_cache=fake, enable_cache=False)
+        client.generate("suffix", prefix="shared research context...")
+        assert len(fake.entries) == 1 and fake.requests == ["suffix"]
+    """
+    
+    def __init__(
+        self,
+        respond: Optional[Callable[[str], str]] = None,
+        min_tokens: int = 0,
+    ):
+        """
+        Initialize the fake.
+        
+        Args:
+            respond: Produces response text from the full prompt
+                     (prefix + suffix). Defaults to a fixed reply.
+            min_tokens: Simulated minimum cacheable prefix size.
+        """
+        self.respond = respond or (lambda prompt: "Generated content")
+        self.min_tokens = min_tokens
+        self.entries: List[_FakeCacheEntry] = []
+        self.requests: List[str] = []
+    
+    def create(
+        self,
+        model_name: str,
+        system_instruction: Optional[str],
+        prefix: str,
+        ttl_seconds: int,
+    ) -> Any:
+        entry = _FakeCacheEntry(model_name, system_instruction, prefix, ttl_seconds)
+        self.entries.append(entry)
+        return entry
+    
+    def model_for(self, handle: Any) -> Any:
+        return _FakeCachedModel(self, handle)
+    
+    def delete(self, handle: Any) -> None:
+        handle.deleted = True
@@ -0,0 +1,156 @@
+"""
+Text helpers shared by the knowledge index and prompt context packing.
+
+Token counts are estimates (1 token ≈ 4 characters), matching the
+estimates used elsewhere for rate limiting and cost tracking.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+CHARS_PER_TOKEN = 4
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_WORD_RE = re.compile(r"[a-z][a-z0-9]+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n[ \t]*\n")
+
+STOPWORDS = frozenset("""
+a about above after again against all also an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each few for from further had has have having he her here hers him his how i if
+in into is it its itself just may me more most must my no nor not now of off on
+once only or other our ours out over own same she should so some such than that
+the their theirs them then there these they this those through to too under
+until up very was we were what when where which while who whom why will with
+would you your yours use using used new key e g etc based within across include
+including well one two three first next per via
+""".split())
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate token count for text.
+
+    Args:
+        text: Text content
+
+    Returns:
+        Estimated token count (at least 1)
+    """
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercased content words.
+
+    Stopwords and single-character words are dropped.
+
+    Args:
+        text: Text content
+
+    Returns:
+        Words in order of appearance
+    """
+    return [w for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS]
+
+
+def markdown_section_spans(
+    text: str,
+    max_tokens: Optional[int] = None,
+) -> List[Tuple[str, int, int]]:
+    """
+    Locate heading-delimited sections in markdown.
+
+    Each section runs from its heading line to the next heading (headings
+    inside ``` fences are ignored). Sections larger than max_tokens are
+    split further at paragraph breaks.
+
+    Args:
+        text: Markdown content
+        max_tokens: Optional size above which sections are split
+
+    Returns:
+        List of (heading path, start, end) character offsets in document
+        order. The path joins the enclosing headings with " > "; text
+        before the first heading gets an empty path. Spans are contiguous
+        and may include surrounding whitespace.
+    """
+    spans: List[Tuple[str, int, int]] = []
+    stack: List[Tuple[int, str]] = []
+    path = ""
+    section_start = 0
+    offset = 0
+    in_fence = False
+
+    def close(end: int) -> None:
+        if text[section_start:end].strip():
+            spans.extend(
+                (path, start, stop)
+                for start, stop in _split_span(text, section_start, end, max_tokens)
+            )
+
+    for line in text.splitlines(keepends=True):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line.rstrip("\r\n"))
+        if match:
+            close(offset)
+            level = len(match.group(1))
+            title = match.group(2).strip().strip("*").strip()
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, title))
+            path = " > ".join(t for _, t in stack)
+            section_start = offset
+        offset += len(line)
+    close(offset)
+
+    return spans
+
+
+def _split_span(
+    text: str,
+    start: int,
+    end: int,
+    max_tokens: Optional[int],
+) -> List[Tuple[int, int]]:
+    """Split text[start:end] at paragraph breaks into pieces of ~max_tokens."""
+    if not max_tokens or (end - start) // CHARS_PER_TOKEN <= max_tokens:
+        return [(start, end)]
+
+    limit = max_tokens * CHARS_PER_TOKEN
+    breaks = [m.end() for m in _PARAGRAPH_BREAK_RE.finditer(text, start, end)]
+
+    pieces = []
+    piece_start = start
+    last_break = start
+    for position in breaks + [end]:
+        # Close the piece at the previous break once this paragraph overflows it
+        if position - piece_start > limit and last_break > piece_start:
+            pieces.append((piece_start, last_break))
+            piece_start = last_break
+        last_break = position
+    pieces.append((piece_start, end))
+
+    return [(a, b) for a, b in pieces if text[a:b].strip()]
+
+
+def split_markdown_sections(
+    text: str,
+    max_tokens: Optional[int] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Split markdown into heading-delimited sections.
+
+    Args:
+        text: Markdown content
+        max_tokens: Optional size above which sections are split further
+
+    Returns:
+        List of (heading path, section text) in document order
+    """
+    return [
+        (path, text[start:end].strip())
+        for path, start, end in markdown_section_spans(text, max_tokens)
+    ]
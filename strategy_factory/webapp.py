@@ -363,6 +363,20 @@ BASE_TEMPLATE = """
             margin-top: 0.25rem;
         }
 
+        .stream-preview {
+            display: none;
+            margin-top: 0.5rem;
+            max-height: 180px;
+            overflow: hidden;
+            padding: 0.5rem 0.75rem;
+            background: var(--bg);
+            border: 1px solid var(--border);
+            border-radius: 6px;
+            font-size: 0.75rem;
+            color: var(--text-secondary);
+            white-space: pre-wrap;
+        }
+
         .spinner {
             width: 20px;
             height: 20px;
@@ -781,6 +795,7 @@ PROGRESS_CONTENT = """
                     <div class="phase-progress" style="display: none;">
                         <div class="progress-bar"><div class="progress-fill" id="synthesis-progress" style="width: 0%"></div></div>
                         <div class="progress-text" id="synthesis-text"></div>
+                        <pre class="stream-preview" id="synthesis-stream"></pre>
                     </div>
                 </div>
             </li>
@@ -836,11 +851,28 @@ PROGRESS_SCRIPTS = """
         document.getElementById(phaseId + '-text').textContent = text;
     }
 
+    // Tail of each deliverable's streamed text; the latest one is shown
+    const streamed = {};
+    const STREAM_TAIL = 1200;
+
+    function showStreamChunk(deliverable, text) {
+        const tail = ((streamed[deliverable] || '') + text).slice(-STREAM_TAIL);
+        streamed[deliverable] = tail;
+        const preview = document.getElementById('synthesis-stream');
+        preview.style.display = 'block';
+        preview.textContent = deliverable + '\\n\\n' + tail;
+    }
+
     function startEventStream() {
         eventSource = new EventSource('/progress/' + jobId);
 
         eventSource.onmessage = function(event) {
             const data = JSON.parse(event.data);
+
+            if (data.stream) {
+                showStreamChunk(data.deliverable, data.text);
+                return;
+            }
             console.log('Progress update:', data);
 
             document.getElementById('status-text').textContent = data.message || 'Processing...';
@@ -1323,10 +1355,13 @@ def run_pipeline(job_id: str, company_name: str, context: str, mode: str):
                 "detail": message
             })
 
+        # Async client: queries from all concurrent jobs share the background
+        # event loop and its connection pool instead of blocking threads
         research_orchestrator = ResearchOrchestrator(
             mode=research_mode,
             cache_dir=Path(tracker.output_dir),
             progress_callback=research_callback,
+            async_io=True,
         )
 
         research_output = research_orchestrator.research(company_input)
@@ -1357,9 +1392,18 @@ def run_pipeline(job_id: str, company_name: str, context: str, mode: str):
                 "detail": message
             })
 
+        def synthesis_stream_callback(deliverable_id: str, chunk: str):
+            q.put({
+                "phase": "synthesis",
+                "stream": True,
+                "deliverable": deliverable_id,
+                "text": chunk,
+            })
+
         synthesis_orchestrator = SynthesisOrchestrator(
             output_dir=OUTPUT_DIR,
             progress_callback=synthesis_callback,
+            stream_callback=synthesis_stream_callback,
         )
 
         synthesis_output = synthesis_orchestrator.synthesize(company_input, research_output)
@@ -0,0 +1,167 @@
+"""SQLiteCacheStore schema migration, expiry and eviction."""
+
+import json
+import sqlite3
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+from strategy_factory.models import QueryResult
+from strategy_factory.research.cache_store import SQLiteCacheStore, create_cache_store
+
+# Table as created before size_bytes/last_accessed were added
+LEGACY_SCHEMA = """
+    CREATE TABLE query_cache (
+        key TEXT PRIMARY KEY,
+        query TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        expires_at REAL NOT NULL
+    );
+"""
+
+
+def make_result(query: str) -> QueryResult:
+    return QueryResult(
+        query=query,
+        model_used="sonar",
+        results=[],
+        result_count=0,
+        timestamp=datetime(2025, 1, 1),
+    )
+
+
+class SQLiteCacheStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.db_path = Path(self._tmp.name) / "research_cache.sqlite3"
+
+    def open_store(self, **kwargs) -> SQLiteCacheStore:
+        store = SQLiteCacheStore(self.db_path, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_round_trip(self):
+        store = self.open_store()
+        store.put("k", "query", make_result("query"), ttl_hours=1)
+
+        self.assertEqual(store.get("k").query, "query")
+        self.assertIsNone(store.get("missing"))
+        self.assertEqual((store.hits, store.misses), (1, 1))
+
+    def test_legacy_database_is_migrated(self):
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript(LEGACY_SCHEMA)
+        conn.execute(
+            "INSERT INTO query_cache VALUES (?, ?, ?, ?, ?)",
+            ("old", "query", make_result("query").model_dump_json(),
+             time.time(), time.time() + 3600),
+        )
+        conn.commit()
+        conn.close()
+
+        store = self.open_store(max_entries=10)
+
+        columns = {row[1] for row in store._conn.execute("PRAGMA table_info(query_cache)")}
+        self.assertIn("size_bytes", columns)
+        self.assertIn("last_accessed", columns)
+        # Rows written by the old version stay readable, and new writes work
+        self.assertEqual(store.get("old").query, "query")
+        store.put("new", "other", make_result("other"), ttl_hours=1)
+        self.assertEqual(store.count(), 2)
+
+    def test_expired_entries_are_not_returned(self):
+        store = self.open_store()
+        store.put("k", "query", make_result("query"), ttl_hours=1)
+
+        later = time.time() + 2 * 3600
+        with mock.patch("strategy_factory.research.cache_store.time.time", return_value=later):
+            self.assertIsNone(store.get("k"))
+            self.assertEqual(store.count(), 0)
+            self.assertEqual(store.purge_expired(), 1)
+
+    def test_expired_entries_are_purged_on_open(self):
+        store = self.open_store()
+        store.put("stale", "query", make_result("query"), ttl_hours=0)
+        store.put("fresh", "query", make_result("query"), ttl_hours=1)
+        store.close()
+
+        reopened = self.open_store()
+        (rows,) = reopened._conn.execute("SELECT COUNT(*) FROM query_cache").fetchone()
+        self.assertEqual(rows, 1)
+        self.assertIsNotNone(reopened.get("fresh"))
+
+    def test_max_entries_evicts_least_recently_read(self):
+        store = self.open_store(max_entries=2)
+        clock = iter(range(1000, 1100))
+        now = time.time()
+        with mock.patch(
+            "strategy_factory.research.cache_store.time.time",
+            side_effect=lambda: now + next(clock),
+        ):
+            store.put("a", "a", make_result("a"), ttl_hours=1)
+            store.put("b", "b", make_result("b"), ttl_hours=1)
+            store.get("a")
+            store.put("c", "c", make_result("c"), ttl_hours=1)
+
+            self.assertIsNone(store.get("b"))
+            self.assertIsNotNone(store.get("a"))
+            self.assertIsNotNone(store.get("c"))
+        self.assertEqual(store.evictions, 1)
+
+
+
+class LegacyJsonCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = Path(self._tmp.name)
+        self.json_path = self.cache_dir / "research_cache.json"
+
+    def legacy_entry(self, query: str, age_hours: float, ttl_hours: float = 24) -> dict:
+        """Entry as written by the pre-SQLite client."""
+        result = make_result(query).model_dump(mode="json")
+        return {
+            "query": query,
+            "result": result,
+            "timestamp": (datetime.now() - timedelta(hours=age_hours)).isoformat(),
+            "ttl_hours": ttl_hours,
+        }
+
+    def test_legacy_cache_is_imported_and_removed(self):
+        self.json_path.write_text(json.dumps({
+            "fresh": self.legacy_entry("fresh query", age_hours=1),
+            "stale": self.legacy_entry("stale query", age_hours=30),
+        }), encoding="utf-8")
+
+        store = create_cache_store(self.cache_dir)
+        self.addCleanup(store.close)
+
+        self.assertFalse(self.json_path.exists())
+        self.assertEqual(store.get("fresh").query, "fresh query")
+        self.assertIsNone(store.get("stale"))
+        # Keeps the remaining lifetime, not a fresh TTL
+        (expires_at,) = store._conn.execute(
+            "SELECT expires_at FROM query_cache WHERE key = 'fresh'"
+        ).fetchone()
+        self.assertAlmostEqual(expires_at - time.time(), 23 * 3600, delta=60)
+
+    def test_research_output_with_same_name_is_left_alone(self):
+        # ProgressTracker and ResearchOrchestrator write research output here
+        content = json.dumps({"company_name": "Acme", "results": {}, "mode": "quick"})
+        self.json_path.write_text(content, encoding="utf-8")
+
+        store = create_cache_store(self.cache_dir)
+        self.addCleanup(store.close)
+
+        self.assertEqual(self.json_path.read_text(encoding="utf-8"), content)
+        self.assertEqual(store.count(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""DiskCache storage, LRU eviction and running totals."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from strategy_factory.disk_cache import DiskCache, make_cache_key
+
+
+class DiskCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.directory = Path(self._tmp.name)
+
+    def age(self, cache, key, mtime):
+        """Give an entry a fixed mtime so eviction order is deterministic."""
+        os.utime(cache._path(key), (mtime, mtime))
+
+    def test_round_trip_and_stats(self):
+        cache = DiskCache(self.directory)
+        key = make_cache_key("model", "prompt")
+
+        self.assertIsNone(cache.get_text(key))
+        cache.put_text(key, "cached")
+        self.assertEqual(cache.get_text(key), "cached")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["entries"], 1)
+
+    def test_cache_key_is_order_sensitive_and_stable(self):
+        self.assertEqual(make_cache_key("a", {"x": 1, "y": 2}), make_cache_key("a", {"y": 2, "x": 1}))
+        self.assertNotEqual(make_cache_key("a", "b"), make_cache_key("b", "a"))
+
+    def test_max_entries_evicts_least_recently_used(self):
+        cache = DiskCache(self.directory, max_entries=2)
+        keys = [make_cache_key(i) for i in range(3)]
+
+        cache.put(keys[0], b"0")
+        cache.put(keys[1], b"1")
+        self.age(cache, keys[0], 1000)
+        self.age(cache, keys[1], 2000)
+
+        # Reading the oldest entry marks it as recently used
+        self.assertEqual(cache.get(keys[0]), b"0")
+        cache.put(keys[2], b"2")
+
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.get(keys[0]), b"0")
+        self.assertEqual(cache.get(keys[2]), b"2")
+        self.assertEqual(cache.evictions, 1)
+
+    def test_max_bytes_evicts_oldest(self):
+        cache = DiskCache(self.directory, max_bytes=25)
+        keys = [make_cache_key(i) for i in range(3)]
+        for i, key in enumerate(keys[:2]):
+            cache.put(key, b"x" * 10)
+            self.age(cache, key, 1000 + i)
+
+        cache.put(keys[2], b"x" * 10)
+
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertEqual(cache.stats()["bytes"], 20)
+
+    def test_overwrite_does_not_inflate_totals(self):
+        cache = DiskCache(self.directory, max_entries=2)
+        key = make_cache_key("same")
+        other = make_cache_key("other")
+        cache.put(other, b"other")
+
+        for size in (100, 10, 50):
+            cache.put(key, b"x" * size)
+
+        self.assertEqual(cache._total_entries, 2)
+        self.assertEqual(cache._total_bytes, 55)
+        self.assertEqual(cache.evictions, 0)
+        self.assertEqual(cache.get(other), b"other")
+
+    def test_clear_resets_totals(self):
+        cache = DiskCache(self.directory, max_entries=2)
+        for i in range(2):
+            cache.put(make_cache_key(i), b"data")
+
+        cache.clear()
+
+        self.assertEqual((cache._total_entries, cache._total_bytes), (0, 0))
+        self.assertEqual(cache.stats()["entries"], 0)
+        # A fresh pair fits without evicting
+        for i in range(2):
+            cache.put(make_cache_key("new", i), b"data")
+        self.assertEqual(cache.evictions, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""BM25 retrieval over the sidecar-backed knowledge index."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from strategy_factory.knowledge_index import KnowledgeIndex
+from strategy_factory.knowledge_retriever import BM25Retriever
+
+GUIDES = {
+    "healthcare_TLDR.md": (
+        "# Healthcare\n\n## Claims Automation\n\nAutomate claims triage and claims coding.\n\n"
+        "## Patient Intake\n\nDigital intake forms reduce waiting time.\n"
+    ),
+    "retail_TLDR.md": (
+        "# Retail\n\n## Demand Forecasting\n\nForecast demand per store and season.\n\n"
+        "## Pricing\n\nDynamic pricing with guardrails.\n"
+    ),
+}
+
+
+class BM25RetrieverTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.guides_dir = Path(self._tmp.name) / "guides"
+        self.guides_dir.mkdir()
+        for name, text in GUIDES.items():
+            (self.guides_dir / name).write_text(text, encoding="utf-8")
+        self.index_path = Path(self._tmp.name) / "knowledge_index.json"
+
+    def make_retriever(self) -> BM25Retriever:
+        return BM25Retriever(KnowledgeIndex(self.guides_dir, self.index_path))
+
+    def test_search_ranks_matching_section_first(self):
+        results = self.make_retriever().search("claims automation", top_n=2)
+
+        section, text, score = results[0]
+        self.assertEqual(section.guide, "healthcare_TLDR.md")
+        self.assertIn("Automate claims triage", text)
+        self.assertGreater(score, 0)
+
+    def test_build_reads_only_returned_passages(self):
+        # Index once so the sidecar exists, as on any run after the first
+        self.make_retriever().refresh()
+
+        retriever = self.make_retriever()
+        with mock.patch.object(
+            KnowledgeIndex, "read_section", autospec=True, side_effect=KnowledgeIndex.read_section
+        ) as read_section, mock.patch.object(Path, "read_bytes") as read_bytes:
+            results = retriever.search("forecast demand pricing", top_n=1)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(read_section.call_count, 1)
+        read_bytes.assert_not_called()
+
+    def test_guide_filter_and_miss(self):
+        retriever = self.make_retriever()
+
+        results = retriever.search("claims", guides=["retail_TLDR.md"])
+        self.assertEqual(results, [])
+        self.assertEqual(retriever.search("quantum"), [])
+
+    def test_changed_guide_is_reindexed(self):
+        retriever = self.make_retriever()
+        retriever.refresh()
+
+        (self.guides_dir / "retail_TLDR.md").write_text(
+            "# Retail\n\n## Loyalty\n\nLoyalty programs and churn.\n", encoding="utf-8"
+        )
+        retriever.refresh()
+
+        section, text, _ = retriever.search("loyalty churn", top_n=1)[0]
+        self.assertTrue(section.heading.endswith("Loyalty"))
+        self.assertIn("Loyalty programs", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
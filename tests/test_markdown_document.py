@@ -0,0 +1,69 @@
+"""MarkdownDocument parsing and section lookup."""
+
+import unittest
+
+from strategy_factory.markdown_document import MarkdownDocument, first_table, normalize_heading
+
+DELIVERABLE = """# Quick Wins
+
+Intro paragraph.
+
+## 1. **Quick Win Comparison Matrix**
+
+| Win | Effort |
+|-----|--------|
+| Chatbot | Low |
+
+### Scoring Notes
+
+- Effort is relative
+
+## ROI & Payback Analysis
+
+- Payback in 6 months
+- Break-even in Q3
+
+## Implementation Timeline
+
+Phased over two quarters.
+"""
+
+
+class FindSectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.doc = MarkdownDocument(DELIVERABLE)
+
+    def test_exact_match_ignores_markup_and_enumeration(self):
+        section = self.doc.find_section("Quick Win Comparison Matrix")
+
+        self.assertIsNotNone(section)
+        self.assertEqual(section.level, 2)
+        table = first_table(self.doc.section_blocks(section))
+        self.assertEqual(table["headers"], ["Win", "Effort"])
+
+    def test_prefix_match(self):
+        section = self.doc.find_section("ROI")
+        self.assertEqual(normalize_heading(section.heading), "roi and payback analysis")
+
+    def test_fuzzy_match(self):
+        section = self.doc.find_section("Implementaton Timelines")
+        self.assertEqual(normalize_heading(section.heading), "implementation timeline")
+        self.assertIsNone(self.doc.find_section("Implementaton Timelines", fuzzy=False))
+
+    def test_miss(self):
+        self.assertIsNone(self.doc.find_section("Risk Register"))
+        self.assertIsNone(self.doc.section_text("Risk Register"))
+
+    def test_top_level_heading_is_not_indexed(self):
+        self.assertIsNone(self.doc.find_section("Quick Wins", fuzzy=False))
+
+    def test_section_keeps_nested_headings(self):
+        text = self.doc.section_text("Quick Win Comparison Matrix")
+        self.assertIn("### Scoring Notes", text)
+        self.assertNotIn("Payback", text)
+        self.assertEqual(self.doc.section_text("Scoring Notes"), "- Effort is relative")
+
+
+if __name__ == "__main__":
+    unittest.main()
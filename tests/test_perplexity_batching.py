@@ -0,0 +1,134 @@
+"""Multi-query Search API batching with a fake Search API (no network)."""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from strategy_factory.config import PerplexityModel
+from strategy_factory.rate_limiter import TokenBucket
+from strategy_factory.research.perplexity_client import (
+    AsyncPerplexityClient,
+    PerplexityClient,
+    _PendingQuery,
+)
+from strategy_factory.research.query_templates import CacheScope
+
+QUERIES = [f"query {i}" for i in range(8)]
+
+
+def hit(query: str) -> dict:
+    return {"title": query, "url": "https://example.com", "snippet": "s"}
+
+
+def fake_create(grouped: bool, calls: list):
+    """search.create() answering list queries grouped per query, or flattened."""
+    def create(**params):
+        query = params["query"]
+        calls.append(query)
+        if not isinstance(query, list):
+            return SimpleNamespace(results=[hit(query)])
+        if grouped:
+            return SimpleNamespace(results=[[hit(q)] for q in query])
+        return SimpleNamespace(results=[hit(q) for q in query])
+    return create
+
+
+def batch_sizes(calls: list) -> list:
+    return [len(q) if isinstance(q, list) else 1 for q in calls]
+
+
+def make_client(cls):
+    return cls(
+        api_key="test",
+        enable_cache=False,
+        rate_limiter=TokenBucket(rate=1000, capacity=1000),
+    )
+
+
+def pending(queries: list) -> list:
+    return [
+        _PendingQuery(
+            index=i,
+            cache_key=q,
+            query_str=q,
+            params={"query": q},
+            model=PerplexityModel.SONAR,
+            ttl_hours=1,
+            scope=CacheScope.COMPANY,
+        )
+        for i, q in enumerate(queries)
+    ]
+
+
+class SplitBatchResponseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = make_client(PerplexityClient)
+        self.chunk = pending(["a", "b"])
+
+    def test_grouped_results_split_in_order(self):
+        response = SimpleNamespace(results=[[hit("a1"), hit("a2")], [hit("b1")]])
+        results = self.client._split_batch_response(response, self.chunk)
+
+        self.assertEqual([r.query for r in results], ["a", "b"])
+        self.assertEqual([r.result_count for r in results], [2, 1])
+        self.assertEqual(results[1].results[0].title, "b1")
+
+    def test_flat_or_mismatched_results_are_rejected(self):
+        flat = SimpleNamespace(results=[hit("a1"), hit("b1")])
+        short = SimpleNamespace(results=[[hit("a1")]])
+
+        self.assertIsNone(self.client._split_batch_response(flat, self.chunk))
+        self.assertIsNone(self.client._split_batch_response(short, self.chunk))
+
+
+class PerplexityBatchingTest(unittest.TestCase):
+
+    def run_sync(self, grouped: bool):
+        calls = []
+        client = make_client(PerplexityClient)
+        client.client = SimpleNamespace(search=SimpleNamespace(create=fake_create(grouped, calls)))
+        return client, calls, client.search_multi(QUERIES)
+
+    def run_async(self, grouped: bool):
+        calls = []
+        client = make_client(AsyncPerplexityClient)
+        create = fake_create(grouped, calls)
+
+        class Search:
+            async def create(self, **params):
+                return create(**params)
+
+        client._clients = SimpleNamespace(get=lambda loop: SimpleNamespace(search=Search()))
+        return client, calls, asyncio.run(client.search_multi(QUERIES))
+
+    def single_cost(self, client) -> float:
+        return client._estimate_cost(PerplexityModel.SONAR)
+
+    def test_grouped_response_probes_then_batches(self):
+        for run in (self.run_sync, self.run_async):
+            client, calls, results = run(grouped=True)
+
+            # A 2-query probe, then the rest in full-size calls
+            self.assertEqual(batch_sizes(calls), [2, 3, 3])
+            self.assertTrue(client.batch_grouping_verified)
+            self.assertEqual([r.query for r in results], QUERIES)
+            self.assertEqual([r.results[0].title for r in results], QUERIES)
+            self.assertEqual(client.query_count, len(QUERIES))
+
+    def test_flat_response_disables_batching_and_counts_the_probe(self):
+        for run in (self.run_sync, self.run_async):
+            client, calls, results = run(grouped=False)
+
+            # Only the probe is wasted; every query is then sent alone
+            self.assertEqual(batch_sizes(calls), [2] + [1] * len(QUERIES))
+            self.assertFalse(client.batching_enabled)
+            self.assertEqual([r.results[0].title for r in results], QUERIES)
+            self.assertEqual(client.query_count, len(QUERIES) + 1)
+            self.assertAlmostEqual(
+                client.total_cost, (len(QUERIES) + 1) * self.single_cost(client)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+"""Shared research prefix caching with FakePrefixCache (no network)."""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from strategy_factory.knowledge_loader import KnowledgeLoader
+from strategy_factory.models import CompanyInput, ResearchMode, ResearchOutput
+from strategy_factory.rate_limiter import PerMinuteQuota
+from strategy_factory.synthesis.gemini_client import GeminiClient
+from strategy_factory.synthesis.orchestrator import SynthesisOrchestrator
+from strategy_factory.synthesis.prefix_cache import FakePrefixCache
+
+PREFIX = "Shared research context. " * 50
+
+
+class ExpiringFake(FakePrefixCache):
+    """Counts requests that fail because the cached prefix is gone."""
+
+    failures = 0
+
+    def model_for(self, handle):
+        model = super().model_for(handle)
+        respond = model._respond
+
+        def counted(prompt, stream):
+            try:
+                return respond(prompt, stream)
+            except RuntimeError:
+                self.failures += 1
+                raise
+
+        model._respond = counted
+        return model
+
+
+class InlineModel:
+    """Stands in for the uncached model so fallbacks stay offline."""
+
+    def __init__(self):
+        self.requests = []
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        self.requests.append(prompt)
+        return SimpleNamespace(text="inline", usage_metadata=None)
+
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        return self.generate_content(prompt, generation_config, stream)
+
+
+def make_client(fake: FakePrefixCache) -> GeminiClient:
+    return GeminiClient(
+        api_key="test",
+        prefix_cache=fake,
+        enable_cache=False,
+        quota=PerMinuteQuota(requests_per_minute=6000, tokens_per_minute=10**9),
+    )
+
+
+class GeminiClientPrefixTest(unittest.TestCase):
+
+    def test_prefix_registered_once_and_requests_carry_suffix(self):
+        fake = FakePrefixCache(respond=lambda prompt: "# Deliverable")
+        client = make_client(fake)
+
+        first = client.generate("first suffix", prefix=PREFIX)
+        second = client.generate("second suffix", prefix=PREFIX)
+
+        self.assertIsNone(first.error)
+        self.assertEqual(second.content, "# Deliverable")
+        self.assertEqual(len(fake.entries), 1)
+        self.assertEqual(fake.entries[0].prefix, PREFIX)
+        self.assertEqual(fake.requests, ["first suffix", "second suffix"])
+        self.assertEqual(client.prefix_registrations, 1)
+
+    def test_short_prefix_is_sent_inline(self):
+        fake = FakePrefixCache(min_tokens=10**6)
+        client = make_client(fake)
+
+        self.assertIsNone(client._prefix_model(PREFIX, None))
+        # Remembered, so later requests do not try again
+        self.assertIsNone(client._prefix_model(PREFIX, None))
+        self.assertEqual(fake.entries, [])
+
+    def test_release_prefixes_deletes_handles(self):
+        fake = FakePrefixCache()
+        client = make_client(fake)
+        client.generate("suffix", prefix=PREFIX)
+
+        client.release_prefixes()
+
+        self.assertTrue(fake.entries[0].deleted)
+
+    def test_expired_prefix_fails_once_then_goes_inline(self):
+        for use_async in (False, True):
+            fake = ExpiringFake()
+            client = make_client(fake)
+            inline = InlineModel()
+            client._get_model = lambda system_instruction: inline
+
+            def generate(suffix):
+                if use_async:
+                    return asyncio.run(client.generate_async(suffix, prefix=PREFIX))
+                return client.generate(suffix, prefix=PREFIX)
+
+            with mock.patch("strategy_factory.synthesis.gemini_client.time.sleep"), \
+                    mock.patch("strategy_factory.synthesis.gemini_client.asyncio.sleep"):
+                self.assertIsNone(generate("first").error)
+                fake.entries[0].deleted = True  # Expires mid-run
+                results = [generate(f"suffix {i}") for i in range(4)]
+
+            self.assertTrue(all(result.content == "inline" for result in results))
+            self.assertEqual(fake.failures, 1)
+            self.assertEqual(fake.requests, ["first"])
+            self.assertEqual(inline.requests, [PREFIX + f"suffix {i}" for i in range(4)])
+            # Not registered again, and nothing left to release
+            self.assertEqual(len(fake.entries), 1)
+            client.release_prefixes()
+
+    def test_registration_does_not_block_other_prefixes(self):
+        started = threading.Event()
+
+        class SlowFake(FakePrefixCache):
+            def create(self, model_name, system_instruction, prefix, ttl_seconds):
+                if prefix.startswith("slow"):
+                    started.set()
+                    time.sleep(0.5)
+                return super().create(model_name, system_instruction, prefix, ttl_seconds)
+
+        fake = SlowFake()
+        client = make_client(fake)
+        slow = threading.Thread(target=client._prefix_model, args=("slow" + PREFIX, None))
+        slow.start()
+        started.wait(5)
+
+        begin = time.monotonic()
+        self.assertIsNotNone(client._prefix_model("fast" + PREFIX, None))
+        self.assertLess(time.monotonic() - begin, 0.4)
+
+        slow.join()
+        client.release_prefixes()
+        self.assertEqual(len(fake.entries), 2)
+        self.assertTrue(all(entry.deleted for entry in fake.entries))
+
+
+class SynthesisOrchestratorPrefixTest(unittest.TestCase):
+
+    DELIVERABLES = ["01_tech_inventory", "02_pain_points", "13_glossary"]
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        env = mock.patch.dict(os.environ, {"GEMINI_API_KEY": "test"})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_one_registration_per_run(self):
+        fake = FakePrefixCache(respond=lambda prompt: "# Deliverable\n\nContent")
+        orchestrator = SynthesisOrchestrator(output_dir=self.tmp, use_cache=False)
+        orchestrator.gemini_client = make_client(fake)
+        loader = KnowledgeLoader(index_path=self.tmp / "knowledge_index.json")
+        orchestrator.knowledge_loader = loader
+        orchestrator.context_builder.knowledge_loader = loader
+
+        suffixes = []
+        build_prompt_parts = orchestrator.context_builder.build_prompt_parts
+
+        def record_parts(**kwargs):
+            prefix, suffix = build_prompt_parts(**kwargs)
+            suffixes.append(suffix)
+            return prefix, suffix
+
+        orchestrator.context_builder.build_prompt_parts = record_parts
+
+        output = orchestrator.synthesize(
+            CompanyInput(name="Acme", industry="Retail"),
+            ResearchOutput(
+                company_name="Acme",
+                research_timestamp=datetime.now(),
+                research_mode=ResearchMode.QUICK,
+            ),
+            deliverables=self.DELIVERABLES,
+        )
+
+        self.assertEqual(sorted(output.deliverables), self.DELIVERABLES)
+        self.assertEqual(len(fake.entries), 1)
+        prefix = fake.entries[0].prefix
+        self.assertTrue(prefix)
+        self.assertEqual(sorted(fake.requests), sorted(suffixes))
+        for request in fake.requests:
+            self.assertNotIn(prefix, request)
+        # Released at the end of the run
+        self.assertTrue(fake.entries[0].deleted)
+
+
+if __name__ == "__main__":
+    unittest.main()
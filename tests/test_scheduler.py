@@ -0,0 +1,98 @@
+"""DependencyScheduler ordering and failure propagation."""
+
+import threading
+import unittest
+
+from strategy_factory.scheduler import DependencyScheduler
+
+# a -> b -> d, a -> c, e independent
+GRAPH = {
+    "a": [],
+    "b": ["a"],
+    "c": ["a"],
+    "d": ["b", "c"],
+    "e": [],
+}
+
+
+class DependencySchedulerTest(unittest.TestCase):
+
+    def run_recording(self, scheduler, fail=(), max_workers=3, on_skip=None):
+        finished = []
+        lock = threading.Lock()
+
+        def task(task_id):
+            with lock:
+                finished.append(task_id)
+            return task_id not in fail
+
+        report = scheduler.run(task, max_workers=max_workers, on_skip=on_skip)
+        return finished, report
+
+    def test_dependents_run_after_dependencies(self):
+        scheduler = DependencyScheduler(GRAPH)
+        for workers in (1, 3):
+            finished, report = self.run_recording(scheduler, max_workers=workers)
+
+            self.assertEqual(sorted(finished), sorted(GRAPH))
+            for task, deps in GRAPH.items():
+                for dep in deps:
+                    self.assertLess(finished.index(dep), finished.index(task))
+                    self.assertLessEqual(
+                        report.timings[dep].finished, report.timings[task].started
+                    )
+            self.assertEqual(report.skipped, [])
+
+    def test_longest_chain_starts_first(self):
+        # "e" is declared first but heads a shorter chain than "a"
+        scheduler = DependencyScheduler({"e": [], **GRAPH})
+        finished, _ = self.run_recording(scheduler, max_workers=1)
+        self.assertEqual(finished[0], "a")
+
+    def test_failed_dependency_skips_downstream(self):
+        skipped = []
+        finished, report = self.run_recording(
+            DependencyScheduler(GRAPH), fail={"b"}, on_skip=skipped.append
+        )
+
+        self.assertNotIn("d", finished)
+        self.assertEqual(report.skipped, ["d"])
+        self.assertEqual(skipped, ["d"])
+        self.assertFalse(report.timings["b"].succeeded)
+        # Unrelated branches still run
+        self.assertIn("c", finished)
+        self.assertIn("e", finished)
+
+    def test_exception_counts_as_failure(self):
+        def task(task_id):
+            if task_id == "a":
+                raise RuntimeError("boom")
+            return True
+
+        report = DependencyScheduler(GRAPH).run(task, max_workers=2)
+
+        self.assertEqual(sorted(report.skipped), ["b", "c", "d"])
+        self.assertEqual(set(report.timings), {"a", "e"})
+
+    def test_unknown_dependencies_are_ignored(self):
+        scheduler = DependencyScheduler({"x": ["not_scheduled"], "y": ["x"]})
+        finished, report = self.run_recording(scheduler)
+        self.assertEqual(finished, ["x", "y"])
+        self.assertEqual(report.critical_path, ["x", "y"])
+
+    def test_cycle_raises(self):
+        with self.assertRaises(ValueError):
+            DependencyScheduler({"a": ["b"], "b": ["a"]})
+
+    def test_for_deliverables_expands_all_markdown(self):
+        scheduler = DependencyScheduler.for_deliverables(
+            ["01_tech_inventory", "02_pain_points", "final_strategy_report"]
+        )
+        self.assertEqual(
+            scheduler.dependencies["final_strategy_report"],
+            ["01_tech_inventory", "02_pain_points"],
+        )
+        self.assertEqual(scheduler.order[-1], "final_strategy_report")
+
+if __name__ == "__main__":
+    unittest.main()